@@ -1,11 +1,47 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, NoDecode
 from pydantic import Field, ConfigDict, field_validator
 import os
 from functools import lru_cache
-from typing import List
+from typing import Annotated, Dict, List
 import secrets
 
 
+class InvalidSettingError(Exception):
+    """Raised at startup when a setting cannot be parsed (not a ValueError, so it is never mistaken for a request error)"""
+    pass
+
+
+@lru_cache()
+def parse_section_deadlines(spec: str) -> Dict[str, float]:
+    """
+    Parse TENDER_DETAIL_SECTION_DEADLINES ("core=0.3,documents=1,*=1").
+
+    The setting is validated when Settings is built, and each distinct value
+    is parsed once. Do not mutate the returned dict.
+
+    Returns:
+        Dict[str, float]: Seconds per query name; "*" is the deadline of the other queries
+
+    Raises:
+        InvalidSettingError: If a pair is malformed
+    """
+    deadlines = {}
+    for pair in spec.split(","):
+        if not pair.strip():
+            continue
+        name, separator, seconds = pair.partition("=")
+        try:
+            deadline = float(seconds)
+        except ValueError:
+            deadline = None
+        if not separator or not name.strip() or deadline is None or deadline <= 0:
+            raise InvalidSettingError(
+                f"Invalid TENDER_DETAIL_SECTION_DEADLINES pair '{pair}' (expected name=seconds, seconds > 0)"
+            )
+        deadlines[name.strip()] = deadline
+    return deadlines
+
+
 class Settings(BaseSettings):
     # App settings
     APP_NAME: str = "Gober API"
@@ -24,11 +60,76 @@ class Settings(BaseSettings):
     # Database settings - Amazon Neptune
     NEPTUNE_ENDPOINT: str = os.getenv("NEPTUNE_ENDPOINT", "localhost")
     NEPTUNE_PORT: int = int(os.getenv("NEPTUNE_PORT", "8182"))
+    NEPTUNE_REQUEST_TIMEOUT: float = float(os.getenv("NEPTUNE_REQUEST_TIMEOUT", "30"))
+    # Read replicas ("host" or "host:port", comma-separated) that SPARQL queries are balanced across;
+    # empty uses NEPTUNE_ENDPOINT only
+    # NoDecode: the environment value is a comma-separated list, not JSON (see split_reader_endpoints)
+    NEPTUNE_READER_ENDPOINTS: Annotated[List[str], NoDecode] = [e.strip() for e in os.getenv("NEPTUNE_READER_ENDPOINTS", "").split(",") if e.strip()]
+    NEPTUNE_REPLICA_FAILURE_THRESHOLD: int = int(os.getenv("NEPTUNE_REPLICA_FAILURE_THRESHOLD", "3"))  # Consecutive errors before a replica is skipped
+    NEPTUNE_REPLICA_COOLDOWN: float = float(os.getenv("NEPTUNE_REPLICA_COOLDOWN", "30"))  # Seconds an unhealthy replica is skipped
+    # Hedged requests: a query slower than its NEPTUNE_HEDGE_QUANTILE latency is duplicated to another replica
+    NEPTUNE_HEDGE_MAX_RATE: float = float(os.getenv("NEPTUNE_HEDGE_MAX_RATE", "0.05"))  # Fraction of queries; 0 disables hedging
+    NEPTUNE_HEDGE_QUANTILE: float = float(os.getenv("NEPTUNE_HEDGE_QUANTILE", "0.95"))
+    NEPTUNE_HEDGE_MIN_DELAY: float = float(os.getenv("NEPTUNE_HEDGE_MIN_DELAY", "0.05"))  # Seconds
+    NEPTUNE_HEDGE_MIN_SAMPLES: int = int(os.getenv("NEPTUNE_HEDGE_MIN_SAMPLES", "20"))  # Per query name, before hedging it
+
+    # Neptune HTTP connection pool (shared aiohttp session)
+    NEPTUNE_POOL_SIZE: int = int(os.getenv("NEPTUNE_POOL_SIZE", "100"))  # Total open connections
+    NEPTUNE_POOL_SIZE_PER_HOST: int = int(os.getenv("NEPTUNE_POOL_SIZE_PER_HOST", "50"))  # 0 means no per-host limit
+    NEPTUNE_DNS_CACHE_TTL: int = int(os.getenv("NEPTUNE_DNS_CACHE_TTL", "300"))  # Seconds
+    NEPTUNE_KEEPALIVE_TIMEOUT: float = float(os.getenv("NEPTUNE_KEEPALIVE_TIMEOUT", "30"))  # Seconds an idle connection is kept
+
+
+    # Cache settings
+    CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "")  # Optional shared write-through backend
+    TENDER_DETAIL_CACHE_ENABLED: bool = os.getenv("TENDER_DETAIL_CACHE_ENABLED", "True").lower() == "true"
+    TENDER_DETAIL_CACHE_SIZE: int = int(os.getenv("TENDER_DETAIL_CACHE_SIZE", "2048"))
+    TENDER_DETAIL_CACHE_TTL: int = int(os.getenv("TENDER_DETAIL_CACHE_TTL", "3600"))  # Seconds
+
+    # Tender detail strategy: "fanout" (11 SELECT queries), "construct" (one CONSTRUCT + JSON-LD index)
+    # or "graph" (one CONSTRUCT + rdflib Graph). Compare them with scripts/benchmarks/bench_tender_detail.py
+    TENDER_DETAIL_MODE: str = os.getenv("TENDER_DETAIL_MODE", "fanout").lower()
+    # Build nested tender objects as plain dicts validated once with their root model; DEBUG validates each object
+    TENDER_TRUSTED_MODELS: bool = os.getenv("TENDER_TRUSTED_MODELS", "True").lower() == "true"
+    # Lots and documents inlined in the tender detail (the rest is paged via /detail/{id}/lots and /documents);
+    # 0 (the default) inlines every lot and document. Opt-in: a limit truncates the lots and documents arrays
+    TENDER_DETAIL_INLINE_ITEMS: int = int(os.getenv("TENDER_DETAIL_INLINE_ITEMS", "0"))
+    TENDER_PAGE_MAX_SIZE: int = int(os.getenv("TENDER_PAGE_MAX_SIZE", "100"))  # Largest lots/documents page
+    # Seconds each fan-out detail query may take, as name=seconds pairs ("*" for the other queries; empty
+    # waits for every query). Sections that miss their deadline are returned as missing in "partial"
+    # detail responses. Opt-in: empty by default. Validated at startup (InvalidSettingError)
+    TENDER_DETAIL_SECTION_DEADLINES: str = os.getenv("TENDER_DETAIL_SECTION_DEADLINES", "")
+
+    # Materialized tender count (listing totals)
+    TENDER_COUNT_REFRESH_INTERVAL: float = float(os.getenv("TENDER_COUNT_REFRESH_INTERVAL", "600"))  # Seconds
+    TENDER_COUNT_DEBOUNCE: float = float(os.getenv("TENDER_COUNT_DEBOUNCE", "5"))  # Seconds to wait after an ingestion signal
+
+    # Batch tender detail settings
+    TENDER_BATCH_MAX_IDS: int = int(os.getenv("TENDER_BATCH_MAX_IDS", "300"))
+    TENDER_BATCH_CHUNK_SIZE: int = int(os.getenv("TENDER_BATCH_CHUNK_SIZE", "50"))  # URIs per VALUES block
+    MULTI_SEARCH_MAX_QUERIES: int = int(os.getenv("MULTI_SEARCH_MAX_QUERIES", "10"))  # Searches per POST /tenders/multi
 
 
     # MeiliSearch settings
     MEILISEARCH_HOST: str = os.getenv("MEILISEARCH_HOST", "http://localhost:7700")
     MEILISEARCH_API_KEY: str = os.getenv("MEILISEARCH_API_KEY", "")
+    MEILISEARCH_TIMEOUT: float = float(os.getenv("MEILISEARCH_TIMEOUT", "5"))  # Seconds per request
+    MEILISEARCH_POOL_SIZE: int = int(os.getenv("MEILISEARCH_POOL_SIZE", "20"))  # Keep-alive connections per index client
+    # Search result cache (anonymous /tenders and CPV searches; cleared when documents are added or deleted)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "True").lower() == "true"
+    SEARCH_CACHE_SIZE: int = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "60"))  # Seconds; other workers see ingestions after at most this
+    SEARCH_FILTER_CACHE_SIZE: int = int(os.getenv("SEARCH_FILTER_CACHE_SIZE", "1024"))  # Compiled filter strings kept in memory
+    # Filter "saved tenders only" searches on the saved_by document attribute instead of an id IN list.
+    # Enable once saved_by is filterable and backfilled (scripts/backfill_saved_by.py)
+    SEARCH_SAVED_BY_FILTER: bool = os.getenv("SEARCH_SAVED_BY_FILTER", "False").lower() == "true"
+
+
+    # Circuit breakers (Neptune, MeiliSearch, Azure Blob, Marker, Gemini); an open circuit answers 503
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("CIRCUIT_BREAKER_ENABLED", "True").lower() == "true"
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))  # Consecutive failures that open it
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = float(os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "30"))  # Seconds open before probing
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = int(os.getenv("CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS", "1"))  # Concurrent probe calls
 
 
     # Security settings
@@ -58,6 +159,25 @@ class Settings(BaseSettings):
     # Neptune settings
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
     NEPTUNE_IAM_ROLE_ARN: str = os.getenv("NEPTUNE_IAM_ROLE_ARN", "arn:aws:iam::123456789012:role/NeptuneRole")
+    NEPTUNE_CREDENTIALS_REFRESH_INTERVAL: float = float(os.getenv("NEPTUNE_CREDENTIALS_REFRESH_INTERVAL", "300"))  # Seconds
+    NEPTUNE_SIGNATURE_TTL: float = float(os.getenv("NEPTUNE_SIGNATURE_TTL", "60"))  # Seconds a SigV4 signature is reused
+    NEPTUNE_COALESCE_QUERIES: bool = os.getenv("NEPTUNE_COALESCE_QUERIES", "True").lower() == "true"  # Single-flight identical queries
+    # Adaptive (AIMD) concurrency limit for async Neptune queries; a full queue answers 503
+    NEPTUNE_CONCURRENCY_LIMIT_ENABLED: bool = os.getenv("NEPTUNE_CONCURRENCY_LIMIT_ENABLED", "True").lower() == "true"
+    NEPTUNE_CONCURRENCY_INITIAL: int = int(os.getenv("NEPTUNE_CONCURRENCY_INITIAL", "16"))
+    NEPTUNE_CONCURRENCY_MIN: int = int(os.getenv("NEPTUNE_CONCURRENCY_MIN", "2"))
+    NEPTUNE_CONCURRENCY_MAX: int = int(os.getenv("NEPTUNE_CONCURRENCY_MAX", "64"))
+    NEPTUNE_MAX_QUEUE: int = int(os.getenv("NEPTUNE_MAX_QUEUE", "256"))  # Queries waiting for a slot
+    NEPTUNE_QUEUE_TIMEOUT: float = float(os.getenv("NEPTUNE_QUEUE_TIMEOUT", "5"))  # Seconds a query may wait for a slot
+    NEPTUNE_LATENCY_TARGET: float = float(os.getenv("NEPTUNE_LATENCY_TARGET", "2"))  # Slower queries shrink the limit
+    # Query latency metrics
+    NEPTUNE_SLOW_QUERY_THRESHOLD: float = float(os.getenv("NEPTUNE_SLOW_QUERY_THRESHOLD", "1"))  # Seconds; 0 disables the slow-query log
+    NEPTUNE_EXPLAIN_SAMPLE_RATE: float = float(os.getenv("NEPTUNE_EXPLAIN_SAMPLE_RATE", "0"))  # Fraction of slow queries re-run with explain
+    NEPTUNE_EXPLAIN_MODE: str = os.getenv("NEPTUNE_EXPLAIN_MODE", "dynamic")  # static | dynamic | details
+    # Local SPARQL backend (development and benchmarks, no AWS needed)
+    NEPTUNE_BACKEND: str = os.getenv("NEPTUNE_BACKEND", "neptune")  # neptune | local
+    NEPTUNE_LOCAL_FIXTURE: str = os.getenv("NEPTUNE_LOCAL_FIXTURE", "")  # Turtle/N-Triples file loaded by the local backend
+    NEPTUNE_LOCAL_LATENCY_MS: float = float(os.getenv("NEPTUNE_LOCAL_LATENCY_MS", "0"))  # Simulated round trip per query
 
 
     # AI services API keys
@@ -78,6 +198,19 @@ class Settings(BaseSettings):
     )
 
 
+    @field_validator('NEPTUNE_READER_ENDPOINTS', mode='before')
+    def split_reader_endpoints(cls, v):
+        """Accept the comma-separated form of the environment variable"""
+        if isinstance(v, str):
+            return [e.strip() for e in v.split(",") if e.strip()]
+        return v
+
+    @field_validator('TENDER_DETAIL_SECTION_DEADLINES')
+    def validate_section_deadlines(cls, v):
+        """Fail at startup on a malformed value instead of on every detail request"""
+        parse_section_deadlines(v)
+        return v
+
     @field_validator('ENVIRONMENT', mode='before')
     def set_environment(cls, v):
         """Get environment from ENV variable or use default"""
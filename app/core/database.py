@@ -3,9 +3,14 @@ from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 import logging
 from meilisearch import Client
-from app.core.neptune import NeptuneClient
+from app.core.neptune import NeptuneClient, is_neptune_overload
+from app.core.local_sparql import LocalSparqlBackend
+from app.core.utils.concurrency import AdaptiveConcurrencyLimiter
+from app.core.utils.circuit_breaker import get_circuit_breaker
 from contextlib import asynccontextmanager
 import urllib.parse
+import threading
+from typing import Optional
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -52,30 +57,90 @@ def get_meilisearch_client():
     """
     try:
         api_key = settings.MEILISEARCH_API_KEY if settings.MEILISEARCH_API_KEY != '' else None
-        meilisearch_client = Client(settings.MEILISEARCH_HOST, api_key)
+        meilisearch_client = Client(settings.MEILISEARCH_HOST, api_key, timeout=settings.MEILISEARCH_TIMEOUT)
         return meilisearch_client
     except Exception as e:
         logger.error(f"Error connecting to MeiliSearch: {str(e)}")
         raise
 
 # Neptune connection
+# One client per process: its aiohttp connection pool, resolved AWS credentials
+# and SigV4 signer are reused across requests (opened on startup, closed on shutdown)
+_neptune_client: Optional[NeptuneClient] = None
+_neptune_client_lock = threading.Lock()
+
 def get_neptune_client() -> NeptuneClient:
     """
-    Returns a Neptune client for Amazon Neptune with AWS SigV4 authentication.
+    Returns the Neptune client for Amazon Neptune with AWS SigV4 authentication.
     
     Returns:
         NeptuneClient: Neptune client
     """
-    try:
-        return NeptuneClient(
-            endpoint=settings.NEPTUNE_ENDPOINT,
-            port=settings.NEPTUNE_PORT,
-            region=settings.AWS_REGION,
-            iam_role_arn=settings.NEPTUNE_IAM_ROLE_ARN
-        )
-    except Exception as e:
-        logger.error(f"Error connecting to Neptune: {str(e)}")
-        raise
+    global _neptune_client
+    if _neptune_client is not None:
+        return _neptune_client
+
+    with _neptune_client_lock:
+        if _neptune_client is not None:
+            return _neptune_client
+        try:
+            backend = None
+            if settings.NEPTUNE_BACKEND == "local":
+                logger.info(f"Using local SPARQL backend loaded from {settings.NEPTUNE_LOCAL_FIXTURE}")
+                backend = LocalSparqlBackend.from_file(
+                    settings.NEPTUNE_LOCAL_FIXTURE,
+                    latency=settings.NEPTUNE_LOCAL_LATENCY_MS / 1000
+                )
+
+            _neptune_client = NeptuneClient(
+                endpoint=settings.NEPTUNE_ENDPOINT,
+                port=settings.NEPTUNE_PORT,
+                region=settings.AWS_REGION,
+                iam_role_arn=settings.NEPTUNE_IAM_ROLE_ARN,
+                pool_size=settings.NEPTUNE_POOL_SIZE,
+                pool_size_per_host=settings.NEPTUNE_POOL_SIZE_PER_HOST,
+                dns_cache_ttl=settings.NEPTUNE_DNS_CACHE_TTL,
+                keepalive_timeout=settings.NEPTUNE_KEEPALIVE_TIMEOUT,
+                request_timeout=settings.NEPTUNE_REQUEST_TIMEOUT,
+                credentials_refresh_interval=settings.NEPTUNE_CREDENTIALS_REFRESH_INTERVAL,
+                signature_ttl=settings.NEPTUNE_SIGNATURE_TTL,
+                coalesce_queries=settings.NEPTUNE_COALESCE_QUERIES,
+                concurrency_limiter=AdaptiveConcurrencyLimiter(
+                    name="neptune",
+                    initial_limit=settings.NEPTUNE_CONCURRENCY_INITIAL,
+                    min_limit=settings.NEPTUNE_CONCURRENCY_MIN,
+                    max_limit=settings.NEPTUNE_CONCURRENCY_MAX,
+                    max_queue=settings.NEPTUNE_MAX_QUEUE,
+                    queue_timeout=settings.NEPTUNE_QUEUE_TIMEOUT,
+                    latency_target=settings.NEPTUNE_LATENCY_TARGET,
+                    is_overload=is_neptune_overload
+                ) if settings.NEPTUNE_CONCURRENCY_LIMIT_ENABLED else None,
+                slow_query_threshold=settings.NEPTUNE_SLOW_QUERY_THRESHOLD,
+                explain_sample_rate=settings.NEPTUNE_EXPLAIN_SAMPLE_RATE,
+                explain_mode=settings.NEPTUNE_EXPLAIN_MODE,
+                backend=backend,
+                reader_endpoints=settings.NEPTUNE_READER_ENDPOINTS,
+                replica_failure_threshold=settings.NEPTUNE_REPLICA_FAILURE_THRESHOLD,
+                replica_cooldown=settings.NEPTUNE_REPLICA_COOLDOWN,
+                hedge_max_rate=settings.NEPTUNE_HEDGE_MAX_RATE,
+                hedge_quantile=settings.NEPTUNE_HEDGE_QUANTILE,
+                hedge_min_delay=settings.NEPTUNE_HEDGE_MIN_DELAY,
+                hedge_min_samples=settings.NEPTUNE_HEDGE_MIN_SAMPLES,
+                circuit_breaker=get_circuit_breaker("neptune", is_failure=is_neptune_overload)
+            )
+            return _neptune_client
+        except Exception as e:
+            logger.error(f"Error connecting to Neptune: {str(e)}")
+            raise
+
+async def close_neptune_client():
+    """
+    Closes the Neptune client connection pool (called on application shutdown)
+    """
+    global _neptune_client
+    if _neptune_client is not None:
+        await _neptune_client.close()
+        _neptune_client = None
 
 # Keep the original function for FastAPI dependencies
 def get_db():
@@ -1,23 +1,84 @@
 import boto3
 import json
+import orjson
 import requests
 import logging
+import threading
+import time
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from botocore.credentials import RefreshableCredentials
 from typing import Dict, Any, Optional, List, Tuple
 import aiohttp
 import asyncio
+import hashlib
+import random
+import re
+from contextlib import nullcontext
+from app.core.utils.query_metrics import QueryMetrics
+from app.core.local_sparql import LocalSparqlBackend
+from app.core.utils.concurrency import AdaptiveConcurrencyLimiter, ServiceUnavailableError
+from app.core.utils.replicas import HedgeBudget, Replica, ReplicaPool
+from app.core.utils.circuit_breaker import CircuitBreaker
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# HTTP statuses Neptune uses for throttling, overload and query timeouts
+OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_neptune_overload(error: BaseException) -> bool:
+    """Tell whether a failed query signals Neptune overload (as opposed to e.g. a malformed query)."""
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ServerTimeoutError, aiohttp.ClientConnectionError,
+                          requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in OVERLOAD_STATUSES
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in OVERLOAD_STATUSES
+    return False
+
+# First query form keyword (after the PREFIX declarations)
+_QUERY_FORM = re.compile(r'\b(SELECT|CONSTRUCT|DESCRIBE|ASK)\b', re.IGNORECASE)
+
+# Double- or single-quoted SPARQL string literals (kept verbatim when fingerprinting)
+_STRING_LITERAL = re.compile(r'("(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')')
+
 class NeptuneClient:
     """
     Client for Amazon Neptune that supports both Gremlin and REST API access
     with AWS SigV4 authentication.
     """
     
-    def __init__(self, endpoint: str, port: int, region: str, iam_role_arn: Optional[str] = None):
+    def __init__(
+        self,
+        endpoint: str,
+        port: int,
+        region: str,
+        iam_role_arn: Optional[str] = None,
+        pool_size: int = 100,
+        pool_size_per_host: int = 50,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30,
+        request_timeout: float = 30,
+        credentials_refresh_interval: float = 300,
+        signature_ttl: float = 60,
+        coalesce_queries: bool = True,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        slow_query_threshold: float = 1.0,
+        explain_sample_rate: float = 0.0,
+        explain_mode: str = "dynamic",
+        backend: Optional[LocalSparqlBackend] = None,
+        reader_endpoints: Optional[List[str]] = None,
+        replica_failure_threshold: int = 3,
+        replica_cooldown: float = 30.0,
+        hedge_max_rate: float = 0.0,
+        hedge_quantile: float = 0.95,
+        hedge_min_delay: float = 0.05,
+        hedge_min_samples: int = 20,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """
         Initialize the Neptune client.
         
@@ -26,18 +87,179 @@ class NeptuneClient:
             port (int): Neptune port
             region (str): AWS region
             iam_role_arn (str, optional): IAM role ARN for Neptune access
+            pool_size (int): Maximum number of open connections in the shared pool
+            pool_size_per_host (int): Maximum connections per host (0 for no limit)
+            dns_cache_ttl (int): Seconds to cache DNS lookups
+            keepalive_timeout (float): Seconds an idle keep-alive connection stays open
+            request_timeout (float): Total timeout in seconds for a single query
+            credentials_refresh_interval (float): Seconds between background credential refresh checks
+            signature_ttl (float): Seconds a SigV4 signature is reused (must stay below the 5 minute AWS clock skew)
+            coalesce_queries (bool): Share one upstream request between concurrent identical async queries
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Bounds concurrent async queries;
+                when its queue is full queries fail fast with ServiceUnavailableError
+            slow_query_threshold (float): Seconds above which a query goes to the slow-query log (0 disables it)
+            explain_sample_rate (float): Fraction of slow async queries re-run with Neptune explain (0 disables it)
+            explain_mode (str): Neptune SPARQL explain mode (static, dynamic or details)
+            backend (LocalSparqlBackend, optional): Answer queries from a local graph instead of
+                Neptune (coalescing, limiter and metrics still apply)
+            reader_endpoints (List[str], optional): Read replicas ("host" or "host:port") that
+                SPARQL queries are balanced across (defaults to `endpoint`)
+            replica_failure_threshold (int): Consecutive overload errors that take a replica out of rotation
+            replica_cooldown (float): Seconds an unhealthy replica stays out of rotation
+            hedge_max_rate (float): Highest fraction of async queries that may be hedged (0 disables hedging)
+            hedge_quantile (float): Latency quantile of a query name after which a hedge is sent
+            hedge_min_delay (float): Lowest hedge delay in seconds
+            hedge_min_samples (int): Samples of a query name needed before it is hedged
+            circuit_breaker (CircuitBreaker, optional): Fails queries fast with CircuitOpenError
+                while Neptune keeps failing, instead of queuing them for the limiter
         """
         self.endpoint = endpoint
         self.port = port
         self.region = region
         self.iam_role_arn = iam_role_arn
+        self.backend = backend
+
+        # Resolve the credential provider chain once per process. Temporary
+        # credentials (instance role, assumed role) are refreshed in the
+        # background by _credentials_refresher before they expire.
         self.session = boto3.Session()
         self.credentials = self.session.get_credentials()
+        self.credentials_refresh_interval = credentials_refresh_interval
+        self.signature_ttl = signature_ttl
+        self._frozen_credentials = None
+        self._signer: Optional[SigV4Auth] = None
+        # (method, endpoint path, base URL) -> (expiry, signed headers)
+        self._signed_headers_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, str]]] = {}
+        self._signing_lock = threading.Lock()
+        self._credentials_task: Optional[asyncio.Task] = None
+        if backend is None:
+            self._refresh_credentials()
+
+        # Connection pool settings for the shared aiohttp session
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.request_timeout = request_timeout
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Single-flight: concurrent identical queries await the same upstream request
+        self.coalesce_queries = coalesce_queries
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._query_stats = {"upstream": 0, "coalesced": 0, "deadline_missed": 0}
+
+        # Backpressure: bounded, adaptive number of concurrent upstream queries
+        self.concurrency_limiter = concurrency_limiter
+        self.circuit_breaker = circuit_breaker
+
+        # Latency histograms per query name, slow-query log and sampled explain
+        self.query_metrics = QueryMetrics(slow_query_threshold=slow_query_threshold)
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_mode = explain_mode
+        self._explain_task: Optional[asyncio.Task] = None
         
         # Base URLs
         self.http_url = f"https://{endpoint}:{port}"
+
+        # Read replicas: health-aware load balancing and hedged requests
+        self.replicas = ReplicaPool(
+            [self._endpoint_url(reader) for reader in reader_endpoints or [endpoint]],
+            failure_threshold=replica_failure_threshold,
+            cooldown=replica_cooldown
+        )
+        self.hedge_budget = HedgeBudget(hedge_max_rate)
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+
+    def _circuit(self):
+        """Context guarding one query with the circuit breaker, if one is configured."""
+        return self.circuit_breaker.protect() if self.circuit_breaker is not None else nullcontext()
+
+    def _endpoint_url(self, endpoint: str) -> str:
+        """Base URL of an endpoint given as "host" or "host:port"."""
+        return f"https://{endpoint}" if ":" in endpoint else f"https://{endpoint}:{self.port}"
+
+    async def start(self) -> None:
+        """
+        Open the shared aiohttp session used by the async query methods.
+
+        The session keeps a bounded pool of keep-alive connections so that
+        consecutive queries reuse the same TCP/TLS connections instead of
+        performing a new handshake each time. Safe to call more than once.
+        """
+        if self._credentials_task is None and isinstance(self.credentials, RefreshableCredentials):
+            self._credentials_task = asyncio.create_task(self._credentials_refresher())
+
+        if self._http_session is not None and not self._http_session.closed:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+            ssl=False  # Disable SSL certificate verification (same as the sync client)
+        )
+        self._http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+        )
+        logger.info(
+            f"Neptune connection pool opened (limit={self.pool_size}, "
+            f"limit_per_host={self.pool_size_per_host}, dns_ttl={self.dns_cache_ttl}s)"
+        )
+
+    async def close(self) -> None:
+        """Close the shared aiohttp session and release pooled connections."""
+        if self._credentials_task is not None:
+            self._credentials_task.cancel()
+            self._credentials_task = None
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+            logger.info("Neptune connection pool closed")
+        self._http_session = None
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it lazily if startup did not."""
+        if self._http_session is None or self._http_session.closed:
+            await self.start()
+        return self._http_session
     
-    def _create_signed_request(self, method: str, endpoint_path: str, data: Optional[Dict] = None) -> requests.Request:
+    def _refresh_credentials(self) -> None:
+        """
+        Take a frozen snapshot of the current credentials and rebuild the signer.
+
+        get_frozen_credentials() refreshes temporary credentials when botocore
+        considers them close to expiry, which may perform a blocking STS/IMDS
+        call, so this must not run on the event loop.
+        """
+        if self.credentials is None:
+            logger.warning("No AWS credentials found for Neptune; requests will fail to sign")
+            return
+
+        frozen = self.credentials.get_frozen_credentials()
+        with self._signing_lock:
+            if frozen != self._frozen_credentials:
+                self._frozen_credentials = frozen
+                self._signer = SigV4Auth(frozen, 'neptune-db', self.region)
+                self._signed_headers_cache.clear()
+
+    async def _credentials_refresher(self) -> None:
+        """Background task that keeps the frozen credentials fresh."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.credentials_refresh_interval)
+            try:
+                await loop.run_in_executor(None, self._refresh_credentials)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error refreshing Neptune credentials: {str(e)}")
+
+    def _create_signed_request(
+        self, method: str, endpoint_path: str, data: Optional[Dict] = None, base_url: Optional[str] = None
+    ) -> requests.Request:
         """
         Create a signed request for Neptune REST API.
         
@@ -45,11 +267,12 @@ class NeptuneClient:
             method (str): HTTP method (GET, POST, etc.)
             endpoint_path (str): API endpoint path
             data (Dict, optional): Request data
+            base_url (str, optional): Replica to sign for (the host is part of the signature)
             
         Returns:
             requests.Request: Signed request
         """
-        url = f"{self.http_url}/{endpoint_path}"
+        url = f"{base_url or self.http_url}/{endpoint_path}"
         
         headers = {
             'Content-Type': 'application/json'
@@ -63,26 +286,78 @@ class NeptuneClient:
             headers=headers
         )
         
-        # Sign the request with SigV4
-        SigV4Auth(self.credentials, 'neptune-db', self.region).add_auth(request)
+        # Sign the request with SigV4 using the cached signer
+        signer = self._signer or SigV4Auth(self.credentials, 'neptune-db', self.region)
+        signer.add_auth(request)
         prepared_request = request.prepare()
         
         return prepared_request
+
+    def _get_signed_headers(self, method: str, endpoint_path: str, base_url: Optional[str] = None) -> Dict[str, str]:
+        """
+        Return SigV4 headers for a request, reusing a recent signature.
+
+        Requests are signed without the query body, so the headers signed for
+        a method, path and host can be reused for any query until signature_ttl
+        expires or the credentials are refreshed.
+
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            endpoint_path (str): API endpoint path
+            base_url (str, optional): Replica the request goes to (defaults to the main endpoint)
+
+        Returns:
+            Dict[str, str]: Signed headers (without Content-Length)
+        """
+        base_url = base_url or self.http_url
+        key = (method, endpoint_path, base_url)
+        now = time.monotonic()
+        with self._signing_lock:
+            cached = self._signed_headers_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+
+        prepared_request = self._create_signed_request(method, endpoint_path, base_url=base_url)
+        headers = {k: v for k, v in dict(prepared_request.headers).items() if k.lower() != 'content-length'}
+        with self._signing_lock:
+            self._signed_headers_cache[key] = (now + self.signature_ttl, headers)
+        return headers
+
+    async def _get_signed_headers_async(self, method: str, endpoint_path: str, base_url: Optional[str] = None) -> Dict[str, str]:
+        """Async variant of _get_signed_headers that signs in a worker thread when needed."""
+        cached = self._signed_headers_cache.get((method, endpoint_path, base_url or self.http_url))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._get_signed_headers, method, endpoint_path, base_url)
     
-    def execute_sparql_query(self, query: str) -> Dict:
+    def execute_sparql_query(self, query: str, query_name: Optional[str] = None) -> Dict:
         """
         Execute a SPARQL query against Neptune.
         
         Args:
             query (str): SPARQL query to execute
+            query_name (str, optional): Name used in latency metrics (defaults to a fingerprint)
             
         Returns:
             Dict: Query results
         """
+        query_name = query_name or self._adhoc_query_name(query)
+        if self.backend is not None:
+            return self._query_backend(query, query_name)
+        with self._circuit():
+            return self._post_sparql_query_sync(query, query_name)
+
+    def _post_sparql_query_sync(self, query: str, query_name: str) -> Dict:
         sparql_path = "sparql"
+
+        started = time.perf_counter()
+        response_size = 0
+        error = None
+        replica = self.replicas.acquire()
         
-        # Create a signed request
-        prepared_request = self._create_signed_request('POST', sparql_path)
+        # Get the signed headers
+        signed_headers = self._get_signed_headers('POST', sparql_path, replica.url)
         
         # Determine the appropriate Accept header based on query type
         # CONSTRUCT and DESCRIBE queries return RDF data, while SELECT and ASK return result sets
@@ -93,16 +368,17 @@ class NeptuneClient:
         try:
             # Send the signed request
             response = requests.post(
-                f"{self.http_url}/{sparql_path}",
+                f"{replica.url}/{sparql_path}",
                 data=query,
                 headers={
-                    **dict(prepared_request.headers),
+                    **signed_headers,
                     'Content-Type': 'application/sparql-query',
                     'Accept': accept_header  # Request JSON response
                 },
-                timeout=30,
+                timeout=self.request_timeout,
                 verify=False  # Disable SSL certificate verification
             )
+            response_size = len(response.content)
             
             if response.status_code != 200:
                 logger.warning(f"NEPTUNE DIAGNOSTIC: Error response: {response.text[:200]}")
@@ -110,10 +386,10 @@ class NeptuneClient:
             response.raise_for_status()
             
             # Only try to parse JSON if there's content
-            if response.text.strip():
+            if response.content.strip():
                 try:
-                    return response.json()
-                except json.JSONDecodeError:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     logger.warning(f"Received non-JSON response despite requesting JSON format. Content-Type: {response.headers.get('Content-Type')}")
                     # Return the raw text and headers so services.py can handle it
                     return {
@@ -125,65 +401,272 @@ class NeptuneClient:
                 logger.warning("Empty response received from Neptune")
                 return {}
         except Exception as e:
-            raise 
+            error = e
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.replicas.release(
+                replica,
+                duration if error is None else None,
+                error is not None and is_neptune_overload(error)
+            )
+            self.query_metrics.observe(query_name, duration, query, response_size, error)
         
 
-    async def execute_sparql_query_async(self, query: str) -> Dict:
+    @staticmethod
+    def _query_fingerprint(query: str) -> str:
+        """
+        Fingerprint a query for single-flight coalescing.
+
+        Whitespace is normalized outside string literals, so the same query
+        built with different indentation maps to the same key.
+        """
+        parts = _STRING_LITERAL.split(query)
+        normalized = "".join(
+            part if i % 2 else " ".join(part.split())
+            for i, part in enumerate(parts)
+        )
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _adhoc_query_name(cls, query: str) -> str:
+        """Metrics name for a query without an explicit name: query form + short fingerprint."""
+        match = _QUERY_FORM.search(query)
+        form = match.group(1).lower() if match else "query"
+        return f"{form}:{cls._query_fingerprint(query)[:12]}"
+
+    def stats(self) -> Dict[str, Any]:
+        """Return query counters, the concurrency limiter state and per-query latency histograms."""
+        stats = {**self._query_stats, "inflight": len(self._inflight)}
+        stats["replicas"] = self.replicas.stats()
+        stats["hedging"] = self.hedge_budget.stats()
+        if self.concurrency_limiter is not None:
+            stats["limiter"] = self.concurrency_limiter.stats()
+        if self.circuit_breaker is not None:
+            stats["circuit"] = self.circuit_breaker.stats()
+        if self.backend is not None:
+            stats["backend"] = self.backend.stats()
+        stats["queries"] = self.query_metrics.stats()
+        return stats
+
+    async def execute_sparql_query_async(self, query: str, query_name: Optional[str] = None) -> Dict:
+        """
+        Execute a SPARQL query against Neptune using the shared aiohttp session.
+
+        Concurrent callers of an identical query (same fingerprint) await a
+        single upstream request and receive the same parsed result, which
+        must therefore be treated as read-only.
+
+        Args:
+            query (str): SPARQL query to execute
+            query_name (str, optional): Name used in latency metrics (defaults to a fingerprint)
+
+        Returns:
+            Dict: Query results
+        """
+        query_name = query_name or self._adhoc_query_name(query)
+
+        if not self.coalesce_queries:
+            self._query_stats["upstream"] += 1
+            return await self._execute_sparql_query_upstream(query, query_name)
+
+        key = self._query_fingerprint(query)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._execute_sparql_query_upstream(query, query_name))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f, key=key: self._release_inflight(key, f))
+            self._query_stats["upstream"] += 1
+        else:
+            self._query_stats["coalesced"] += 1
+
+        # Shield the shared request so one caller being cancelled does not cancel it for the others
+        return await asyncio.shield(future)
+
+    def _release_inflight(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def _execute_sparql_query_upstream(self, query: str, query_name: str) -> Dict:
+        """
+        Send a query to Neptune, holding a concurrency limiter slot if one is configured.
+
+        The circuit breaker is checked first, so while the circuit is open
+        queries fail fast without waiting in the limiter queue.
+        """
+        with self._circuit():
+            if self.concurrency_limiter is None:
+                return await self._post_sparql_query(query, query_name)
+            async with self.concurrency_limiter.slot():
+                return await self._post_sparql_query(query, query_name)
+
+    def _query_backend(self, query: str, query_name: str) -> Dict:
+        """Answer a query from the local backend, recording it in the query metrics."""
+        started = time.perf_counter()
+        error = None
+        try:
+            return self.backend.query(query)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.query_metrics.observe(query_name, time.perf_counter() - started, query, 0, error)
+
+    async def _post_sparql_query(self, query: str, query_name: str) -> Dict:
+        if self.backend is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._query_backend, query, query_name)
+
+        started = time.perf_counter()
+        response_size = 0
+        error = None
+        try:
+            body, response_headers = await self._post_hedged(query, query_name)
+            response_size = len(body)
+
+            if body.strip():
+                try:
+                    return orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    logger.warning("Received non-JSON response despite requesting JSON format")
+                    return {
+                        "raw_text": body.decode('utf-8', 'replace'),
+                        "headers": response_headers,
+                        "status_code": 200
+                    }
+            else:
+                logger.warning("Empty response received from Neptune")
+                return {}
+        except Exception as e:
+            error = e
+            logger.error(f"Error in execute_sparql_query_async: {str(e)}")
+            raise
+        finally:
+            slow = self.query_metrics.observe(query_name, time.perf_counter() - started, query, response_size, error)
+            if slow:
+                self._maybe_explain(query_name, query)
+
+    def _hedge_delay(self, query_name: str) -> Optional[float]:
+        """Seconds after which a query is hedged: its hedge_quantile latency, or None when it is not hedged."""
+        if len(self.replicas) < 2 or self.hedge_budget.max_rate <= 0:
+            return None
+        latency = self.query_metrics.percentile(query_name, self.hedge_quantile, self.hedge_min_samples)
+        if latency is None:
+            return None
+        return max(latency, self.hedge_min_delay)
+
+    async def _post_hedged(self, query: str, query_name: str) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Send a query to a replica and, if it has not answered after the hedge
+        delay, send a duplicate to another replica and take the first answer.
+
+        Hedges are capped by the hedge budget; the slower request is cancelled.
+        """
+        self.hedge_budget.record_request()
+        primary_replica = self.replicas.acquire()
+        primary = asyncio.ensure_future(self._post_to_replica(primary_replica, query))
+        delay = self._hedge_delay(query_name)
+        if delay is None:
+            return await primary
+
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.hedge_budget.try_spend():
+                return await primary
+
+            hedge = asyncio.ensure_future(self._post_to_replica(self.replicas.acquire(exclude=primary_replica), query))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_budget.record_win()
+                        return task.result()
+            # Both requests failed: report the primary error
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _post_to_replica(self, replica: Replica, query: str) -> Tuple[bytes, Dict[str, str]]:
+        """Send one query to one replica, recording its latency and health in the replica pool."""
         sparql_path = "sparql"
-        
-        # Crear la solicitud firmada
-        prepared_request = self._create_signed_request('POST', sparql_path)
-        
-        # Determinar el header Accept según el tipo de query
-        accept_header = "application/sparql-results+json"
-        if "CONSTRUCT" in query.upper() or "DESCRIBE" in query.upper():
-            accept_header = "application/ld+json"
-        
-        # Quitar 'Content-Length' de los headers firmados para que aiohttp lo calcule correctamente
-        headers = {k: v for k, v in dict(prepared_request.headers).items() if k.lower() != 'content-length'}
-        headers.update({
-            'Content-Type': 'application/sparql-query',
-            'Accept': accept_header
-        })
-        
-        url = f"{self.http_url}/{sparql_path}"
-        
-        payload_bytes = query.encode("utf-8")
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    url,
-                    data=payload_bytes,
-                    headers=headers,
-                    ssl=False,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:                    
-                    # Leer el texto de la respuesta para depuración
-                    resp_text = await response.text()
-                    
-                    if response.status != 200:
-                        logger.warning(f"NEPTUNE DIAGNOSTIC: Error response in async query {query[:200]}: {resp_text}\n")
-                    
-                    response.raise_for_status()
-                    
-                    if resp_text.strip():
-                        try:
-                            json_data = await response.json()
-                            return json_data
-                        except aiohttp.ContentTypeError:
-                            logger.warning("Received non-JSON response despite requesting JSON format")
-                            return {
-                                "raw_text": resp_text,
-                                "headers": dict(response.headers),
-                                "status_code": response.status
-                            }
-                    else:
-                        logger.warning("Empty response received from Neptune")
-                        return {}
-            except Exception as e:
-                logger.error(f"Error in execute_sparql_query_async: {str(e)}")
-                raise
+        started = time.perf_counter()
+        duration = None
+        failed = False
+        try:
+            # Obtener las cabeceras firmadas (firmando fuera del event loop si hace falta)
+            signed_headers = await self._get_signed_headers_async('POST', sparql_path, replica.url)
+
+            # Determinar el header Accept según el tipo de query
+            accept_header = "application/sparql-results+json"
+            if "CONSTRUCT" in query.upper() or "DESCRIBE" in query.upper():
+                accept_header = "application/ld+json"
+
+            # Los headers firmados ya no incluyen 'Content-Length' para que aiohttp lo calcule correctamente
+            headers = dict(signed_headers)
+            headers.update({
+                'Content-Type': 'application/sparql-query',
+                'Accept': accept_header
+            })
+
+            session = await self._get_http_session()
+            async with session.post(
+                f"{replica.url}/{sparql_path}",
+                data=query.encode("utf-8"),
+                headers=headers,
+                ssl=False
+            ) as response:
+                # Leer el cuerpo como bytes: orjson lo decodifica sin pasar por str
+                body = await response.read()
+
+                if response.status != 200:
+                    logger.warning(f"NEPTUNE DIAGNOSTIC: Error response in async query {query[:200]} from {replica.url}: {body.decode('utf-8', 'replace')}\n")
+
+                response.raise_for_status()
+                duration = time.perf_counter() - started
+                return body, dict(response.headers)
+        except Exception as e:
+            failed = is_neptune_overload(e)
+            raise
+        finally:
+            self.replicas.release(replica, duration, failed)
+
+    def _maybe_explain(self, query_name: str, query: str) -> None:
+        """Re-run a sampled slow query with Neptune explain in the background (one at a time)."""
+        if self.explain_sample_rate <= 0 or random.random() >= self.explain_sample_rate:
+            return
+        if self._explain_task is not None and not self._explain_task.done():
+            return
+        self._explain_task = asyncio.ensure_future(self._explain_query(query_name, query))
+
+    async def _explain_query(self, query_name: str, query: str) -> None:
+        """Fetch Neptune's explain output for a query and attach it to its slow-log entry."""
+        try:
+            signed_headers = await self._get_signed_headers_async('POST', 'sparql')
+            headers = {
+                **signed_headers,
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Accept': 'text/plain'
+            }
+            session = await self._get_http_session()
+            async with session.post(
+                f"{self.http_url}/sparql",
+                data={"query": query, "explain": self.explain_mode},
+                headers=headers,
+                ssl=False
+            ) as response:
+                explain = await response.text()
+                response.raise_for_status()
+            self.query_metrics.attach_explain(query_name, query, explain)
+        except Exception as e:
+            logger.warning(f"Could not explain slow query '{query_name}': {str(e)}")
         
     # Add this method to execute multiple queries in parallel
     async def execute_sparql_queries_parallel(self, queries: List[str]) -> List[Dict]:
@@ -197,25 +680,61 @@ class NeptuneClient:
             List[Dict]: List of query results in the same order as queries
         """
         tasks = [self.execute_sparql_query_async(query) for query in queries]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Overload must reach the caller (503), not be returned as a partial result
+        for result in results:
+            if isinstance(result, ServiceUnavailableError):
+                raise result
+        return results
 
     # Add this method for named queries (useful when you need to track which result is which)
-    async def execute_named_sparql_queries_parallel(self, named_queries: List[Tuple[str, str]]) -> Dict[str, Dict]:
+    async def execute_named_sparql_queries_parallel(
+        self,
+        named_queries: List[Tuple[str, str]],
+        deadlines: Optional[Dict[str, float]] = None,
+        default_deadline: Optional[float] = None
+    ) -> Dict[str, Dict]:
         """
         Execute multiple named SPARQL queries in parallel.
         
+        Queries that fail or miss their deadline are left out of the result,
+        so callers can tell which sections are missing.
+
         Args:
             named_queries (List[Tuple[str, str]]): List of (name, query) tuples
+            deadlines (Dict[str, float], optional): Seconds each named query may take
+            default_deadline (float, optional): Deadline of the queries not in `deadlines`
             
         Returns:
             Dict[str, Dict]: Dictionary mapping query names to results
         """
+        deadlines = deadlines or {}
+
         async def execute_named_query(name, query):
-            result = await self.execute_sparql_query_async(query)
+            deadline = deadlines.get(name, default_deadline)
+            if not deadline:
+                return name, await self.execute_sparql_query_async(query, query_name=name)
+            try:
+                # Coalesced requests are shielded, so giving up here does not cancel them for other callers
+                result = await asyncio.wait_for(self.execute_sparql_query_async(query, query_name=name), timeout=deadline)
+            except asyncio.TimeoutError:
+                self._query_stats["deadline_missed"] += 1
+                raise asyncio.TimeoutError(f"missed its {deadline}s deadline")
             return name, result
         
         tasks = [execute_named_query(name, query) for name, query in named_queries]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+
+        named_results = {}
+        for (name, _), result in zip(named_queries, results):
+            if isinstance(result, ServiceUnavailableError):
+                # Overload must reach the caller (503), not be returned as a partial result
+                raise result
+            if isinstance(result, Exception):
+                logger.error(f"Named query '{name}' failed: {str(result)}")
+                continue
+            named_results[name] = result[1]
+
         # Convert list of (name, result) tuples to dictionary
-        return {name: result for name, result in results if not isinstance(result, Exception)}
\ No newline at end of file
+        return named_results
\ No newline at end of file
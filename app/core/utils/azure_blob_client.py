@@ -2,8 +2,22 @@ import os
 import logging
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.core.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
 from azure.storage.blob import BlobServiceClient, BlobClient, ContainerClient, generate_blob_sas, BlobSasPermissions
 
+# HTTP statuses Azure Storage answers when it is throttling or unavailable
+OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_blob_storage_failure(error: BaseException) -> bool:
+    """Tell whether a storage error means the service is unavailable (as opposed to e.g. a missing blob)."""
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+    if isinstance(error, HttpResponseError):
+        return error.status_code in OVERLOAD_STATUSES
+    return False
+
 
 class AzureBlobStorageClient:
     """Client for Azure Blob Storage operations."""
@@ -18,6 +32,7 @@ class AzureBlobStorageClient:
 
         self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
         self.container_client = self.blob_service_client.get_container_client(self.container_name)
+        self.circuit_breaker = get_circuit_breaker("azure_blob", is_failure=is_blob_storage_failure)
 
         logging.info(f"Azure Blob Storage client initialized with container: {self.container_name}")
 
@@ -41,13 +56,15 @@ class AzureBlobStorageClient:
             blob_client = self.container_client.get_blob_client(blob_path)
 
             # Upload the file
-            with open(file_path, "rb") as data:
+            with open(file_path, "rb") as data, self.circuit_breaker.protect():
                 blob_client.upload_blob(data, overwrite=True)
 
             logging.info(f"File {file_path} uploaded to {blob_path}")
 
             return blob_path #blob_client.url
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to upload document to blob: {blob_path}. Error: {str(e)}"
             logging.error(error_msg)
@@ -69,12 +86,15 @@ class AzureBlobStorageClient:
             blob_client = self.container_client.get_blob_client(blob_path)
 
             # Upload the bytes data
-            blob_client.upload_blob(data, overwrite=True)
+            with self.circuit_breaker.protect():
+                blob_client.upload_blob(data, overwrite=True)
 
             logging.info(f"Bytes data uploaded to {blob_path}")
 
             return blob_client.url
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to upload bytes to blob: {blob_path}. Error: {str(e)}"
             logging.error(error_msg)
@@ -96,12 +116,15 @@ class AzureBlobStorageClient:
             blob_client = self.container_client.get_blob_client(blob_path)
 
             # Upload the text data
-            blob_client.upload_blob(text.encode('utf-8'), overwrite=True)
+            with self.circuit_breaker.protect():
+                blob_client.upload_blob(text.encode('utf-8'), overwrite=True)
 
             logging.info(f"Text data uploaded to {blob_path}")
 
             return blob_path
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to upload text to blob: {blob_path}. Error: {str(e)}"
             logging.error(error_msg)
@@ -181,20 +204,22 @@ class AzureBlobStorageClient:
             blob_client = self.container_client.get_blob_client(blob_path)
 
             # Download the blob
-            downloaded_blob = blob_client.download_blob()
+            with self.circuit_breaker.protect():
+                content = blob_client.download_blob().readall()
 
             if file_path:
                 # Save to file if file_path is provided
                 with open(file_path, "wb") as file:
-                    file.write(downloaded_blob.readall())
+                    file.write(content)
                 logging.info(f"Blob {blob_path} downloaded to {file_path}")
                 return file_path
             else:
                 # Return content as bytes if file_path is not provided
-                content = downloaded_blob.readall()
                 logging.info(f"Blob {blob_path} downloaded as bytes")
                 return content
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to download document from blob: {blob_path}. Error: {str(e)}"
             logging.error(error_msg)
@@ -215,12 +240,15 @@ class AzureBlobStorageClient:
             blob_client = self.container_client.get_blob_client(blob_path)
 
             # Delete the blob
-            blob_client.delete_blob()
+            with self.circuit_breaker.protect():
+                blob_client.delete_blob()
 
             logging.info(f"Blob {blob_path} deleted")
 
             return True
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to delete document from blob: {blob_path}. Error: {str(e)}"
             logging.error(error_msg)
@@ -237,14 +265,17 @@ class AzureBlobStorageClient:
             list: List of blob names
         """
         try:
-            # List blobs in the container
-            blobs = self.container_client.list_blobs(name_starts_with=prefix)
+            # List blobs in the container (the listing is paged lazily while iterating)
+            with self.circuit_breaker.protect():
+                blobs = self.container_client.list_blobs(name_starts_with=prefix)
 
-            # Extract blob names
-            blob_names = [blob.name for blob in blobs]
+                # Extract blob names
+                blob_names = [blob.name for blob in blobs]
 
             return blob_names
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             error_msg = f"Failed to list documents in container. Error: {str(e)}"
             logging.error(error_msg)
@@ -0,0 +1,216 @@
+"""
+In-process result caches with a size bound, TTL and LRU eviction.
+
+A ResultCache can optionally write through to a shared backend (for
+example Redis) so that several API workers see the same entries. The
+in-process layer is always consulted first; the backend is only used on
+a local miss and for invalidation.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from cachetools import TTLCache
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Every cache registers itself here so its counters can be exposed in /metrics
+_registry: Dict[str, "ResultCache"] = {}
+
+
+class CacheBackend:
+    """
+    Interface for a shared cache backend used as a write-through store.
+
+    Backends store raw bytes; serialization is done by the ResultCache.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache backend on top of Redis (requires the optional `redis` package)."""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("The 'redis' package is required for RedisCacheBackend") from e
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(key, value, ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+
+class ResultCache:
+    """
+    Thread-safe TTL + LRU cache with hit/miss counters.
+
+    Values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: int,
+        backend: Optional[CacheBackend] = None,
+        serializer: Optional[Callable[[Any], bytes]] = None,
+        deserializer: Optional[Callable[[bytes], Any]] = None,
+        enabled: bool = True,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            name (str): Cache name, used as backend key prefix and in metrics
+            maxsize (int): Maximum number of entries kept in memory
+            ttl (int): Seconds an entry stays valid
+            backend (CacheBackend, optional): Shared backend to write through to
+            serializer (Callable, optional): Converts a value to bytes for the backend
+            deserializer (Callable, optional): Converts backend bytes back to a value
+            enabled (bool): When False every lookup is a miss and nothing is stored
+            timer (Callable): Clock used for expiry (overridable in tests)
+        """
+        if backend is not None and (serializer is None or deserializer is None):
+            raise ValueError("A serializer and deserializer are required when using a cache backend")
+
+        self.name = name
+        self.ttl = ttl
+        self.enabled = enabled
+        self.backend = backend
+        self.serializer = serializer
+        self.deserializer = deserializer
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl, timer=timer)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "backend_hits": 0, "invalidations": 0, "backend_errors": 0}
+
+        _registry[name] = self
+
+    def _backend_key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None on a miss.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Any]: Cached value or None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._counters["hits"] += 1
+                return value
+
+        if self.backend is not None:
+            try:
+                raw = self.backend.get(self._backend_key(key))
+                if raw is not None:
+                    value = self.deserializer(raw)
+                    with self._lock:
+                        self._cache[key] = value
+                        self._counters["backend_hits"] += 1
+                        self._counters["hits"] += 1
+                    return value
+            except Exception as e:
+                logger.warning(f"Cache '{self.name}' backend read failed for {key}: {str(e)}")
+                self._count("backend_errors")
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in memory and, if configured, in the shared backend.
+
+        Args:
+            key (str): Cache key
+            value (Any): Value to store (None is not cached)
+        """
+        if not self.enabled or value is None:
+            return
+
+        with self._lock:
+            self._cache[key] = value
+
+        if self.backend is not None:
+            try:
+                self.backend.set(self._backend_key(key), self.serializer(value), self.ttl)
+            except Exception as e:
+                logger.warning(f"Cache '{self.name}' backend write failed for {key}: {str(e)}")
+                self._count("backend_errors")
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a key from memory and from the shared backend.
+
+        Args:
+            key (str): Cache key
+        """
+        with self._lock:
+            self._cache.pop(key, None)
+            self._counters["invalidations"] += 1
+
+        if self.backend is not None:
+            try:
+                self.backend.delete(self._backend_key(key))
+            except Exception as e:
+                logger.warning(f"Cache '{self.name}' backend delete failed for {key}: {str(e)}")
+                self._count("backend_errors")
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the shared backend relies on its TTL)."""
+        with self._lock:
+            self._cache.clear()
+            self._counters["invalidations"] += 1
+
+    def keys(self) -> List[str]:
+        """Return a snapshot of the keys currently held in memory."""
+        with self._lock:
+            return list(self._cache.keys())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl": self.ttl,
+                "hit_ratio": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "enabled": self.enabled
+            }
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the counters of every registered cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _registry.items()}
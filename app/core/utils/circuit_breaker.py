@@ -0,0 +1,237 @@
+"""
+Circuit breakers for calls to external services.
+
+A CircuitBreaker counts consecutive failures of a service (as told by its
+`is_failure` predicate, e.g. timeouts and 5xx but not 404s). After
+`failure_threshold` of them the circuit opens and calls fail fast with a
+CircuitOpenError (mapped to a 503 response) instead of tying up workers,
+connections and limiter slots on a service that is down. After
+`recovery_timeout` seconds the circuit is half-open: up to
+`half_open_max_calls` probe calls go through, and the first probe outcome
+closes the circuit again or re-opens it.
+
+Breakers are shared per service name through get_circuit_breaker, so every
+client instance of a service sees the same circuit.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.utils.concurrency import ServiceUnavailableError
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Every breaker registers itself here so its state can be exposed in /metrics
+_registry: Dict[str, "CircuitBreaker"] = {}
+_registry_lock = threading.Lock()
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """The circuit of an upstream service is open: the call was not attempted"""
+    pass
+
+
+class CircuitBreaker:
+    """Thread-safe closed / open / half-open circuit breaker."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        is_failure: Optional[Callable[[BaseException], bool]] = None,
+        enabled: bool = True,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            name (str): Service name (used in errors, logs and metrics)
+            failure_threshold (int): Consecutive failures that open the circuit
+            recovery_timeout (float): Seconds the circuit stays open before probing the service
+            half_open_max_calls (int): Concurrent probe calls allowed while half-open
+            is_failure (Callable, optional): Tells whether an exception counts as a service
+                failure (defaults to every exception); other errors count as successes
+            enabled (bool): When False every call goes through and nothing is recorded
+            timer (Callable): Monotonic clock (injectable for tests)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.is_failure = is_failure or (lambda e: True)
+        self.enabled = enabled
+        self._timer = timer
+        self._lock = threading.Lock()
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._counters = {"calls": 0, "successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(self._timer())
+
+    def _current_state(self, now: float) -> str:
+        # An open circuit turns half-open once the recovery timeout has elapsed
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        previous, self._state = self._state, state
+        self._probes = 0
+        if state == OPEN:
+            self._opened_at = self._timer()
+            self._counters["opened"] += 1
+            logger.warning(
+                f"Circuit {self.name} opened after {self._consecutive_failures} consecutive failures "
+                f"(was {previous}); failing fast for {self.recovery_timeout}s"
+            )
+        else:
+            logger.info(f"Circuit {self.name} {previous} -> {state}")
+
+    def _retry_after(self, now: float) -> float:
+        return max(1.0, math.ceil(self._opened_at + self.recovery_timeout - now))
+
+    def before_call(self) -> bool:
+        """
+        Admit a call, counting it as a probe when the circuit is half-open.
+
+        Every admitted call must be followed by exactly one after_call.
+
+        Returns:
+            bool: Whether the call is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with every probe slot taken
+        """
+        with self._lock:
+            now = self._timer()
+            state = self._current_state(now)
+            if state == CLOSED:
+                self._counters["calls"] += 1
+                return False
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                self._counters["calls"] += 1
+                return True
+            self._counters["rejected"] += 1
+            raise CircuitOpenError(
+                f"{self.name} is unavailable (circuit {state})",
+                retry_after=self._retry_after(now) if state == OPEN else 1.0
+            )
+
+    def after_call(self, probe: bool, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            probe (bool): The value returned by before_call
+            error (BaseException, optional): Exception raised by the call, if any
+        """
+        with self._lock:
+            if error is not None and (isinstance(error, ServiceUnavailableError) or not isinstance(error, Exception)):
+                # Cancelled callers and our own fail-fast errors (limiter queue full...)
+                # say nothing about the health of the service
+                if probe and self._state == HALF_OPEN:
+                    self._probes -= 1
+                return
+
+            if error is not None and self.is_failure(error):
+                self._counters["failures"] += 1
+                self._consecutive_failures += 1
+                if self._state == HALF_OPEN or (
+                    self._state == CLOSED and self._consecutive_failures >= self.failure_threshold
+                ):
+                    self._transition(OPEN)
+                return
+
+            self._counters["successes"] += 1
+            self._consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._transition(CLOSED)
+
+    @contextmanager
+    def protect(self):
+        """
+        Guard the block with the circuit: fail fast while it is open and record
+        the outcome otherwise. Works around awaits in async code too.
+
+        Raises:
+            CircuitOpenError: If the circuit does not admit the call
+        """
+        if not self.enabled:
+            yield
+            return
+        probe = self.before_call()
+        try:
+            yield
+        except BaseException as e:
+            self.after_call(probe, e)
+            raise
+        self.after_call(probe)
+
+    def reset(self) -> None:
+        """Close the circuit and forget the failure count."""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the circuit state, consecutive failures and counters."""
+        with self._lock:
+            now = self._timer()
+            state = self._current_state(now)
+            return {
+                **self._counters,
+                "state": state,
+                "enabled": self.enabled,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_after": self._retry_after(now) if state == OPEN else None
+            }
+
+
+def get_circuit_breaker(name: str, is_failure: Optional[Callable[[BaseException], bool]] = None) -> CircuitBreaker:
+    """
+    Return the shared breaker of a service, creating it from the settings on first use.
+
+    Args:
+        name (str): Service name
+        is_failure (Callable, optional): Failure predicate used when the breaker is created
+    """
+    with _registry_lock:
+        breaker = _registry.get(name)
+        if breaker is None:
+            breaker = _registry[name] = CircuitBreaker(
+                name,
+                failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+                half_open_max_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+                is_failure=is_failure,
+                enabled=settings.CIRCUIT_BREAKER_ENABLED
+            )
+        return breaker
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Return the state of every registered breaker, keyed by service name."""
+    with _registry_lock:
+        breakers = dict(_registry)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -0,0 +1,213 @@
+"""
+Adaptive concurrency limiting for calls to external services.
+
+AdaptiveConcurrencyLimiter bounds the number of in-flight calls with an
+AIMD (additive increase, multiplicative decrease) limit driven by observed
+latency and errors, and bounds the number of queued callers. When the queue
+is full, callers fail fast with a ServiceUnavailableError (mapped to a 503
+response) instead of piling up until they time out.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ServiceUnavailableError(Exception):
+    """
+    An upstream service is overloaded or unavailable and the request should
+    be retried later. Translated to a 503 response with a Retry-After header.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LimiterQueueFullError(ServiceUnavailableError):
+    """The limiter queue is full or the wait for a slot timed out"""
+    pass
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter with a bounded wait queue.
+
+    - Every successful call faster than `latency_target` grows the limit by
+      `increase / limit` (about +`increase` per round of `limit` calls).
+    - A call slower than `latency_target`, or failing with an overload error,
+      multiplies the limit by `backoff`, at most once per `latency_target`
+      seconds so a single burst of slow calls does not collapse the limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        max_queue: int = 256,
+        queue_timeout: float = 5.0,
+        latency_target: float = 2.0,
+        backoff: float = 0.75,
+        increase: float = 1.0,
+        is_overload: Optional[Callable[[BaseException], bool]] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name (str): Limiter name (used in logs and metrics)
+            initial_limit (int): Starting concurrency limit
+            min_limit (int): Lowest concurrency limit
+            max_limit (int): Highest concurrency limit
+            max_queue (int): Maximum number of callers waiting for a slot
+            queue_timeout (float): Seconds a caller may wait for a slot
+            latency_target (float): Calls slower than this (seconds) shrink the limit
+            backoff (float): Multiplicative decrease factor (0 < backoff < 1)
+            increase (float): Additive increase per round of successful calls
+            is_overload (Callable, optional): Tells whether an exception signals
+                overload (defaults to every exception)
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.increase = increase
+        self.is_overload = is_overload or (lambda e: True)
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._inflight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._counters = {"accepted": 0, "rejected": 0, "timeouts": 0, "decreases": 0}
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    def _retry_after(self) -> float:
+        # Rough estimate: time for the queue ahead to drain at the target latency
+        return round(max(1.0, self.latency_target * (len(self._waiters) + 1) / self.limit), 1)
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot.
+
+        Raises:
+            LimiterQueueFullError: If the queue is full or no slot frees up within queue_timeout
+        """
+        if self._inflight < self.limit and not self._waiters:
+            self._inflight += 1
+            self._counters["accepted"] += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self._counters["rejected"] += 1
+            raise LimiterQueueFullError(
+                f"{self.name} is overloaded ({self._inflight} in flight, {len(self._waiters)} queued)",
+                retry_after=self._retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right as the wait timed out: give it back
+                self._release_slot()
+            else:
+                waiter.cancel()
+            raise LimiterQueueFullError(
+                f"Timed out after {self.queue_timeout}s waiting for {self.name}",
+                retry_after=self._retry_after()
+            )
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                waiter.cancel()
+            raise
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+        self._counters["accepted"] += 1
+
+    def _release_slot(self) -> None:
+        self._inflight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # Slots are handed over directly: the woken waiter already owns its slot
+        while self._waiters and self._inflight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._inflight += 1
+            waiter.set_result(None)
+
+    def release(self, latency: float, error: Optional[BaseException] = None) -> None:
+        """
+        Release a slot and adapt the limit from the call outcome.
+
+        Args:
+            latency (float): Duration of the call in seconds
+            error (BaseException, optional): Exception raised by the call, if any
+        """
+        overloaded = latency > self.latency_target or (error is not None and self.is_overload(error))
+        now = time.monotonic()
+
+        if overloaded:
+            if now - self._last_decrease >= self.latency_target:
+                previous = self.limit
+                self._limit = max(self.min_limit, self._limit * self.backoff)
+                self._last_decrease = now
+                self._counters["decreases"] += 1
+                if self.limit != previous:
+                    logger.warning(f"{self.name} concurrency limit decreased to {self.limit} (latency {latency:.2f}s, error: {error})")
+        elif error is None:
+            self._limit = min(self.max_limit, self._limit + self.increase / max(self._limit, 1.0))
+
+        self._release_slot()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for the duration of the block, feeding its latency and outcome back to the limiter."""
+        await self.acquire()
+        start = time.monotonic()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if isinstance(error, asyncio.CancelledError):
+                # A cancelled caller says nothing about upstream health
+                self._release_slot()
+            else:
+                self.release(time.monotonic() - start, error)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit, queue depth and counters."""
+        return {
+            **self._counters,
+            "limit": self.limit,
+            "inflight": self._inflight,
+            "queued": len(self._waiters),
+            "max_queue": self.max_queue
+        }
@@ -1,23 +1,84 @@
+import asyncio
+import logging
+import threading
+import aiohttp
 import meilisearch
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from meilisearch.errors import MeilisearchApiError, MeilisearchCommunicationError, MeilisearchTimeoutError
 #from app.core.utils.helpers import Envs
 from app.core.config import settings
-from typing import Optional
+from app.core.utils.circuit_breaker import get_circuit_breaker
+from typing import Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Indexes the API searches; their existence is checked once at startup
+MEILI_INDEXES = ("tenders", "cpvs")
+
+# HTTP statuses MeiliSearch (or its proxy) answers when it is overloaded or down
+OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_meili_failure(error: BaseException) -> bool:
+    """Tell whether a MeiliSearch error means the service is unavailable (as opposed to e.g. a bad filter)."""
+    if isinstance(error, (MeilisearchTimeoutError, MeilisearchCommunicationError)):
+        return True
+    if isinstance(error, MeilisearchApiError):
+        return getattr(error, 'status_code', None) in OVERLOAD_STATUSES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+def meili_http_error(status: int, content: bytes) -> Exception:
+    """
+    Build the SDK exception of an HTTP error answered by MeiliSearch (or a proxy in front of it).
+
+    MeilisearchApiError parses the body as JSON, which fails on e.g. the HTML
+    page of a 502 from a load balancer: such bodies are not handed to it. A
+    non-JSON 5xx means MeiliSearch was not reached and is a MeilisearchCommunicationError.
+    """
+    try:
+        error_body = orjson.loads(content) if content else None
+    except orjson.JSONDecodeError:
+        error_body = None
+    if not isinstance(error_body, dict):
+        if status >= 500:
+            return MeilisearchCommunicationError(f"MeiliSearch answered HTTP {status} with a non-JSON body")
+        content = b""
+    # The SDK error reads the status and the JSON error body from a requests.Response
+    error_response = requests.Response()
+    error_response.status_code = status
+    error_response._content = content
+    return MeilisearchApiError(f"{status} Error", error_response)
+
 
 class MeiliClient:
     # docs: https://www.meilisearch.com/docs/reference/api/documents
+    # Use get_meili_client(index_name) to share one instance (and its connection pool) per process
     def __init__(self, index_name: str, host: str = "", api_key: str = ""):
         if host == '': host = settings.MEILISEARCH_HOST #Envs.get('MEILISEARCH_HOST')
         if api_key == '': api_key = settings.MEILISEARCH_API_KEY if settings.MEILISEARCH_API_KEY != '' else None #api_key = Envs.get('MEILISEARCH_API_KEY') if Envs.get('MEILISEARCH_API_KEY') != '' else None
-        self.client = meilisearch.Client(host, api_key)
+        self.client = meilisearch.Client(host, api_key, timeout=settings.MEILISEARCH_TIMEOUT)
+        self.circuit_breaker = get_circuit_breaker("meilisearch", is_failure=is_meili_failure)
         self.index_name = index_name
-        self.index = self.check_index_exists()
+        # Index handle only: no request is sent until it is used
+        self.index = self.client.index(index_name)
+        # Keep-alive connections reused by every search of this index
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.MEILISEARCH_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Shared aiohttp session for search_async (opened lazily, closed on shutdown)
+        self._http_session: Optional[aiohttp.ClientSession] = None
 
     def check_index_exists(self):
         """ Check if index exists, if not then creates it"""
-        try:
-            return self.client.get_index(self.index_name)
-        except:
-            return self.client.create_index(uid=self.index_name, options={"primaryKey": "id"})
+        with self.circuit_breaker.protect():
+            try:
+                return self.client.get_index(self.index_name)
+            except:
+                return self.client.create_index(uid=self.index_name, options={"primaryKey": "id"})
         
     def set_filters(self, filters: list):
         self.index.update_filterable_attributes(filters) #self.client.index(self.index_name)
@@ -38,15 +99,30 @@ class MeiliClient:
         return self.client.index(self.index_name).delete()
 
     def add_documents(self, documents: list):
-        return self.client.index(self.index_name).add_documents(documents)
+        with self.circuit_breaker.protect():
+            return self.client.index(self.index_name).add_documents(documents)
 
     def update_documents(self, documents: list):
-        return self.client.index(self.index_name).update_documents(documents)
+        with self.circuit_breaker.protect():
+            return self.client.index(self.index_name).update_documents(documents)
 
     def delete_documents(self, document_ids: list):
-        return self.client.index(self.index_name).delete_documents(document_ids)
+        with self.circuit_breaker.protect():
+            return self.client.index(self.index_name).delete_documents(document_ids)
+
+    def document_exists(self, document_id: str) -> bool:
+        """Tell whether a document is indexed (fetches its id only)."""
+        with self.circuit_breaker.protect():
+            try:
+                self.index.get_document(document_id, {'fields': ['id']})
+                return True
+            except MeilisearchApiError as e:
+                if getattr(e, 'status_code', None) == 404:
+                    return False
+                raise
 
-    def search(self, query: str, offset: int = 0, limit: int = 20, filter: Optional[str] = None, sort: Optional[list] = None):
+    def search(self, query: str, offset: int = 0, limit: int = 20, filter: Optional[str] = None, sort: Optional[list] = None,
+               facets: Optional[list] = None):
         """
         Search the MeiliSearch index with the given query and options.
         
@@ -56,11 +132,45 @@ class MeiliClient:
             limit: Maximum number of documents to return (default: 20)
             filter: Filter string to apply (MeiliSearch filter syntax)
             sort: List of fields to sort by (e.g., ["submission_date:desc"])
+            facets: Attributes to return facetDistribution (and facetStats for numbers) of
             
         Returns:
             Search results from MeiliSearch
         """
-        # Prepare optional parameters for the MeiliSearch library call
+        # POST the search directly instead of going through self.index.search,
+        # so the request and the (potentially large) response are encoded and
+        # decoded with orjson rather than the stdlib json module
+        return self._post_json(f"indexes/{self.index_name}/search", self._search_body(query, offset, limit, filter, sort, facets))
+
+    async def search_async(self, query: str, offset: int = 0, limit: int = 20, filter: Optional[str] = None, sort: Optional[list] = None,
+                           facets: Optional[list] = None):
+        """Async variant of search that does not block the event loop (same arguments and result)."""
+        return await self._post_json_async(f"indexes/{self.index_name}/search", self._search_body(query, offset, limit, filter, sort, facets))
+
+    async def multi_search_async(self, searches: List[dict]) -> List[dict]:
+        """
+        Run several searches of this index in one request (MeiliSearch multi-search).
+
+        Args:
+            searches: search_async keyword arguments (query, offset, limit, filter, sort, facets) per search
+
+        Returns:
+            List[dict]: The result of each search, in order
+        """
+        queries = [
+            {'indexUid': self.index_name, **self._search_body(
+                search.get('query', ''), search.get('offset'), search.get('limit'),
+                search.get('filter'), search.get('sort'), search.get('facets')
+            )}
+            for search in searches
+        ]
+        response = await self._post_json_async("multi-search", {'queries': queries})
+        return response.get('results', [])
+
+    @staticmethod
+    def _search_body(query: str, offset: Optional[int], limit: Optional[int], filter: Optional[str], sort: Optional[list],
+                     facets: Optional[list] = None) -> dict:
+        # Prepare optional parameters for the MeiliSearch search request
         search_params = {}
         if offset is not None:
             search_params['offset'] = offset
@@ -70,79 +180,99 @@ class MeiliClient:
             search_params['filter'] = filter
         if sort:
             search_params['sort'] = sort
-        
-        # Debug: Print the parameters being sent to MeiliSearch
-        print(f"MeiliSearch query: '{query}', params: {search_params}")
-        
-        # Call the underlying MeiliSearch client's search method
-        # Using self.index is slightly more direct than self.client.index(...)
-        return self.index.search(query, search_params)
+        if facets:
+            search_params['facets'] = facets
+
+        # The filter is not logged: it can hold user ids (saved_by) and long id lists
+        logger.debug(
+            f"MeiliSearch query: '{query}', offset={offset}, limit={limit}, sort={sort}, "
+            f"facets={facets}, filter length={len(filter) if filter else 0}"
+        )
+        return {'q': query, **search_params}
+
+    def _post_json(self, path: str, body: dict):
+        """POST a JSON body to the MeiliSearch REST API, raising the SDK's exceptions on failure."""
+        config = self.client.config
+        with self.circuit_breaker.protect():
+            try:
+                response = self.session.post(
+                    f"{config.url}/{path}",
+                    data=orjson.dumps(body),
+                    headers={**self.client.http.headers, 'Content-Type': 'application/json'},
+                    timeout=config.timeout
+                )
+            except requests.exceptions.Timeout as err:
+                raise MeilisearchTimeoutError(str(err)) from err
+            except requests.exceptions.ConnectionError as err:
+                raise MeilisearchCommunicationError(str(err)) from err
+
+            if response.status_code >= 400:
+                raise meili_http_error(response.status_code, response.content)
+            return orjson.loads(response.content)
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.MEILISEARCH_POOL_SIZE),
+                timeout=aiohttp.ClientTimeout(total=self.client.config.timeout)
+            )
+        return self._http_session
+
+    async def _post_json_async(self, path: str, body: dict):
+        """Async variant of _post_json on the shared aiohttp session (raises the same SDK exceptions)."""
+        config = self.client.config
+        session = await self._get_http_session()
+        with self.circuit_breaker.protect():
+            try:
+                async with session.post(
+                    f"{config.url}/{path}",
+                    data=orjson.dumps(body),
+                    headers={**self.client.http.headers, 'Content-Type': 'application/json'}
+                ) as response:
+                    status = response.status
+                    content = await response.read()
+            except asyncio.TimeoutError as err:
+                raise MeilisearchTimeoutError(f"No response from MeiliSearch within {config.timeout}s") from err
+            except aiohttp.ClientConnectionError as err:
+                raise MeilisearchCommunicationError(str(err)) from err
+
+            if status >= 400:
+                raise meili_http_error(status, content)
+            return orjson.loads(content)
+
+    async def close(self) -> None:
+        """Close the aiohttp session used by search_async."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+
+# One client per index and process, shared across requests (see database.get_neptune_client)
+_meili_clients: Dict[str, MeiliClient] = {}
+_meili_clients_lock = threading.Lock()
+
+
+def get_meili_client(index_name: str) -> MeiliClient:
+    """Return the shared MeiliClient of an index, creating it on first use."""
+    client = _meili_clients.get(index_name)
+    if client is not None:
+        return client
+    with _meili_clients_lock:
+        client = _meili_clients.get(index_name)
+        if client is None:
+            client = _meili_clients[index_name] = MeiliClient(index_name)
+        return client
+
+
+async def close_meili_clients() -> None:
+    """Close the async connection pools of the shared clients (called on application shutdown)."""
+    for client in list(_meili_clients.values()):
+        await client.close()
+
+
+def ensure_meili_indexes() -> None:
+    """Create the indexes the API searches if they do not exist (called once at startup)."""
+    for index_name in MEILI_INDEXES:
+        get_meili_client(index_name).check_index_exists()
+        logger.info(f"MeiliSearch index '{index_name}' is available")
 
-class MeiliHelpers:
-    OPERATORS = {"=", "!=", "<=", ">=", "<", ">", "TO", "EXISTS", "IN", "NOT", "IS", "IS NOT"}
-    @staticmethod
-    def parse_params_filters(params_filters: list):
-        filters = ""
-        for param_filter in params_filters:
-            # Validate required keys
-            if not isinstance(param_filter, dict):
-                print(f"Warning: Skipping non-dict filter item: {param_filter}")
-                continue
-            if 'name' not in param_filter or param_filter['name'] == '': 
-                return {'error': True, 'message': "Param filter 'name' is required"}
-            # Value is not strictly required for operators like EXISTS
-            # if 'value' not in param_filter: 
-            #     return {'error': True, 'message': "Param filter 'value' is required"}
-            
-            fname = param_filter.get('name')
-            fvalue = param_filter.get('value') # May be None for EXISTS etc.
-            foperator = param_filter.get('operator', '=') # Default operator
-            fexpression = param_filter.get('expression', 'AND') # Default expression
-            
-            if foperator not in MeiliHelpers.OPERATORS: 
-                return {'error': True, 'message': f"Param filter '{fname}' operator '{foperator}' not valid"}
-            
-            # Handle specific operator requirements
-            if foperator == 'IN' and not isinstance(fvalue, list):
-                return {'error': True, 'message': f"Value of filter '{fname}' with operator IN must be an array"}
-            if foperator in ["EXISTS", "NOT EXISTS"] and 'value' in param_filter: # Should not have value
-                 print(f"Warning: Filter '{fname}' with operator {foperator} should not have a value.")
-                 fvalue = None # Ignore value for EXISTS/NOT EXISTS
-            elif foperator not in ["EXISTS", "NOT EXISTS"] and 'value' not in param_filter:
-                 return {'error': True, 'message': f"Param filter '{fname}' with operator {foperator} requires a value"}
-
-            # Format the value part
-            value_str = ""
-            if foperator == 'IN':
-                # Correctly format IN operator: field IN [val1, val2]
-                # Ensure values are quoted if strings
-                formatted_values = []
-                for v in fvalue:
-                    if isinstance(v, str):
-                        # Escape single quotes within the string
-                        escaped_v = v.replace("'", "\\'") 
-                        formatted_values.append(f"'{escaped_v}'")
-                    else:
-                        formatted_values.append(str(v))
-                value_str = f"[{', '.join(formatted_values)}]"
-            elif fvalue is not None: # Format value for other operators
-                if isinstance(fvalue, str):
-                    # Escape single quotes
-                    escaped_fvalue = fvalue.replace("'", "\\'")
-                    value_str = f"'{escaped_fvalue}'" # Quote strings
-                else:
-                    value_str = str(fvalue)
-
-            # Build the filter part for this item
-            filter_part = f"{fname} {foperator}"
-            if value_str: # Add value only if it was formatted (e.g., not for EXISTS)
-                filter_part += f" {value_str}"
-            
-            # Append to the main filters string
-            if filters == "":
-                filters += filter_part
-            else:
-                filters += f" {fexpression} {filter_part}"
-
-        print(f"Generated MeiliSearch filter string: {filters}")
-        return {'error': False, 'filters': filters.strip()}
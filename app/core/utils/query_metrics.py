@@ -0,0 +1,166 @@
+"""
+Per-query latency histograms and slow-query log.
+
+Queries are tagged with a name (the named-query key, or a fingerprint for
+ad-hoc queries). Each name gets a fixed-bucket latency histogram; queries
+slower than the threshold are written to the "app.slow_queries" logger with
+their full text and response size, and kept in a small in-memory ring so
+they can be inspected through /metrics.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.slow_queries")
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (not thread-safe; guarded by QueryMetrics)."""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_bytes = 0
+
+    def observe(self, duration_ms: float, response_size: int = 0, error: bool = False) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.total_bytes += response_size
+        if error:
+            self.errors += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate a percentile as the upper bound of the bucket that contains it."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.buckets_ms[i]) if i < len(self.buckets_ms) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2),
+            "avg_bytes": int(self.total_bytes / self.count) if self.count else None,
+            "buckets": {
+                **{f"le_{bound}": n for bound, n in zip(self.buckets_ms, self.counts)},
+                "inf": self.counts[-1]
+            }
+        }
+
+
+class QueryMetrics:
+    """Thread-safe latency histograms per query name, plus the slow-query log."""
+
+    def __init__(self, slow_query_threshold: float = 1.0, slow_log_size: int = 50, buckets_ms=DEFAULT_BUCKETS_MS):
+        """
+        Initialize the metrics.
+
+        Args:
+            slow_query_threshold (float): Seconds above which a query is logged as slow (0 disables the log)
+            slow_log_size (int): Number of recent slow queries kept in memory
+            buckets_ms (tuple): Histogram bucket upper bounds in milliseconds
+        """
+        self.slow_query_threshold = slow_query_threshold
+        self.buckets_ms = buckets_ms
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._slow_queries: Deque[Dict[str, Any]] = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, duration: float, query: str, response_size: int = 0, error: Optional[BaseException] = None) -> bool:
+        """
+        Record one query execution.
+
+        Args:
+            name (str): Query name or fingerprint
+            duration (float): Execution time in seconds
+            query (str): Full query text (only kept for slow queries)
+            response_size (int): Response body size in bytes
+            error (BaseException, optional): Exception raised by the query
+
+        Returns:
+            bool: True if the query was slower than the threshold
+        """
+        duration_ms = duration * 1000
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram(self.buckets_ms)
+            histogram.observe(duration_ms, response_size, error is not None)
+
+        slow = bool(self.slow_query_threshold) and duration >= self.slow_query_threshold
+        if slow:
+            record = {
+                "name": name,
+                "duration_ms": round(duration_ms, 2),
+                "response_bytes": response_size,
+                "error": str(error) if error else None,
+                "timestamp": time.time(),
+                "query": query,
+                "explain": None
+            }
+            with self._lock:
+                self._slow_queries.append(record)
+            slow_query_logger.warning(
+                f"Slow SPARQL query '{name}': {duration_ms:.0f} ms, {response_size} bytes"
+                f"{f', error: {error}' if error else ''}\n{query}"
+            )
+        return slow
+
+    def attach_explain(self, name: str, query: str, explain: str) -> None:
+        """Attach an explain/profile output to the most recent slow-log entry of a query."""
+        with self._lock:
+            for record in reversed(self._slow_queries):
+                if record["name"] == name and record["query"] == query:
+                    record["explain"] = explain
+                    break
+        slow_query_logger.warning(f"Explain for slow SPARQL query '{name}':\n{explain}")
+
+    def percentile(self, name: str, q: float, min_count: int = 1) -> Optional[float]:
+        """
+        Estimate a latency percentile of a query name, in seconds.
+
+        Returns:
+            Optional[float]: The percentile, or None with fewer than min_count samples
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None or histogram.count < min_count:
+                return None
+            value_ms = histogram.percentile(q)
+        return value_ms / 1000 if value_ms is not None else None
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Return the recent slow queries, newest first."""
+        with self._lock:
+            return list(reversed(self._slow_queries))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the histogram snapshot of every query name, slowest p95 first."""
+        with self._lock:
+            snapshots = {name: histogram.snapshot() for name, histogram in self._histograms.items()}
+        return dict(sorted(snapshots.items(), key=lambda item: item[1]["p95_ms"] or 0, reverse=True))
@@ -0,0 +1,188 @@
+"""
+Health-aware load balancing and hedging across read replicas.
+
+ReplicaPool picks the endpoint of each request with "power of two choices":
+two healthy replicas are drawn at random and the one with the lower
+EWMA latency x (in-flight + 1) score wins. A replica that fails
+`failure_threshold` times in a row (overload-type errors only) is taken out
+of rotation for `cooldown` seconds.
+
+HedgeBudget caps hedged requests to a fraction of all requests: each request
+earns `max_rate` tokens and each hedge spends one, so a replica that slows
+down for everyone cannot double the load on the cluster.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class Replica:
+    """One endpoint of a ReplicaPool and its health statistics"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.ewma_latency: Optional[float] = None
+        self.inflight = 0
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.requests = 0
+        self.errors = 0
+
+    def score(self) -> float:
+        # Replicas without samples yet score as fast, so they get tried
+        return (self.ewma_latency or 0.0) * (self.inflight + 1)
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            "ewma_ms": round(self.ewma_latency * 1000, 2) if self.ewma_latency is not None else None,
+            "inflight": self.inflight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "healthy": self.unhealthy_until <= now
+        }
+
+
+class ReplicaPool:
+    """Thread-safe pool of replica endpoints with EWMA latency and failure tracking."""
+
+    def __init__(
+        self,
+        urls: List[str],
+        ewma_alpha: float = 0.3,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            urls (List[str]): Base URLs of the replicas (at least one)
+            ewma_alpha (float): Weight of the latest latency in the moving average
+            failure_threshold (int): Consecutive failures that take a replica out of rotation
+            cooldown (float): Seconds an unhealthy replica stays out of rotation
+            timer (Callable): Monotonic clock (injectable for tests)
+        """
+        if not urls:
+            raise ValueError("ReplicaPool needs at least one endpoint")
+        self.replicas = [Replica(url) for url in dict.fromkeys(urls)]
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._timer = timer
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def acquire(self, exclude: Optional[Replica] = None) -> Replica:
+        """
+        Pick a replica for a request and count it as in flight.
+
+        Unhealthy replicas are skipped unless every candidate is unhealthy.
+        Every acquire must be followed by exactly one release.
+
+        Args:
+            exclude (Replica, optional): Replica to avoid (the primary of a hedged request)
+        """
+        with self._lock:
+            now = self._timer()
+            candidates = [r for r in self.replicas if r is not exclude] or self.replicas
+            healthy = [r for r in candidates if r.unhealthy_until <= now] or candidates
+            if len(healthy) == 1:
+                replica = healthy[0]
+            else:
+                first, second = random.sample(healthy, 2)
+                replica = first if first.score() <= second.score() else second
+            replica.inflight += 1
+            replica.requests += 1
+            return replica
+
+    def release(self, replica: Replica, duration: Optional[float] = None, failed: bool = False) -> None:
+        """
+        Record the outcome of a request acquired from the pool.
+
+        Args:
+            replica (Replica): The replica returned by acquire
+            duration (float, optional): Seconds the request took (None when it was cancelled)
+            failed (bool): Whether the request failed with an overload-type error
+        """
+        with self._lock:
+            replica.inflight -= 1
+            if failed:
+                replica.errors += 1
+                replica.consecutive_failures += 1
+                if replica.consecutive_failures >= self.failure_threshold:
+                    replica.unhealthy_until = self._timer() + self.cooldown
+                    logger.warning(
+                        f"Replica {replica.url} marked unhealthy for {self.cooldown}s "
+                        f"after {replica.consecutive_failures} consecutive failures"
+                    )
+                return
+
+            if duration is None:
+                return
+            replica.consecutive_failures = 0
+            if replica.ewma_latency is None:
+                replica.ewma_latency = duration
+            else:
+                replica.ewma_latency += self.ewma_alpha * (duration - replica.ewma_latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the health statistics of every replica."""
+        with self._lock:
+            now = self._timer()
+            return {replica.url: replica.snapshot(now) for replica in self.replicas}
+
+
+class HedgeBudget:
+    """Token bucket limiting hedged requests to a fraction of all requests"""
+
+    def __init__(self, max_rate: float, burst: float = 10.0):
+        """
+        Initialize the budget.
+
+        Args:
+            max_rate (float): Highest fraction of requests that may be hedged (0 disables hedging)
+            burst (float): Most hedges that can be saved up while latency is normal
+        """
+        self.max_rate = max_rate
+        self.burst = burst
+        self._tokens = 0.0
+        self._counters = {"requests": 0, "hedged": 0, "hedge_wins": 0, "denied": 0}
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._counters["requests"] += 1
+            self._tokens = min(self.burst, self._tokens + self.max_rate)
+
+    def try_spend(self) -> bool:
+        """Take a token for one hedge; False when the hedge rate cap is reached."""
+        with self._lock:
+            # Tolerate float rounding of the accumulated fractions
+            if self._tokens < 1.0 - 1e-9:
+                self._counters["denied"] += 1
+                return False
+            self._tokens -= 1.0
+            self._counters["hedged"] += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self._counters["hedge_wins"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self._counters["requests"]
+            return {
+                **self._counters,
+                "max_rate": self.max_rate,
+                "rate": round(self._counters["hedged"] / requests, 4) if requests else 0.0
+            }
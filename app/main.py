@@ -1,8 +1,9 @@
-from fastapi import FastAPI, Request, status
+from fastapi import APIRouter, Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 import time
 import logging
@@ -12,7 +13,14 @@ import traceback
 from app.core.config import settings
 from app.core.init_search import init_meilisearch
 from app.core.init_db import create_initial_user
+from app.core.database import get_neptune_client, close_neptune_client
+from app.core.utils.cache import get_cache_stats
+from app.core.utils.circuit_breaker import get_circuit_breaker_stats
+from app.core.utils.meili import close_meili_clients, ensure_meili_indexes
+from app.core.utils.concurrency import ServiceUnavailableError
+from app.modules.tenders.tender_count import tender_count_cache
 from app.modules.auth.routes import router as auth_router
+from app.modules.auth.services import get_current_admin_user
 from app.modules.clients.routes import router as clients_router
 from app.modules.tenders.routes import router as tenders_router
 from app.modules.ai_tools.routes import router as ai_router
@@ -49,6 +57,24 @@ async def startup_event():
             logger.info("Admin user already exists")
     except Exception as e:
         logger.error(f"Error checking/creating admin user: {str(e)}")
+
+    # Open the shared Neptune connection pool
+    try:
+        await get_neptune_client().start()
+    except Exception as e:
+        logger.error(f"Error opening Neptune connection pool: {str(e)}")
+
+    # Check the MeiliSearch indexes once, instead of on every search
+    try:
+        await run_in_threadpool(ensure_meili_indexes)
+    except Exception as e:
+        logger.error(f"Error checking MeiliSearch indexes: {str(e)}")
+
+    # Keep the tender total refreshed in the background
+    try:
+        await tender_count_cache.start()
+    except Exception as e:
+        logger.error(f"Error starting tender count refresher: {str(e)}")
     
     """ # Initialize Meilisearch
     try:
@@ -61,6 +87,15 @@ async def startup_event():
         logger.error(f"Error initializing Meilisearch: {str(e)}")
         # Continue startup even if Meilisearch fails """
 
+# Shutdown event handlers
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources when the application stops"""
+    logger.info("Application shutdown: Releasing resources...")
+    await tender_count_cache.close()
+    await close_neptune_client()
+    await close_meili_clients()
+
 # Middleware for request logging
 @app.middleware("http")
 async def log_requests(request: Request, call_next: Callable):
@@ -111,6 +146,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
 
+# Overloaded or unavailable upstream service (concurrency limiter, circuit breaker...)
+@app.exception_handler(ServiceUnavailableError)
+async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableError):
+    logger.warning(f"Service unavailable: {str(exc)}")
+
+    headers = {"Retry-After": str(max(1, int(round(exc.retry_after))))} if exc.retry_after else None
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers=headers
+    )
+
 # Global exception handler for unexpected errors
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -164,5 +211,26 @@ async def health_check():
     """Health check endpoint for monitoring"""
     return {"status": "healthy"}
 
+# Monitoring endpoints: internal counters and recent SPARQL queries, for admins only
+# and left out of the public OpenAPI schema
+metrics_router = APIRouter(dependencies=[Depends(get_current_admin_user)], include_in_schema=False)
+
+@metrics_router.get("/metrics")
+async def metrics():
+    """Runtime counters for monitoring (cache hit/miss ratios, coalesced queries, etc.)"""
+    return {
+        "caches": get_cache_stats(),
+        "tender_count": tender_count_cache.stats(),
+        "neptune": get_neptune_client().stats(),
+        "circuit_breakers": get_circuit_breaker_stats()
+    }
+
+@metrics_router.get("/metrics/slow-queries")
+async def slow_queries():
+    """Recent SPARQL queries slower than NEPTUNE_SLOW_QUERY_THRESHOLD, newest first"""
+    return get_neptune_client().query_metrics.slow_queries()
+
+app.include_router(metrics_router)
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
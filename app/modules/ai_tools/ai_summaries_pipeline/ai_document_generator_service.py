@@ -7,8 +7,20 @@ import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import requests
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+from app.core.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+
+
+def is_gemini_failure(error: BaseException) -> bool:
+    """Tell whether a Gemini error means the API is unavailable or rate limiting (as opposed to e.g. a bad prompt)."""
+    if isinstance(error, errors.ServerError):
+        return True
+    if isinstance(error, errors.APIError):
+        return error.code == 429
+    return isinstance(error, (TimeoutError, requests.exceptions.ConnectionError, requests.exceptions.Timeout))
 
 class AIDocumentGeneratorService:
     """Service for generating AI-based document summaries using Gemini"""
@@ -24,6 +36,7 @@ class AIDocumentGeneratorService:
 
         # Initialize the Gemini client
         self.client = genai.Client(api_key=api_key)
+        self.circuit_breaker = get_circuit_breaker("gemini", is_failure=is_gemini_failure)
 
     def _build_system_prompt_with_chunks(self, chunks: List[Dict[str, Any]]) -> str:
         """
@@ -176,23 +189,24 @@ class AIDocumentGeneratorService:
 
                 # Use loop.run_in_executor to run the synchronous method in a thread pool
                 loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.models.generate_content(
-                        model=self.model_name,
-                        contents=[
-                            {
-                                "role": "user",
-                                "parts": [{"text": system_prompt}]
-                            },
-                            {
-                                "role": "user",
-                                "parts": [{"text": prompt}]
-                            }
-                        ],
-                        config=generate_content_config
+                with self.circuit_breaker.protect():
+                    response = await loop.run_in_executor(
+                        None,
+                        lambda: self.client.models.generate_content(
+                            model=self.model_name,
+                            contents=[
+                                {
+                                    "role": "user",
+                                    "parts": [{"text": system_prompt}]
+                                },
+                                {
+                                    "role": "user",
+                                    "parts": [{"text": prompt}]
+                                }
+                            ],
+                            config=generate_content_config
+                        )
                     )
-                )
 
                 # Log token usage if available
                 if hasattr(response, 'usage_metadata'):
@@ -206,6 +220,11 @@ class AIDocumentGeneratorService:
                 self.logger.debug(f"AI GENERATED RESPONSE FOR SECTION {section_number}: {response.text[:100]}...")
                 return response.text
 
+            except CircuitOpenError as e:
+                # Retrying cannot help while the circuit is open: fail fast
+                self.logger.error(f"Skipping section {section_number}: {e}")
+                return None
+
             except Exception as e:
                 retry_count += 1
                 self.logger.error(f"Error processing section {section_number} (attempt {retry_count}/{max_retries}): {e}")
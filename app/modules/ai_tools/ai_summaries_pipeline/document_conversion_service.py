@@ -3,8 +3,23 @@ import logging
 import asyncio
 import ssl
 from typing import Optional, Dict, Tuple, Any
+from app.core.utils.circuit_breaker import get_circuit_breaker
 from .temp_file_manager import TempFileManager
 
+# HTTP statuses the Marker API answers when it is rate limiting or unavailable
+OVERLOAD_STATUSES = {429, 500, 502, 503, 504}
+
+
+def is_marker_failure(error: BaseException) -> bool:
+    """Tell whether a Marker API error means the service is unavailable (as opposed to e.g. a rejected PDF)."""
+    import aiohttp
+
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError)):
+        return True
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in OVERLOAD_STATUSES
+    return False
+
 class DocumentConversionService:
     """Service for converting PDFs to markdown using Marker API"""
 
@@ -20,6 +35,7 @@ class DocumentConversionService:
         self.submit_url = "https://www.datalab.to/api/v1/marker"
         self.logger = logger or logging.getLogger(__name__)
         self.temp_manager = TempFileManager(logger)
+        self.circuit_breaker = get_circuit_breaker("marker", is_failure=is_marker_failure)
 
     async def convert_to_markdown(self, pdf_data: Tuple[str, bytes, str]) -> Optional[Tuple[str, str]]:
         """
@@ -80,40 +96,42 @@ class DocumentConversionService:
                             form_data.add_field(key, value)
 
                         # Submit the request
-                        async with session.post(self.submit_url, headers=headers, data=form_data) as response:
-                            response.raise_for_status()
-                            result = await response.json()
-
-                            if not result.get('success'):
-                                self.logger.error(f"Error: {result.get('error', 'Unknown error')}")
-                                return None
-
-                            request_id = result['request_id']
-                            check_url = f"https://www.datalab.to/api/v1/marker/{request_id}"
-
-                            # Poll for results
-                            self.logger.info(f"Processing request {request_id}...")
-                            max_attempts = 100
-                            for attempt in range(max_attempts):
-                                async with session.get(check_url, headers=headers) as status_response:
-                                    status_response.raise_for_status()
-                                    status = await status_response.json()
-
-                                    if status.get('status') == 'complete':
-                                        # Get the markdown content
-                                        markdown_content = status.get('markdown', '')
-                                        self.logger.info(f"Successfully converted PDF to markdown")
-                                        return (markdown_content, original_filename)
-                                    elif status.get('status') == 'error':
-                                        self.logger.error(f"Error processing PDF: {status.get('error')}")
-                                        return None
-
-                                    # Wait before polling again
-                                    await asyncio.sleep(0.2)
-
-                            self.logger.warning("Maximum polling attempts reached. Request may still be processing.")
+                        with self.circuit_breaker.protect():
+                            async with session.post(self.submit_url, headers=headers, data=form_data) as response:
+                                response.raise_for_status()
+                                result = await response.json()
+
+                    if not result.get('success'):
+                        self.logger.error(f"Error: {result.get('error', 'Unknown error')}")
+                        return None
+
+                    request_id = result['request_id']
+                    check_url = f"https://www.datalab.to/api/v1/marker/{request_id}"
+
+                    # Poll for results
+                    self.logger.info(f"Processing request {request_id}...")
+                    max_attempts = 100
+                    for attempt in range(max_attempts):
+                        with self.circuit_breaker.protect():
+                            async with session.get(check_url, headers=headers) as status_response:
+                                status_response.raise_for_status()
+                                status = await status_response.json()
+
+                        if status.get('status') == 'complete':
+                            # Get the markdown content
+                            markdown_content = status.get('markdown', '')
+                            self.logger.info(f"Successfully converted PDF to markdown")
+                            return (markdown_content, original_filename)
+                        elif status.get('status') == 'error':
+                            self.logger.error(f"Error processing PDF: {status.get('error')}")
                             return None
 
+                        # Wait before polling again
+                        await asyncio.sleep(0.2)
+
+                    self.logger.warning("Maximum polling attempts reached. Request may still be processing.")
+                    return None
+
         except Exception as e:
             self.logger.error(f"Error converting PDF to markdown: {e}")
             return None
@@ -7,6 +7,7 @@ from typing import Dict, Optional, List, Any
 from fastapi import BackgroundTasks
 from app.core.utils.azure_blob_client import AzureBlobStorageClient
 from app.modules.tenders.models import TenderDocuments
+from app.modules.tenders.tender_cache import invalidate_tender_detail
 from sqlalchemy.orm import Session
 from app.core.database import engine
 from app.core.config import settings
@@ -184,6 +185,9 @@ async def _process_document_summary_task(
 
                 session.commit()
                 logger.info(f"Updated database with tender document information for {tender_hash}")
+
+            # Summary and AI document path are part of the cached tender detail
+            invalidate_tender_detail(tender_hash)
         except Exception as e:
             logger.error(f"Error updating database: {str(e)}", exc_info=True)
             # Continue processing even if database update fails
@@ -303,7 +303,7 @@ async def search_cpv_codes(
             detail="match param required"
         )
     params['match'] = params['code'] if 'code' in params else params['description']
-    result = SearchService.do_search('cpvs', params)
+    result = await SearchService.do_search('cpvs', params)
     return {**result}
 
 @router.get("/public/cpv-codes", response_model=schemas.PaginatedCpvCodeResponse)
@@ -0,0 +1,272 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+from app.core.config import settings
+
+
+class InvalidFilterError(ValueError):
+    """Raised when a search filter is malformed (answered as 400 before MeiliSearch is called)"""
+    pass
+
+
+# Scalar operators and the operators taking a list (IN) or a pair of bounds (TO)
+COMPARISON_OPERATORS = frozenset({"=", "!=", "<", "<=", ">", ">="})
+OPERATORS = COMPARISON_OPERATORS | {"IN", "NOT IN", "TO", "EXISTS", "NOT EXISTS", "IS", "IS NOT"}
+# Values allowed after IS / IS NOT
+IS_VALUES = frozenset({"NULL", "EMPTY"})
+EXPRESSIONS = frozenset({"AND", "OR"})
+
+# Attribute names are embedded unquoted in the filter string
+FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+FilterValue = Union[None, str, int, float, bool, Tuple[Union[str, int, float, bool], ...]]
+
+
+def _format_value(value) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    # MeiliSearch string literal: double quotes, backslash-escaped
+    return '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@dataclass(frozen=True)
+class Condition:
+    """One `field operator value` filter expression"""
+    field: str
+    operator: str
+    value: FilterValue = None
+
+    def compile(self) -> str:
+        if self.operator in ("EXISTS", "NOT EXISTS"):
+            return f"{self.field} {self.operator}"
+        if self.operator in ("IS", "IS NOT"):
+            return f"{self.field} {self.operator} {self.value}"
+        if self.operator in ("IN", "NOT IN"):
+            return f"{self.field} {self.operator} [{', '.join(_format_value(v) for v in self.value)}]"
+        if self.operator == "TO":
+            low, high = self.value
+            return f"{self.field} {_format_value(low)} TO {_format_value(high)}"
+        return f"{self.field} {self.operator} {_format_value(self.value)}"
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """
+    Typed, canonical form of the filters of a tender search.
+
+    Every field is hashable and order-independent (tuples are sorted), so two
+    requests filtering the same way produce equal SearchFilters: the compiled
+    string is memoized per SearchFilter and doubles as the search cache key.
+    """
+    budget_min: Optional[float] = None
+    budget_max: Optional[float] = None
+    submission_date_from: Optional[int] = None  # Unix timestamps
+    submission_date_to: Optional[int] = None
+    statuses: Tuple[Condition, ...] = ()  # OR-ed together
+    conditions: Tuple[Condition, ...] = ()  # AND-ed (cpv, category and generic filters)
+    ids: Optional[Tuple[str, ...]] = None  # Saved tenders
+    saved_by: Optional[str] = None  # User id: tenders saved by this user (saved_by attribute)
+
+
+def parse_condition(filter_item: Any) -> Condition:
+    """
+    Validate a {name, value, operator} filter object and build its Condition.
+
+    Raises:
+        InvalidFilterError: If the name, operator or value is not valid
+    """
+    if not isinstance(filter_item, dict):
+        raise InvalidFilterError(f"Filter must be an object, got {filter_item!r}")
+    name = filter_item.get('name')
+    if not isinstance(name, str) or not FIELD_NAME.match(name):
+        raise InvalidFilterError(f"Invalid filter name {name!r}")
+    operator = str(filter_item.get('operator', '=')).upper()
+    if operator not in OPERATORS:
+        raise InvalidFilterError(f"Filter '{name}' operator '{operator}' not valid")
+
+    if operator in ("EXISTS", "NOT EXISTS"):
+        return Condition(name, operator)
+    if 'value' not in filter_item or filter_item['value'] is None:
+        raise InvalidFilterError(f"Filter '{name}' with operator {operator} requires a value")
+    value = filter_item['value']
+
+    if operator in ("IS", "IS NOT"):
+        if str(value).upper() not in IS_VALUES:
+            raise InvalidFilterError(f"Value of filter '{name}' with operator {operator} must be NULL or EMPTY")
+        return Condition(name, operator, str(value).upper())
+    if operator in ("IN", "NOT IN"):
+        if not isinstance(value, list):
+            raise InvalidFilterError(f"Value of filter '{name}' with operator {operator} must be an array")
+        return Condition(name, operator, _scalar_tuple(name, value, sort=True))
+    if operator == "TO":
+        if not isinstance(value, list) or len(value) != 2:
+            raise InvalidFilterError(f"Value of filter '{name}' with operator TO must be a [min, max] array")
+        return Condition(name, operator, _scalar_tuple(name, value, sort=False))
+    return Condition(name, operator, _scalar(name, value))
+
+
+def _scalar(name: str, value):
+    if not isinstance(value, (str, int, float, bool)):
+        raise InvalidFilterError(f"Invalid value for filter '{name}': {value!r}")
+    return value
+
+
+def _scalar_tuple(name: str, values: list, sort: bool) -> tuple:
+    values = tuple(_scalar(name, v) for v in values)
+    # IN lists are order-independent: sort them (and drop duplicates) for a canonical form
+    return tuple(sorted(set(values), key=_format_value)) if sort else values
+
+
+def _number(name: str, value) -> float:
+    if isinstance(value, bool):
+        raise InvalidFilterError(f"Invalid number for filter '{name}': {value!r}")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise InvalidFilterError(f"Invalid number for filter '{name}': {value!r}")
+
+
+def _timestamp(name: str, value) -> int:
+    try:
+        return int(datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        raise InvalidFilterError(f"Invalid date for filter '{name}': {value!r}")
+
+
+def _values(value) -> list:
+    return value if isinstance(value, list) else [value]
+
+
+def parse_search_filters(body_filters: Optional[List[Dict]], saved_ids: Optional[List[str]] = None,
+                         saved_by: Optional[str] = None) -> SearchFilter:
+    """
+    Parse the filters of a tender search into a SearchFilter.
+
+    Filter names mapped to index attributes:
+        - budget_min / budget_max: budget_amount range
+        - submission_date_from / submission_date_to: submission_date range (ISO dates)
+        - status: OR-ed together, AND-ed with the other filters
+        - cpv: a code or a list of codes
+        - category: one or more CPV categories (cps attribute)
+    Any other name is a generic {name, value, operator} condition.
+
+    Args:
+        body_filters: List of {name, value, operator} objects from the request body
+        saved_ids: Restrict the search to these tender ids (saved tenders)
+        saved_by: Restrict the search to the tenders saved by this user id
+
+    Returns:
+        SearchFilter: The canonical filter
+
+    Raises:
+        InvalidFilterError: If a filter is malformed
+    """
+    if body_filters is None:
+        body_filters = []
+    if not isinstance(body_filters, list):
+        raise InvalidFilterError("Invalid datatype for filters (expected an array)")
+
+    lows, highs, date_lows, date_highs = [], [], [], []
+    statuses, conditions = set(), set()
+    for filter_item in body_filters:
+        if not isinstance(filter_item, dict) or 'name' not in filter_item or 'value' not in filter_item:
+            raise InvalidFilterError(f"Filter must be an object with name and value, got {filter_item!r}")
+        name, value = filter_item['name'], filter_item['value']
+
+        if name == 'budget_min':
+            lows.append(_number(name, value))
+        elif name == 'budget_max':
+            highs.append(_number(name, value))
+        elif name == 'submission_date_from':
+            date_lows.append(_timestamp(name, value))
+        elif name == 'submission_date_to':
+            date_highs.append(_timestamp(name, value))
+        elif name == 'status':
+            if isinstance(value, list):
+                statuses.add(parse_condition({'name': 'status', 'value': value, 'operator': 'IN'}))
+            else:
+                statuses.add(parse_condition(filter_item))
+        elif name == 'cpv':
+            if isinstance(value, list):
+                conditions.add(parse_condition({'name': 'cpv', 'value': value, 'operator': 'IN'}))
+            else:
+                conditions.add(parse_condition({'name': 'cpv', 'value': value, 'operator': '='}))
+        elif name == 'category':
+            conditions.add(parse_condition({'name': 'cps', 'value': _values(value), 'operator': 'IN'}))
+        else:
+            conditions.add(parse_condition(filter_item))
+
+    # Several bounds on the same range keep the tightest one
+    search_filter = SearchFilter(
+        budget_min=max(lows) if lows else None,
+        budget_max=min(highs) if highs else None,
+        submission_date_from=max(date_lows) if date_lows else None,
+        submission_date_to=min(date_highs) if date_highs else None,
+        statuses=tuple(sorted(statuses, key=Condition.compile)),
+        conditions=tuple(sorted(conditions, key=Condition.compile)),
+        ids=tuple(sorted(set(saved_ids))) if saved_ids is not None else None,
+        saved_by=saved_by
+    )
+    if search_filter.budget_min is not None and search_filter.budget_max is not None \
+            and search_filter.budget_min > search_filter.budget_max:
+        raise InvalidFilterError("budget_min is greater than budget_max")
+    if search_filter.submission_date_from is not None and search_filter.submission_date_to is not None \
+            and search_filter.submission_date_from > search_filter.submission_date_to:
+        raise InvalidFilterError("submission_date_from is after submission_date_to")
+    return search_filter
+
+
+@lru_cache(maxsize=settings.SEARCH_FILTER_CACHE_SIZE)
+def compile_filter(search_filter: SearchFilter) -> str:
+    """
+    Compile a SearchFilter to a MeiliSearch filter string (memoized per distinct filter).
+
+    Returns:
+        str: The filter string, or "" when the search is not filtered
+    """
+    parts = []
+    if search_filter.budget_min is not None:
+        parts.append(Condition('budget_amount', '>=', search_filter.budget_min).compile())
+    if search_filter.budget_max is not None:
+        parts.append(Condition('budget_amount', '<=', search_filter.budget_max).compile())
+    if search_filter.submission_date_from is not None:
+        parts.append(Condition('submission_date', '>=', search_filter.submission_date_from).compile())
+    if search_filter.submission_date_to is not None:
+        parts.append(Condition('submission_date', '<=', search_filter.submission_date_to).compile())
+    parts.extend(condition.compile() for condition in search_filter.conditions)
+    if len(search_filter.statuses) == 1:
+        parts.append(search_filter.statuses[0].compile())
+    elif search_filter.statuses:
+        # Parenthesized: AND binds tighter than OR in MeiliSearch filters
+        parts.append(f"({' OR '.join(status.compile() for status in search_filter.statuses)})")
+    if search_filter.ids is not None:
+        parts.append(Condition('id', 'IN', search_filter.ids).compile())
+    if search_filter.saved_by is not None:
+        parts.append(Condition('saved_by', '=', search_filter.saved_by).compile())
+    return " AND ".join(parts)
+
+
+def compile_filter_list(params_filters: List[Dict]) -> str:
+    """
+    Compile a list of {name, value, operator, expression} filters joined by their
+    expression (AND by default; AND binds tighter than OR).
+
+    Raises:
+        InvalidFilterError: If a filter or expression is malformed
+    """
+    if not isinstance(params_filters, list):
+        raise InvalidFilterError("Invalid datatype for filters (expected an array)")
+    filter_string = ""
+    for filter_item in params_filters:
+        condition = parse_condition(filter_item)
+        if filter_string:
+            expression = str(filter_item.get('expression', 'AND')).upper()
+            if expression not in EXPRESSIONS:
+                raise InvalidFilterError(f"Filter '{condition.field}' expression '{expression}' not valid")
+            filter_string += f" {expression} "
+        filter_string += condition.compile()
+    return filter_string
@@ -1,11 +1,17 @@
 from fastapi import APIRouter, HTTPException, Request
-from app.core.utils.meili import MeiliClient, MeiliHelpers
+from fastapi.responses import ORJSONResponse
+from app.core.utils.meili import get_meili_client
+from app.core.utils.concurrency import ServiceUnavailableError
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.core.database import engine
 from app.modules.auth.models import CpvCode
+from app.modules.tenders.tender_count import tender_count_cache
+from app.modules.tenders.saved_index import SAVED_BY_FIELD
+from app.modules.search.search_cache import invalidate_search_results
+from app.modules.search.filters import InvalidFilterError, compile_filter_list
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 def ErrorResponse(error: int = 500, message: str = "Server error"):
     raise HTTPException(status_code=error, detail={'message': message})
@@ -20,15 +26,18 @@ def tenders_get(request: Request, input_data: dict = {}):
         else:
             filters = input_data['filters']
             if isinstance(filters, list): 
-                parse_filters = MeiliHelpers.parse_params_filters(filters)
-                if parse_filters['error']: ErrorResponse(400, parse_filters['message'])
-                else: filters = parse_filters['filters']
+                try:
+                    filters = compile_filter_list(filters)
+                except InvalidFilterError as e:
+                    ErrorResponse(400, f"{e}")
     try:
         match = qparams['match'] if 'match' in qparams else ''
         page = int(qparams['page']) if 'page' in qparams and qparams['page'] != '' else 1
-        tenders_search = MeiliClient('tenders')
+        tenders_search = get_meili_client('tenders')
         result = tenders_search.search(match, filters=filters, page=page)
         return {**result}
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
 
@@ -48,9 +57,18 @@ def tenders_create(request: dict):
                 format = '%Y-%m-%dT%H:%M:%S.%fZ' if "T" in document['submission_date'] and "Z" in document['submission_date'] else '%Y-%m-%d %H:%M:%S'
                 xdate = datetime.strptime(document['submission_date'], format)
                 document['submission_date'] = int(xdate.timestamp())
-        tenders_search = MeiliClient('tenders')
-        tenders_search.add_documents(documents)
+            # saved_by is owned by save/unsave (saved_index.sync_saved_by)
+            document.pop(SAVED_BY_FIELD, None)
+        # Partial update (upsert): the saved_by list of an already indexed tender is preserved,
+        # so ingestion does not need the SQL database
+        tenders_search = get_meili_client('tenders')
+        tenders_search.update_documents(documents)
+        # Ingestion changed the set of tenders: recount in the background
+        tender_count_cache.mark_stale()
+        invalidate_search_results()
         return {'message': "Tenders saved"}
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
 
@@ -60,9 +78,13 @@ def tenders_delete(request: dict):
     if isinstance(request['ids'], list) is False: ErrorResponse(400, "ids must be a list")
     try:
         ids = request['ids']
-        tenders_search = MeiliClient('tenders')
+        tenders_search = get_meili_client('tenders')
         tenders_search.delete_documents(ids)
+        tender_count_cache.mark_stale()
+        invalidate_search_results()
         return {'message': "Tenders deleteds"}
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
 
@@ -73,20 +95,24 @@ def set_filters(request: dict):
     try:
         rewrite = request['rewrite'] if 'rewrite' in request and request['rewrite'] != '' else False
         filters = request['filters']
-        tenders_search = MeiliClient('tenders')
+        tenders_search = get_meili_client('tenders')
         current_filters = tenders_search.get_filters()
         if rewrite is True: filters = list(dict.fromkeys(current_filters + filters))
         tenders_search.set_filters(filters)
         return {'message': "filters updateds"}
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
 
 @router.get("/tenders/get_filters")
 def set_filters():
     try:
-        tenders_search = MeiliClient('tenders')
+        tenders_search = get_meili_client('tenders')
         filters = tenders_search.get_filters()
         return {'filters': filters}
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
 
@@ -94,7 +120,7 @@ def set_filters():
 @router.post("/cpvs")
 def load_cpvs():
     try:
-        tenders_search = MeiliClient('cpvs')
+        tenders_search = get_meili_client('cpvs')
         #task = tenders_search.get_client().index('cpvs').update_searchable_attributes(["*", "code"]) #"description", "es_description"
         documents = []
         with Session(engine) as session:
@@ -109,6 +135,7 @@ def load_cpvs():
                 }
             )
         tenders_search.add_documents(documents)
+        invalidate_search_results()
         return {'message': "Cpvs loaded"}
         return {'documents': documents, 'searchables': tenders_search.get_index('cpvs').get_searchable_attributes()}
         documents = [
@@ -173,5 +200,7 @@ def load_cpvs():
                 "es_description": "Hidróxido de cobre"
             }
         ]
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         ErrorResponse(500, f"{e}")
\ No newline at end of file
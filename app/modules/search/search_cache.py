@@ -0,0 +1,64 @@
+import json
+import logging
+from app.core.config import settings
+from app.core.utils.cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+
+# do_search responses (MeiliSearch hits and totals) of anonymous queries.
+# In-process only: clear() cannot reach other workers, so the TTL is kept short
+search_result_cache = ResultCache(
+    name="search_results",
+    maxsize=settings.SEARCH_CACHE_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL,
+    enabled=settings.SEARCH_CACHE_ENABLED
+)
+
+# get_facets responses (facet counts and ranges of a query), same lifetime as the search results
+facet_cache = ResultCache(
+    name="search_facets",
+    maxsize=settings.SEARCH_CACHE_SIZE,
+    ttl=settings.SEARCH_CACHE_TTL,
+    enabled=settings.SEARCH_CACHE_ENABLED
+)
+
+
+def search_cache_key(index_name: str, params: dict, filter_string: str = "") -> str:
+    """
+    Build the canonical cache key of a search.
+
+    The match text is whitespace- and case-normalized (MeiliSearch matching is
+    case-insensitive). The filter is the string compiled from the canonical
+    SearchFilter (filters.compile_filter), so the order of the request filters
+    does not matter.
+
+    Args:
+        index_name: The search index
+        params: Search parameters (match, offset, limit, sort_field, sort_direction)
+        filter_string: The compiled MeiliSearch filter
+
+    Returns:
+        str: The cache key
+
+    Raises:
+        ValueError: If offset or limit is not an integer (such searches are not cached)
+    """
+    sort_field = params.get('sort_field')
+    sort_direction = str(params.get('sort_direction', 'asc')).lower()
+    key = {
+        'index': index_name,
+        'match': " ".join(str(params.get('match') or '').split()).lower(),
+        'offset': int(params.get('offset', 0)),
+        'limit': int(params.get('limit', 10)),
+        'sort': f"{sort_field}:{sort_direction}" if sort_field and sort_direction in ('asc', 'desc') else None,
+        'filter': filter_string
+    }
+    return json.dumps(key, sort_keys=True, separators=(',', ':'))
+
+
+def invalidate_search_results() -> None:
+    """Drop every cached search and facet count (called when documents are added to or deleted from an index)."""
+    search_result_cache.clear()
+    facet_cache.clear()
+    logger.debug("Search result cache cleared")
@@ -1,9 +1,58 @@
-from app.core.utils.meili import MeiliClient, MeiliHelpers
-import json # Import json for escaping URIs in filter
+import logging
+from app.core.utils.meili import get_meili_client
+from app.core.utils.concurrency import ServiceUnavailableError
+from app.modules.search.filters import compile_filter, parse_search_filters
+from app.modules.search.search_cache import facet_cache, search_cache_key, search_result_cache
 from typing import Optional, List, Dict
-from datetime import datetime
 
-def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]] = None, saved_tender_uris: Optional[List[str]] = None):
+logger = logging.getLogger(__name__)
+
+# Sidebar facets: name returned (and accepted by the filters) -> index attribute
+FACET_ATTRIBUTES = {
+    'category': 'cps',
+    'location': 'location',
+    'contract_type': 'contract_type',
+    'status': 'status'
+}
+# Numeric attributes whose min/max (facetStats) are returned for the range sliders
+RANGE_ATTRIBUTES = {
+    'budget': 'budget_amount',
+    'submission_date': 'submission_date'
+}
+
+
+def _sort_param(params: dict) -> Optional[List[str]]:
+    """Build the MeiliSearch sort parameter from sort_field and sort_direction."""
+    sort_field = params.get('sort_field')
+    sort_direction = (params.get('sort_direction') or 'asc').lower()
+    if sort_field and sort_direction in ['asc', 'desc']:
+        # Map frontend field names to MeiliSearch field names if necessary
+        # Assuming direct mapping for now (e.g., 'submission_date')
+        return [f"{sort_field}:{sort_direction}"]
+    return None
+
+
+def _search_response(result: dict, offset: int, limit: int) -> dict:
+    """Transform a MeiliSearch search result into a do_search response."""
+    items = result.get('hits', [])
+    total_hits = result.get('totalHits')
+    # MeiliSearch might return estimatedTotalHits if totalHits is not exact
+    total_count = result.get('estimatedTotalHits', total_hits if total_hits is not None else 0)
+
+    logger.debug(f"Search Result: total={total_count}, offset={offset}, limit={limit}, items_returned={len(items)}")
+    return {
+        'items': items,
+        'total': total_count,
+        'offset': offset,
+        'limit': limit,
+        # Calculate pagination flags
+        'has_next': (offset + len(items)) < total_count,
+        'has_prev': offset > 0
+    }
+
+
+async def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]] = None, saved_tender_uris: Optional[List[str]] = None,
+                    saved_by: Optional[str] = None):
     """
     Perform a search on the specified index with the given parameters and filters.
     
@@ -16,9 +65,12 @@ def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]]
             - sort_field: Field to sort by
             - sort_direction: Sort direction ('asc' or 'desc')
         body_filters (list, optional): Filters from request body.
-            - List of {name, value, operator, expression} objects
+            - List of {name, value, operator} objects (see filters.parse_search_filters)
         saved_tender_uris (list, optional): List of tender URIs/hashes to filter by.
             - If provided, results will be limited to these tenders.
+        saved_by (str, optional): User id; limits results to the tenders this user saved
+            through the saved_by attribute of the documents (cost independent of their number).
+            - Searches with neither are served from the search result cache.
     
     Returns:
         dict: Search results with the following keys:
@@ -29,118 +81,32 @@ def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]]
             - has_next: Whether there are more results beyond the current limit
             - has_prev: Whether the offset is greater than 0
             - debug (optional): Debugging information
+
+    Raises:
+        InvalidFilterError: If a filter is malformed
     """
-    combined_filter_string = ""
-    filter_parts = []
-
-    # 1. Process body filters (budget mapping, etc.)
-    if body_filters is not None:
-        print(f"Processing body filters: {body_filters}")
-        if not isinstance(body_filters, list):
-            # Use return for errors in service functions
-            return {'error': True, 'message': "Invalid datatype for body_filters"}
-        
-        processed_filters = []
-        status_filters = []
-        for filter_item in body_filters:
-            # Ensure filter_item is a dict and has required keys
-            if isinstance(filter_item, dict) and 'name' in filter_item and 'value' in filter_item:
-                name = filter_item['name']
-                value = filter_item['value']
-                # Default operator to '=' if not provided or handle based on MeiliHelpers expectation
-                operator = filter_item.get('operator', '=') 
-                
-                try:
-                    # Special handling for status filters - collect them separately
-                    if name == 'status':
-                        status_filters.append({
-                            'name': name,
-                            'value': value,
-                            'operator': operator,
-                            'expression': 'OR'  # Use OR for status filters
-                        })
-                    # Special handling for CPV codes - allow multiple values
-                    elif name == 'cpv':
-                        if isinstance(value, list):
-                            # Quote each CPV code value
-                            quoted_cpvs = [json.dumps(cpv) for cpv in value]
-                            processed_filters.append({
-                                'name': name,
-                                'value': quoted_cpvs,
-                                'operator': 'IN'
-                            })
-                        else:
-                            processed_filters.append({
-                                'name': name,
-                                'value': json.dumps(value),
-                                'operator': '='
-                            })
-                    # Special handling for budget -> budget_amount
-                    elif name == 'budget_min':
-                        processed_filters.append({'name': 'budget_amount', 'value': float(value), 'operator': '>='})
-                    elif name == 'budget_max':
-                        processed_filters.append({'name': 'budget_amount', 'value': float(value), 'operator': '<='})
-                    # Special handling for date ranges -> timestamp
-                    elif name == 'submission_date_from':
-                        dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
-                        processed_filters.append({'name': 'submission_date', 'value': int(dt.timestamp()), 'operator': '>='})
-                    elif name == 'submission_date_to':
-                        dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
-                        processed_filters.append({'name': 'submission_date', 'value': int(dt.timestamp()), 'operator': '<='})
-                    elif filter_item['name'] == 'category':
-                        processed_filters.append({
-                            'name': 'cps',
-                            'value': [filter_item['value']],
-                            'operator': 'IN'
-                        })
-                    # Generic filter: pass name, value, and operator to helper
-                    else:
-                        processed_filters.append({
-                            'name': name, 
-                            'value': value, 
-                            'operator': operator
-                        })
-                except ValueError as e:
-                    print(f"Warning: Could not parse value for filter '{name}': {value}. Error: {e}")
-            else:
-                # Log or ignore invalid filter items
-                print(f"Warning: Skipping invalid filter item format: {filter_item}")
-        
-        # Add status filters to the end of processed filters
-        processed_filters.extend(status_filters)
-        
-        # Parse the processed filters into MeiliSearch filter string using the helper
-        parse_result = MeiliHelpers.parse_params_filters(processed_filters)
-        if parse_result.get('error'): 
-            return {'error': True, 'message': parse_result['message']}
-        else: 
-            body_filter_string = parse_result.get('filters')
-            if body_filter_string: # Add only if it's not empty
-                 filter_parts.append(f"({body_filter_string})") # Wrap in parentheses
-            print(f"Parsed body filter string: {body_filter_string}")
-
-    # 2. Process saved tender URI filter
-    if saved_tender_uris is not None and len(saved_tender_uris) > 0:
-        # Assuming the field in MeiliSearch containing the URI/hash is 'id'
-        # Escape quotes within URIs if necessary, although unlikely for URIs
-        # MeiliSearch expects strings in filters to be double-quoted
-        quoted_uris = [json.dumps(uri) for uri in saved_tender_uris]
-        saved_filter_string = f"id IN [{', '.join(quoted_uris)}]"
-        filter_parts.append(saved_filter_string)
-        print(f"Added saved tender filter: {saved_filter_string}")
-    elif saved_tender_uris is not None and len(saved_tender_uris) == 0:
-        # If filtering by saved but the list is empty, no results are possible.
-        # Return early to avoid unnecessary search call.
-        print("Filtering by saved tenders, but no saved URIs provided. Returning empty result.")
+    # Searching the saved tenders of a user with none saved cannot match anything
+    if saved_tender_uris is not None and len(saved_tender_uris) == 0:
         return {
             'items': [], 'total': 0, 'offset': params.get('offset', 0),
             'limit': params.get('limit', 10), 'has_next': False, 'has_prev': False
         }
 
-    # 3. Combine filters
-    if filter_parts:
-        combined_filter_string = " AND ".join(filter_parts)
-        print(f"Combined filter string: {combined_filter_string}")
+    # Validate the filters before anything is sent to MeiliSearch (raises InvalidFilterError).
+    # The compiled string is memoized per distinct filter
+    combined_filter_string = compile_filter(parse_search_filters(body_filters, saved_tender_uris, saved_by))
+
+    # Per-user searches (saved tenders) are not cached
+    cache_key = None
+    if saved_tender_uris is None and saved_by is None:
+        try:
+            cache_key = search_cache_key(index_name, params, combined_filter_string)
+        except ValueError:
+            pass
+        else:
+            cached = search_result_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
     try:
         # Extract parameters, using new names and defaults
@@ -149,23 +115,14 @@ def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]]
         limit = int(params.get('limit', 10))
         
         # Prepare sorting parameter for MeiliSearch
-        sort_param = None
-        sort_field = params.get('sort_field')
-        sort_direction = params.get('sort_direction', 'asc').lower()
-        if sort_field and sort_direction in ['asc', 'desc']:
-             # Map frontend field names to MeiliSearch field names if necessary
-             # Assuming direct mapping for now (e.g., 'submission_date')
-             sort_param = [f"{sort_field}:{sort_direction}"]
-             print(f"Applying sort: {sort_param}")
+        sort_param = _sort_param(params)
 
         # Initialize MeiliSearch client
-        index_search = MeiliClient(index_name)
+        index_search = get_meili_client(index_name)
         
         # Perform the search with offset, limit, and combined filters
-        print(f"Executing MeiliSearch with: match='{match}', offset={offset}, limit={limit}, filter='{combined_filter_string}', sort={sort_param}")
-        
         # Call search with individual keyword arguments
-        result = index_search.search(
+        result = await index_search.search_async(
             match, 
             offset=offset,
             limit=limit,
@@ -174,31 +131,131 @@ def do_search(index_name: str, params: dict, body_filters: Optional[List[Dict]]
         )
         
         # Transform the response
-        items = result.get('hits', [])
-        total_hits = result.get('totalHits')
-        # MeiliSearch might return estimatedTotalHits if totalHits is not exact
-        total_count = result.get('estimatedTotalHits', total_hits if total_hits is not None else 0)
-        
-        # Calculate pagination flags
-        has_next = (offset + len(items)) < total_count
-        has_prev = offset > 0
-        
-        print(f"Search Result: total={total_count}, offset={offset}, limit={limit}, items_returned={len(items)}")
-
-        # Construct final response
-        response_data = {
-            'items': items,
-            'total': total_count,
-            'offset': offset,
-            'limit': limit,
-            'has_next': has_next,
-            'has_prev': has_prev
-            # 'debug': result # Optionally include raw MeiliSearch result for debugging
-        }
+        response_data = _search_response(result, offset, limit)
+        if cache_key is not None:
+            search_result_cache.set(cache_key, response_data)
         return response_data
 
+    except ServiceUnavailableError:
+        # Open circuit: answered as 503 by the global handler
+        raise
     except Exception as e:
-        import traceback
-        print(f"Error during search: {traceback.format_exc()}")
+        logger.error(f"Error during search of index '{index_name}': {str(e)}", exc_info=True)
         return {'error': True, 'message': f"Search service error: {str(e)}"}
-        
\ No newline at end of file
+
+
+async def get_facets(index_name: str, params: dict, body_filters: Optional[List[Dict]] = None,
+                     saved_tender_uris: Optional[List[str]] = None, saved_by: Optional[str] = None) -> dict:
+    """
+    Count the matches of a search per facet value, in one MeiliSearch request returning no hits.
+
+    Takes the same match, filters and saved tender restriction as do_search.
+    Searches that are not restricted to a user's saved tenders are cached per
+    normalized query and filter.
+
+    Returns:
+        dict: Facets with the following keys:
+            - total: Total number of matches
+            - facets: Count per value, for each of FACET_ATTRIBUTES
+            - budget / submission_date: {min, max} of the matches (None when no match has the attribute)
+
+    Raises:
+        InvalidFilterError: If a filter is malformed
+    """
+    if saved_tender_uris is not None and len(saved_tender_uris) == 0:
+        return {
+            'total': 0, 'facets': {name: {} for name in FACET_ATTRIBUTES},
+            **{name: {'min': None, 'max': None} for name in RANGE_ATTRIBUTES}
+        }
+
+    filter_string = compile_filter(parse_search_filters(body_filters, saved_tender_uris, saved_by))
+    match = params.get('match') or ''
+
+    cache_key = None
+    if saved_tender_uris is None and saved_by is None:
+        cache_key = search_cache_key(index_name, {'match': match}, filter_string)
+        cached = facet_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    result = await get_meili_client(index_name).search_async(
+        match,
+        limit=0,
+        filter=filter_string or None,
+        facets=list(FACET_ATTRIBUTES.values()) + list(RANGE_ATTRIBUTES.values())
+    )
+
+    distribution = result.get('facetDistribution') or {}
+    stats = result.get('facetStats') or {}
+    total_hits = result.get('totalHits')
+    response_data = {
+        'total': result.get('estimatedTotalHits', total_hits if total_hits is not None else 0),
+        'facets': {name: distribution.get(attribute, {}) for name, attribute in FACET_ATTRIBUTES.items()},
+        **{
+            name: {'min': stats.get(attribute, {}).get('min'), 'max': stats.get(attribute, {}).get('max')}
+            for name, attribute in RANGE_ATTRIBUTES.items()
+        }
+    }
+    if cache_key is not None:
+        facet_cache.set(cache_key, response_data)
+    return response_data
+
+
+async def do_multi_search(index_name: str, searches: Dict[str, dict]) -> Dict[str, dict]:
+    """
+    Perform several named searches with a single MeiliSearch multi-search request.
+
+    Searches answered by the search result cache (or that cannot match, like a
+    saved-only search of a user with no saved tenders) are not sent.
+
+    Args:
+        index_name (str): The search index to query (e.g., 'tenders')
+        searches (dict): Search name -> do_search arguments
+            (params, body_filters, saved_tender_uris, saved_by)
+
+    Returns:
+        dict: Search name -> do_search response (items, total, offset, limit, has_next, has_prev)
+
+    Raises:
+        InvalidFilterError: If a filter of any search is malformed (nothing is sent then)
+        ValueError: If the offset or limit of a search is not an integer
+    """
+    responses: Dict[str, dict] = {}
+    pending = []  # (name, cache_key, search_async arguments) of the searches to send
+    for name, search in searches.items():
+        params = search.get('params') or {}
+        saved_tender_uris = search.get('saved_tender_uris')
+        saved_by = search.get('saved_by')
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 10))
+        if saved_tender_uris is not None and len(saved_tender_uris) == 0:
+            responses[name] = _search_response({}, offset, limit)
+            continue
+
+        filter_string = compile_filter(parse_search_filters(search.get('body_filters'), saved_tender_uris, saved_by))
+        cache_key = None
+        if saved_tender_uris is None and saved_by is None:
+            cache_key = search_cache_key(index_name, params, filter_string)
+            cached = search_result_cache.get(cache_key)
+            if cached is not None:
+                responses[name] = cached
+                continue
+        pending.append((name, cache_key, {
+            'query': params.get('match') or '',
+            'offset': offset,
+            'limit': limit,
+            'filter': filter_string or None,
+            'sort': _sort_param(params)
+        }))
+
+    if pending:
+        logger.debug(f"MeiliSearch multi-search of {len(pending)} searches: {[name for name, _, _ in pending]}")
+        results = await get_meili_client(index_name).multi_search_async([request for _, _, request in pending])
+        for (name, cache_key, request), result in zip(pending, results):
+            response_data = _search_response(result, request['offset'], request['limit'])
+            if cache_key is not None:
+                search_result_cache.set(cache_key, response_data)
+            responses[name] = response_data
+
+    # Keep the order of the request
+    return {name: responses[name] for name in searches}
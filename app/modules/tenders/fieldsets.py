@@ -0,0 +1,79 @@
+from typing import FrozenSet, Iterable, List, Optional
+from app.modules.tenders.schemas import TenderDetail
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when a fields= parameter names an unknown TenderDetail field"""
+    pass
+
+
+# Named detail queries (queries_tender_detail.TENDER_DETAIL_QUERIES and the
+# page queries of build_tender_detail_page_queries) needed by each TenderDetail
+# field. The core query always runs: it provides uri, title, description and
+# additional_information.
+FIELD_QUERIES = {
+    "identifier": ("identifier",),
+    "buyer": ("contracting_entity",),
+    "estimated_value": ("monetary_values",),
+    "net_value": ("monetary_values",),
+    "gross_value": ("monetary_values",),
+    "contract_term": ("contractual_terms_and_location",),
+    "purpose": ("cpvs",),
+    "submission_term": ("submission_terms",),
+    "procurement_documents": ("legal_documents", "technical_documents", "additional_documents", "documents"),
+    "lots": ("lots",),
+    "lot_count": ("lot_count",),
+    "document_count": ("document_count",),
+}
+
+# Fields read from the TenderDocuments table instead of the graph
+DATABASE_FIELDS = frozenset({"summary", "url_document", "status"})
+
+
+def parse_detail_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    Parse a comma-separated fields= parameter.
+
+    Args:
+        fields: e.g. "title,buyer,estimated_value,submission_term"
+
+    Returns:
+        FrozenSet[str]: The requested TenderDetail fields (uri is always included),
+        or None when every field is requested
+
+    Raises:
+        InvalidFieldsError: If a field is not a TenderDetail field
+    """
+    if not fields or not fields.strip():
+        return None
+
+    requested = frozenset(f.strip() for f in fields.split(",") if f.strip())
+    unknown = requested - set(TenderDetail.model_fields)
+    if unknown:
+        raise InvalidFieldsError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Valid fields: {', '.join(TenderDetail.model_fields)}"
+        )
+    return requested | {"uri"}
+
+
+def detail_query_names(fields: Optional[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Return the names of the detail queries needed for a field set, or None when every query is needed."""
+    if fields is None:
+        return None
+    names = {"core"}
+    for field in fields:
+        names.update(FIELD_QUERIES.get(field, ()))
+    return frozenset(names)
+
+
+def needs_database(fields: Optional[FrozenSet[str]]) -> bool:
+    """Whether a field set includes fields stored in the TenderDocuments table."""
+    return fields is None or bool(fields & DATABASE_FIELDS)
+
+
+def missing_fields(query_names: Iterable[str]) -> List[str]:
+    """Return the TenderDetail fields left incomplete by queries that did not return."""
+    missing = set(query_names)
+    return sorted(field for field, names in FIELD_QUERIES.items() if missing.intersection(names))
+
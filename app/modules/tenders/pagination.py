@@ -0,0 +1,90 @@
+import base64
+import json
+from typing import Any, Dict, Optional
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
+
+
+def encode_listing_cursor(binding: Dict[str, Any]) -> str:
+    """
+    Build the opaque cursor pointing after a tender listing row.
+
+    The cursor stores the keyset of the row, (submissionDate, procedure),
+    including the datatype of the date so it can be compared as a typed literal.
+
+    Args:
+        binding: The SPARQL binding of the last row of a page
+
+    Returns:
+        str: URL-safe cursor
+    """
+    submission_date = binding.get("submissionDate") or {}
+    payload = {
+        "d": submission_date.get("value"),
+        "t": submission_date.get("datatype"),
+        "p": binding["procedure"]["value"]
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_listing_cursor(cursor: str) -> Dict[str, Optional[str]]:
+    """
+    Decode and validate a cursor produced by encode_listing_cursor.
+
+    Values are checked so they can be embedded safely in a SPARQL query.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        procedure = payload["p"]
+        submission_date = payload.get("d")
+        datatype = payload.get("t")
+    except Exception as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    for value in (procedure, submission_date, datatype):
+        if value is None:
+            continue
+        if not isinstance(value, str) or any(c in value for c in '"\\<>{}\n\r\t '):
+            raise InvalidCursorError("Invalid pagination cursor")
+
+    return {"submission_date": submission_date, "datatype": datatype, "procedure": procedure}
+
+
+def build_keyset_filter(cursor: Optional[str]) -> str:
+    """
+    Build the SPARQL FILTER that keeps the rows after a cursor in the
+    ORDER BY DESC(?submissionDate) DESC(?procedure) listing order.
+
+    Rows without a submission date sort last, so they follow every dated row.
+
+    Args:
+        cursor: Cursor returned with the previous page, or None for the first page
+
+    Returns:
+        str: A FILTER clause, or an empty string for the first page
+    """
+    if not cursor:
+        return ""
+
+    keyset = decode_listing_cursor(cursor)
+    procedure = f'"{keyset["procedure"]}"'
+
+    if keyset["submission_date"] is None:
+        return f"FILTER(!BOUND(?submissionDate) && STR(?procedure) < {procedure})"
+
+    date = f'"{keyset["submission_date"]}"'
+    if keyset["datatype"]:
+        date += f'^^<{keyset["datatype"]}>'
+
+    return (
+        f"FILTER(!BOUND(?submissionDate) || ?submissionDate < {date} || "
+        f"(?submissionDate = {date} && STR(?procedure) < {procedure}))"
+    )
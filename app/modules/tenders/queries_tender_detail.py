@@ -5,7 +5,7 @@ PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
 SELECT ?procedure ?title ?description ?additionalInfo
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{ ?procedure dct:title ?title . }}
   OPTIONAL {{ ?procedure dct:description ?description . }}
   OPTIONAL {{ ?procedure ns1:hasAdditionalInformation ?additionalInfo . }}
@@ -20,7 +20,7 @@ PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
 SELECT ?procedure ?identifier
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns4:identifier ?idMapping .
     ?idMapping skos:notation ?identifier .
@@ -30,7 +30,6 @@ WHERE {{
 
 # DATOS DE LA ORGANIZACIÓN CONTRATANTE
 query_contracting_entity = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
-PREFIX ns5: <http://data.europa.eu/m8g/>
 PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
 PREFIX ns3: <http://www.w3.org/ns/locn#>
 PREFIX ns4: <http://data.europa.eu/m8g/>
@@ -51,11 +50,11 @@ SELECT ?procedure ?buyer
        (SAMPLE(?thoroughfare) AS ?thoroughfare)
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   
   OPTIONAL {{
     ?procedure ns1:involvesBuyer ?buyer .
-    ?buyer a ns5:PublicOrganisation .
+    ?buyer a ns4:PublicOrganisation .
     OPTIONAL {{ ?buyer ns1:hasLegalName ?orgName . }}
     OPTIONAL {{ ?buyer ns1:hasLegalFormType ?orgFormType . }}
     OPTIONAL {{ ?buyer ns1:hasMainActivityDescription ?orgMainAct . }}
@@ -93,7 +92,7 @@ PREFIX ns3: <http://publications.europa.eu/ontology/authority/>
 SELECT ?procedure ?baseBudgetAmount ?baseBudgetCurrency ?grossBudgetAmount ?grossBudgetCurrency ?netBudgetAmount ?netBudgetCurrency
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:hasEstimatedValue ?monetaryValue .
     FILTER(STRENDS(STR(?monetaryValue), "estimated-overall-contract-amount"))
@@ -127,7 +126,7 @@ PREFIX ns3: <http://www.w3.org/ns/locn#>
 SELECT ?procedure ?contractType ?contractSubType ?locationName ?contractNutsCode ?contractCountryCode ?country ?province ?postCode ?postName ?thoroughfare
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:foreseesContractSpecificTerm ?contractTerm .
     OPTIONAL {{ ?contractTerm a ns1:ContractTerm .
@@ -161,7 +160,7 @@ query_cpvs = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
 SELECT ?procedure ?cpv
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:hasPurpose ?purpose .
     ?purpose a ns1:Purpose ;
@@ -176,7 +175,7 @@ query_submission_terms = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
 SELECT ?procedure ?submissionDeadline ?submissionLanguage
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:isSubjectToProcedureSpecificTerm ?submissionTerm .
     ?submissionTerm a ns1:SubmissionTerm ;
@@ -193,7 +192,7 @@ PREFIX dct: <http://purl.org/dc/terms/>
 SELECT ?procedure ?UUID_legal ?ID_legal ?fechaPublicacion_legal ?issued_legal ?descripcion_legal ?urlAcceso_legal
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:isSubjectToProcedureSpecificTerm ?legalAccessTerm .
     FILTER(CONTAINS(STR(?legalAccessTerm), "access-term/legal-document"))
@@ -216,7 +215,7 @@ PREFIX dct: <http://purl.org/dc/terms/>
 SELECT ?procedure ?UUID_technical ?ID_technical ?fechaPublicacion_technical ?issued_technical ?descripcion_technical ?urlAcceso_technical
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:isSubjectToProcedureSpecificTerm ?technicalAccessTerm .
     FILTER(CONTAINS(STR(?technicalAccessTerm), "access-term/technical-document"))
@@ -244,7 +243,7 @@ SELECT ?procedure (GROUP_CONCAT(STR(?UUID_add); separator="||") AS ?UUID_adds)
        (GROUP_CONCAT(?urlAcceso_add; separator="||") AS ?urlAcceso_adds)
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}
+  VALUES ?procedure {{ {tender_values} }}
   OPTIONAL {{
     ?procedure ns1:isSubjectToProcedureSpecificTerm ?additionalTerm .
     FILTER(CONTAINS(STR(?additionalTerm), "access-term/additional-document"))
@@ -276,7 +275,7 @@ SELECT ?procedure ?lot
        (SAMPLE(?lotNet) AS ?lotNet)
 WHERE {{
   ?procedure a ns1:Procedure .
-  VALUES ?procedure {{ <{tender_uri}> }}  
+  VALUES ?procedure {{ {tender_values} }}  
   ?procedure ns1:hasProcurementScopeDividedIntoLot ?lot .
   ?lot a ns1:Lot .
   OPTIONAL {{ ?lot dct:title ?lotTitle . }}
@@ -307,4 +306,228 @@ WHERE {{
   }}
 }}
 GROUP BY ?procedure ?lot
-"""
\ No newline at end of file
+"""
+
+
+# PÁGINA DE LOTES (same projection as query_lots, one page ordered by lot URI)
+query_lots_page = query_lots + """ORDER BY STR(?lot)
+LIMIT {limit}
+OFFSET {offset}
+"""
+
+# NÚMERO DE LOTES (no row when the procedure does not exist)
+query_lot_count = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
+
+SELECT ?procedure (COUNT(DISTINCT ?lot) AS ?lotCount)
+WHERE {{
+  ?procedure a ns1:Procedure .
+  VALUES ?procedure {{ {tender_values} }}
+  OPTIONAL {{
+    ?procedure ns1:hasProcurementScopeDividedIntoLot ?lot .
+    ?lot a ns1:Lot .
+  }}
+}}
+GROUP BY ?procedure
+"""
+
+# PÁGINA DE DOCUMENTOS (legal, technical and additional documents, one row per document)
+query_documents_page = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
+PREFIX dct: <http://purl.org/dc/terms/>
+
+SELECT ?procedure ?document ?documentType ?documentOrder
+       (SAMPLE(?documentTitle) AS ?title)
+       (SAMPLE(?documentUrl) AS ?accessUrl)
+WHERE {{
+  ?procedure a ns1:Procedure .
+  VALUES ?procedure {{ {tender_values} }}
+  ?procedure ns1:isSubjectToProcedureSpecificTerm ?accessTerm .
+  ?accessTerm a ns1:AccessTerm ;
+              ns1:involvesProcurementDocument ?document .
+  BIND(IF(CONTAINS(STR(?accessTerm), "access-term/legal-document"), 1,
+       IF(CONTAINS(STR(?accessTerm), "access-term/technical-document"), 2,
+       IF(CONTAINS(STR(?accessTerm), "access-term/additional-document"), 3, 0))) AS ?documentOrder)
+  FILTER(?documentOrder > 0)
+  BIND(IF(?documentOrder = 1, "legal", IF(?documentOrder = 2, "technical", "adds")) AS ?documentType)
+  ?document dct:title ?documentTitle ;
+            ns1:hasAccessURL ?documentUrl .
+}}
+GROUP BY ?procedure ?documentOrder ?documentType ?document
+ORDER BY ?documentOrder STR(?document)
+LIMIT {limit}
+OFFSET {offset}
+"""
+
+# NÚMERO DE DOCUMENTOS (no row when the procedure does not exist)
+query_document_count = """PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
+PREFIX dct: <http://purl.org/dc/terms/>
+
+SELECT ?procedure (COUNT(DISTINCT ?document) AS ?documentCount)
+WHERE {{
+  ?procedure a ns1:Procedure .
+  VALUES ?procedure {{ {tender_values} }}
+  OPTIONAL {{
+    ?procedure ns1:isSubjectToProcedureSpecificTerm ?accessTerm .
+    FILTER(CONTAINS(STR(?accessTerm), "access-term/legal-document") ||
+           CONTAINS(STR(?accessTerm), "access-term/technical-document") ||
+           CONTAINS(STR(?accessTerm), "access-term/additional-document"))
+    ?accessTerm a ns1:AccessTerm ;
+                ns1:involvesProcurementDocument ?document .
+    ?document dct:title ?documentTitle ;
+              ns1:hasAccessURL ?documentUrl .
+  }}
+}}
+GROUP BY ?procedure
+"""
+
+
+# SUBGRAFO COMPLETO DEL PROCEDIMIENTO (modo "construct" / "graph")
+# Returns every triple reachable from the procedure up to four hops away
+# (procedure -> lot -> contract term -> location -> literal). rdf:type
+# objects are kept but never expanded, so ontology classes are not pulled in.
+query_tender_subgraph = """PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX ns1: <http://data.europa.eu/a4g/ontology#>
+
+CONSTRUCT {{
+  ?procedure ?p1 ?o1 .
+  ?o1 ?p2 ?o2 .
+  ?o2 ?p3 ?o3 .
+  ?o3 ?p4 ?o4 .
+}}
+WHERE {{
+  VALUES ?procedure {{ {tender_values} }}
+  ?procedure ?p1 ?o1 .
+  {paged_filter}
+  OPTIONAL {{
+    FILTER(isIRI(?o1) && ?p1 != rdf:type)
+    ?o1 ?p2 ?o2 .
+    OPTIONAL {{
+      FILTER(isIRI(?o2) && ?p2 != rdf:type)
+      ?o2 ?p3 ?o3 .
+      OPTIONAL {{
+        FILTER(isIRI(?o3) && ?p3 != rdf:type)
+        ?o3 ?p4 ?o4 .
+      }}
+    }}
+  }}
+}}
+"""
+
+# Named detail queries in execution order. Every template selects ?procedure and
+# takes a {tender_values} placeholder, so one query can cover several tenders.
+TENDER_DETAIL_QUERIES = [
+    ("core", query_core_template),
+    ("identifier", query_identifier),
+    ("contracting_entity", query_contracting_entity),
+    ("monetary_values", query_monetary_values),
+    ("contractual_terms_and_location", query_contractual_terms_and_location),
+    ("cpvs", query_cpvs),
+    ("submission_terms", query_submission_terms),
+    ("legal_documents", query_legal_documents),
+    ("technical_documents", query_technical_documents),
+    ("additional_documents", query_additional_documents),
+    ("lots", query_lots),
+]
+
+
+# Detail queries replaced by a page and a count when the detail only inlines
+# the first lots and documents
+PAGED_DETAIL_QUERIES = ("legal_documents", "technical_documents", "additional_documents", "lots")
+
+# Keeps the lots and document access terms out of the tender subgraph
+SUBGRAPH_PAGED_FILTER = """FILTER(?p1 != ns1:hasProcurementScopeDividedIntoLot &&
+         !CONTAINS(STR(?o1), "access-term/legal-document") &&
+         !CONTAINS(STR(?o1), "access-term/technical-document") &&
+         !CONTAINS(STR(?o1), "access-term/additional-document"))"""
+
+
+def build_tender_detail_queries(tender_uris, query_names=None):
+    """
+    Build the named detail queries for one or more tender URIs.
+
+    Args:
+        tender_uris: List of full procedure URIs
+        query_names: Only build these queries (see fieldsets.detail_query_names); all by default
+
+    Returns:
+        List of (name, query) tuples ready for execute_named_sparql_queries_parallel
+    """
+    tender_values = " ".join(f"<{uri}>" for uri in tender_uris)
+    return [
+        (name, template.format(tender_values=tender_values))
+        for name, template in TENDER_DETAIL_QUERIES
+        if query_names is None or name in query_names
+    ]
+
+
+def build_tender_subgraph_query(tender_uris, exclude_paged=False):
+    """
+    Build the CONSTRUCT query returning the subgraph of one or more tender URIs.
+
+    Args:
+        tender_uris: List of full procedure URIs
+        exclude_paged: Leave out the lots and the document access terms, which are
+            then loaded page by page (see build_tender_detail_page_queries)
+
+    Returns:
+        str: The CONSTRUCT query
+    """
+    tender_values = " ".join(f"<{uri}>" for uri in tender_uris)
+    return query_tender_subgraph.format(
+        tender_values=tender_values,
+        paged_filter=SUBGRAPH_PAGED_FILTER if exclude_paged else ""
+    )
+
+
+def build_lots_page_queries(tender_uri, limit, offset=0):
+    """
+    Build the named queries of one page of the lots of a tender.
+
+    Returns:
+        List of (name, query) tuples: the page ("lots", same rows as query_lots)
+        and the total ("lot_count")
+    """
+    tender_values = f"<{tender_uri}>"
+    return [
+        ("lots", query_lots_page.format(tender_values=tender_values, limit=int(limit), offset=int(offset))),
+        ("lot_count", query_lot_count.format(tender_values=tender_values)),
+    ]
+
+
+def build_documents_page_queries(tender_uri, limit, offset=0):
+    """
+    Build the named queries of one page of the procurement documents of a tender.
+
+    Documents are ordered legal, technical, additional, as in the full detail.
+
+    Returns:
+        List of (name, query) tuples: the page ("documents") and the total ("document_count")
+    """
+    tender_values = f"<{tender_uri}>"
+    return [
+        ("documents", query_documents_page.format(tender_values=tender_values, limit=int(limit), offset=int(offset))),
+        ("document_count", query_document_count.format(tender_values=tender_values)),
+    ]
+
+
+def build_tender_detail_page_queries(tender_uri, inline_items, query_names=None):
+    """
+    Build the detail queries of one tender with only the first page of its
+    lots and documents, plus their totals.
+
+    Args:
+        tender_uri: Full procedure URI
+        inline_items: Lots and documents to include
+        query_names: Only build these queries (see fieldsets.detail_query_names); all by default
+
+    Returns:
+        List of (name, query) tuples ready for execute_named_sparql_queries_parallel
+    """
+    queries = [
+        (name, query) for name, query in build_tender_detail_queries([tender_uri], query_names)
+        if name not in PAGED_DETAIL_QUERIES
+    ]
+    paged = build_lots_page_queries(tender_uri, inline_items) + build_documents_page_queries(tender_uri, inline_items)
+    return queries + [
+        (name, query) for name, query in paged
+        if query_names is None or name in query_names
+    ]
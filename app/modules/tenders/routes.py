@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Query, Request
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
 from app.modules.tenders import schemas, services
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from app.modules.auth.services import get_current_user
 from app.modules.auth.models import User
 from sqlalchemy.orm import Session
@@ -9,15 +10,32 @@ from app.core.database import get_db
 import logging
 from app.modules.search import services as SearchService
 from datetime import datetime, timezone
-from sqlalchemy import select
 from app.modules.tenders.models import TenderDocuments as TenderDocumentsModel
+from app.modules.tenders.tender_cache import invalidate_tender_detail
+from app.modules.tenders.pagination import InvalidCursorError
+from app.modules.tenders.fieldsets import InvalidFieldsError, parse_detail_fields
+from app.modules.search.filters import InvalidFilterError
+from app.core.utils.concurrency import ServiceUnavailableError
+from app.core.config import settings
 import uuid
 
-router = APIRouter(tags=["tenders"])
+# Tender payloads can be large (hundreds of lots and documents): encode them with orjson
+router = APIRouter(tags=["tenders"], default_response_class=ORJSONResponse)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+def valid_tender_id(
+    tender_id: str = Path(..., description="The URI or hash identifier of the tender")
+) -> str:
+    """Path dependency rejecting tender ids that are not safe to embed in a SPARQL query (400)."""
+    if not schemas.is_valid_tender_id(tender_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid tender ID (expected a tender hash or an http(s) IRI)"
+        )
+    return tender_id
+
 @router.get("/ai_document_sas_token/{tender_id}", response_model=str)
 async def get_ai_document_sas_token(
     tender_id: str = Path(..., description="The URI or hash identifier of the tender to retrieve")
@@ -107,6 +125,8 @@ async def get_ai_tender_documents(
     """
     try:
         return await services.get_ai_tender_documents(tender_id, db)
+    except ServiceUnavailableError:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,7 +140,7 @@ async def get_ai_tender_documents(
 
 @router.get("/documents/{tender_id}", response_model=schemas.TenderDocuments)
 async def get_tender_documents(
-    tender_id: str = Path(..., description="The URI or hash identifier of the tender to retrieve")
+    tender_id: str = Depends(valid_tender_id)
 ):
     """
     Get the documents for a specific tender.
@@ -136,6 +156,57 @@ async def get_tender_documents(
             detail=f"Error retrieving tender documents: {str(e)}"
         )
 
+async def _saved_search_restriction(is_saved: bool, db: Session, current_user: User) -> Tuple[Optional[List[str]], Optional[str]]:
+    """
+    Return the (saved_tender_uris, saved_by) arguments of a search restricted to the user's saved tenders.
+
+    With SEARCH_SAVED_BY_FILTER the search filters on the saved_by document
+    attribute; otherwise the saved tender URIs are read from the database.
+    """
+    if not is_saved:
+        return None, None
+    if settings.SEARCH_SAVED_BY_FILTER:
+        # Filter on the saved_by document attribute: no per-tender id list to fetch or send
+        return None, str(current_user.id)
+    logger.info(f"Fetching saved tenders for user {current_user.id}")
+    # Blocking SQL runs in the threadpool, off the event loop
+    saved_tender_uris = await run_in_threadpool(services.get_user_saved_tenders_uris, db, str(current_user.id))
+    logger.info(f"Found {len(saved_tender_uris)} saved tender URIs.")
+    return saved_tender_uris, None
+
+async def _read_body_filters(request: Request):
+    """Return the filters array of the request body, or None when there is no (JSON) body."""
+    try:
+        body = await request.json()
+        if "filters" in body:
+            filters = body["filters"]
+            logger.debug(f"Received {len(filters) if isinstance(filters, list) else 'non-array'} filters in body")
+            return filters
+    except Exception as e:
+        logger.debug(f"No body or invalid body format: {str(e)}")
+    return None
+
+def _search_hit_item(tender: Dict[str, Any], tender_statuses: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Format a tenders index document as a listing item, with its document processing status."""
+    return {
+        "tender_hash": tender["id"],
+        "tender_id": tender["exp"],
+        "title": tender["title"],
+        "description": tender["description"],
+        "submission_date": datetime.fromtimestamp(tender["submission_date"], timezone.utc).isoformat() if tender["submission_date"] not in ("", None) else None,
+        "updated": datetime.fromtimestamp(tender["updated"], timezone.utc).isoformat() if tender["updated"] not in ("", None) else None,
+        "n_lots": tender["lotes"],
+        "pub_org_name": tender["contracting_body"],
+        "budget": {
+            "amount": tender["budget_amount"],
+            "currency": "EUR"
+        },
+        "location": tender["location"],
+        "contract_type": tender["contract_type"],
+        "cpv_categories": tender["cps"],
+        "status": tender_statuses.get(tender["id"]) if tender["id"] in tender_statuses else None  # Only get from dictionary, don't set default
+    }
+
 @router.get("/") #, response_model=schemas.PaginatedTenderResponse
 async def get_tenders(
     request: Request,
@@ -163,7 +234,7 @@ async def get_tenders(
     - **sort_direction**: Sort direction ('asc' or 'desc')
 
     Filters (provided in request body):
-    - **filters**: Array of filter objects with name/value pairs
+    - **filters**: Array of filter objects with name/value pairs (400 if a filter is malformed)
 
     Returns:
         PaginatedTenderResponse: List of tender previews with total count and offset/limit info
@@ -181,76 +252,29 @@ async def get_tenders(
         search_params = {k: v for k, v in search_params.items() if v is not None}
 
         # Check if there's a body with filters
-        body_filters = None
-        if request.method in ["GET", "POST"]:
-            try:
-                body = await request.json()
-                if "filters" in body:
-                    body_filters = body["filters"]
-                    print(f"Received filters in body: {body_filters}")
-            except Exception as e:
-                print(f"No body or invalid body format: {str(e)}")
+        body_filters = await _read_body_filters(request)
         
-        # Fetch saved tender URIs if requested
-        saved_tender_uris: Optional[List[str]] = None
-        if is_saved:
-            logger.info(f"Fetching saved tenders for user {current_user.id}")
-            saved_tender_uris = services.get_user_saved_tenders_uris(db, str(current_user.id))
-            logger.info(f"Found {len(saved_tender_uris)} saved tender URIs.")
-            # If no saved tenders, return empty list immediately? Or let search handle it?
-            # Let search handle it for consistency, it might return 0 results.
+        # Restrict to the saved tenders if requested
+        saved_tender_uris, saved_by = await _saved_search_restriction(is_saved, db, current_user)
         
         # Call the search service with updated parameters
         # Assuming SearchService.do_search accepts offset, limit, and saved_tender_uris
-        result = SearchService.do_search(
+        result = await SearchService.do_search(
             index_name='tenders', 
             params=search_params, 
             body_filters=body_filters,
-            saved_tender_uris=saved_tender_uris # Pass the list of saved URIs
+            saved_tender_uris=saved_tender_uris, # Pass the list of saved URIs
+            saved_by=saved_by
         )
         
         # Get a list of all tender IDs to fetch statuses in bulk
         tender_ids = [tender["id"] for tender in result.get('items', [])]
         
-        # Get the tender document statuses for all tender IDs
-        tender_statuses = {}
-        if tender_ids:
-            # Query the database for all tender documents in one go
-            try:
-                stmt = (
-                    select(TenderDocumentsModel.tender_uri, TenderDocumentsModel.status)
-                    .where(TenderDocumentsModel.tender_uri.in_(tender_ids))
-                )
-                results = db.execute(stmt).fetchall()
-                
-                # Create a dictionary mapping tender_id to status
-                tender_statuses = {tender_uri: status for tender_uri, status in results}
-                logger.debug(f"Found statuses for {len(tender_statuses)} tenders")
-            except Exception as e:
-                logger.error(f"Error retrieving tender statuses: {str(e)}")
+        # Get the tender document statuses for all tender IDs in one query, off the event loop
+        tender_statuses = await run_in_threadpool(services.get_tender_statuses, db, tender_ids)
         
         # Format the results (same as before)
-        items = [
-            {
-                "tender_hash": tender["id"],
-                "tender_id": tender["exp"],
-                "title": tender["title"],
-                "description": tender["description"],
-                "submission_date": datetime.fromtimestamp(tender["submission_date"], timezone.utc).isoformat() if tender["submission_date"] not in ("", None) else None,
-                "updated": datetime.fromtimestamp(tender["updated"], timezone.utc).isoformat() if tender["updated"] not in ("", None) else None,
-                "n_lots": tender["lotes"],
-                "pub_org_name": tender["contracting_body"],
-                "budget": {
-                    "amount": tender["budget_amount"],
-                    "currency": "EUR"
-                },
-                "location": tender["location"],
-                "contract_type": tender["contract_type"],
-                "cpv_categories": tender["cps"],
-                "status": tender_statuses.get(tender["id"]) if tender["id"] in tender_statuses else None  # Only get from dictionary, don't set default
-            }
-            for tender in result.get('items', []) # Use .get for safety
-        ]
+        items = [_search_hit_item(tender, tender_statuses) for tender in result.get('items', [])] # Use .get for safety
         
         # Reconstruct the response, assuming SearchService returns total, offset, limit
         # Adapt this based on the actual return value of SearchService.do_search
@@ -269,6 +293,13 @@ async def get_tenders(
 
         return response_data
 
+    except InvalidFilterError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving tenders: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -321,9 +352,201 @@ async def post_tenders(
         current_user=current_user
     )
 
+@router.get("/facets", response_model=schemas.TenderFacetsResponse)
+async def get_tender_facets(
+    request: Request,
+    is_saved: bool = Query(False, description="Count saved tenders only"),
+    match: Optional[str] = Query(None, description="Search query string"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Count the tenders matching a search per category (CPV), location, contract type and status.
+
+    Takes the same search and filters as GET /tenders, so the filter sidebar
+    can show the counts of the current query with one call. Also returns the
+    budget and submission date ranges of the matches for the range sliders.
+    Counts of searches not restricted to saved tenders are cached briefly.
+
+    Query parameters:
+    - **is_saved**: Count saved tenders only (default: False)
+    - **match**: Search query string to match against tender content
+
+    Filters (provided in request body):
+    - **filters**: Array of filter objects with name/value pairs (400 if a filter is malformed)
+
+    Returns:
+        TenderFacetsResponse: Total, counts per facet value and ranges
+    """
+    try:
+        body_filters = await _read_body_filters(request)
+        saved_tender_uris, saved_by = await _saved_search_restriction(is_saved, db, current_user)
+        result = await SearchService.get_facets(
+            index_name='tenders',
+            params={'match': match or ''},
+            body_filters=body_filters,
+            saved_tender_uris=saved_tender_uris,
+            saved_by=saved_by
+        )
+        submission_date = {
+            bound: datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+            for bound, value in result['submission_date'].items()
+        }
+        return schemas.TenderFacetsResponse(
+            total=result['total'],
+            facets=result['facets'],
+            budget=schemas.FacetRange(**result['budget']),
+            submission_date=schemas.DateFacetRange(**submission_date)
+        )
+    except InvalidFilterError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving tender facets: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving tender facets: {str(e)}"
+        )
+
+@router.post("/facets", response_model=schemas.TenderFacetsResponse)
+async def post_tender_facets(
+    request: Request,
+    is_saved: bool = Query(False, description="Count saved tenders only"),
+    match: Optional[str] = Query(None, description="Search query string"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Same as GET /tenders/facets, with the filters in the request body."""
+    return await get_tender_facets(request=request, is_saved=is_saved, match=match, db=db, current_user=current_user)
+
+@router.post("/multi")
+async def multi_search_tenders(
+    multi_request: schemas.MultiSearchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Run several named tender searches in one request (dashboard widgets).
+
+    The searches are sent to MeiliSearch as a single multi-search, and the
+    document statuses of every returned tender are read with one SQL query.
+
+    Request body:
+    - **searches**: Search name -> {match, offset, limit, sort_field, sort_direction, is_saved, filters}
+      (up to MULTI_SEARCH_MAX_QUERIES searches, with the same meaning as the GET /tenders parameters)
+
+    Returns:
+        dict: {"results": search name -> listing response (items, total, offset, limit, has_next, has_prev)}
+    """
+    if len(multi_request.searches) > settings.MULTI_SEARCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many searches: at most {settings.MULTI_SEARCH_MAX_QUERIES} per request"
+        )
+
+    try:
+        # The saved tenders of the user are looked up once for all the saved-only searches
+        saved_restriction = None
+        searches = {}
+        for name, spec in multi_request.searches.items():
+            saved_tender_uris, saved_by = None, None
+            if spec.is_saved:
+                if saved_restriction is None:
+                    saved_restriction = await _saved_search_restriction(True, db, current_user)
+                saved_tender_uris, saved_by = saved_restriction
+            params = {
+                'match': spec.match or '',
+                'offset': spec.offset,
+                'limit': spec.limit,
+                'sort_field': spec.sort_field,
+                'sort_direction': spec.sort_direction
+            }
+            searches[name] = {
+                'params': {k: v for k, v in params.items() if v is not None},
+                'body_filters': spec.filters,
+                'saved_tender_uris': saved_tender_uris,
+                'saved_by': saved_by
+            }
+
+        results = await SearchService.do_multi_search('tenders', searches)
+
+        # Statuses of the tenders of every search in one query, off the event loop
+        tender_ids = list(dict.fromkeys(tender["id"] for result in results.values() for tender in result['items']))
+        tender_statuses = await run_in_threadpool(services.get_tender_statuses, db, tender_ids)
+
+        return {
+            "results": {
+                name: {
+                    "items": [_search_hit_item(tender, tender_statuses) for tender in result['items']],
+                    "total": result['total'],
+                    "offset": result['offset'],
+                    "limit": result['limit'],
+                    "has_next": result['has_next'],
+                    "has_prev": result['has_prev']
+                }
+                for name, result in results.items()
+            }
+        }
+
+    except InvalidFilterError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        logger.error(f"Error running tender searches: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error running tender searches: {str(e)}"
+        )
+
+@router.get("/graph", response_model=schemas.PaginatedTenderResponse)
+async def get_graph_tenders(
+    size: int = Query(10, ge=1, le=100, description="Number of items to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor returned by the previous page"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    List tenders straight from the RDF graph, newest submission date first.
+
+    Uses cursor (keyset) pagination: pass the next_cursor of a page to get the
+    following one. Every page costs the same regardless of its depth.
+
+    Query parameters:
+    - **size**: Number of items per page (default: 10, max: 100)
+    - **cursor**: Opaque cursor from the previous page (omit for the first page)
+
+    Returns:
+        PaginatedTenderResponse: List of tender previews and the next_cursor
+    """
+    try:
+        return await services.get_tenders_paginated(size=size, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving tenders: {str(e)}"
+        )
+
 @router.get("/detail/{tender_id}", response_model=schemas.TenderResponse)
 async def get_tender_detail(
-    tender_id: str = Path(..., description="The URI or hash identifier of the tender to retrieve")
+    tender_id: str = Depends(valid_tender_id),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated TenderDetail fields to return (e.g. title,buyer,estimated_value,submission_term); all fields by default"
+    )
 ):
     """
     Get detailed information about a specific tender.
@@ -332,21 +555,44 @@ async def get_tender_detail(
     The tender is identified by either its full URI or its hash identifier.
 
     - **tender_id**: A string representing either the full URI of the tender or its hash identifier
+    - **fields**: Optional sparse fieldset; only the graph subqueries those fields need are run
+      and the response only contains them (uri is always included)
+
+    Sections that miss their deadline (TENDER_DETAIL_SECTION_DEADLINES) are
+    returned empty and listed in **partial**, so the client can request them
+    again with fields=.
 
     Returns:
-        TenderResponse: The complete tender details
+        TenderResponse: The complete tender details, or the requested fields
     """
     # Direct print for debugging router execution
     print(f"ROUTER DIAGNOSTIC: Starting get_tender_detail for ID: {tender_id}")
 
     try:
-        tender = await services.get_tender_detail(tender_id)
-        return schemas.TenderResponse(
+        requested_fields = parse_detail_fields(fields)
+        tender, missing = await services.get_partial_tender_detail(tender_id, requested_fields)
+        response = schemas.TenderResponse(
             data=tender,
             meta={
                 "source": "Neptune RDF Graph"
-            }
+            },
+            partial=missing
+        )
+        if requested_fields is None:
+            return response
+
+        response.meta["fields"] = sorted(requested_fields)
+        return ORJSONResponse(response.model_dump(
+            mode="json", include={"data": set(requested_fields), "meta": True, "partial": True}
+        ))
+    except InvalidFieldsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
+    except ServiceUnavailableError:
+        # Handled globally as 503 + Retry-After
+        raise
     except ValueError as e:
         # Return a 404 with a clearer error message
         raise HTTPException(
@@ -359,6 +605,104 @@ async def get_tender_detail(
             detail=f"Error retrieving tender: {str(e)}"
         )
 
+@router.get("/detail/{tender_id}/lots", response_model=schemas.TenderLotsPage)
+async def get_tender_lots_page(
+    tender_id: str = Depends(valid_tender_id),
+    limit: int = Query(20, ge=1, le=settings.TENDER_PAGE_MAX_SIZE, description="Number of lots to return"),
+    offset: int = Query(0, ge=0, description="Number of lots to skip")
+):
+    """
+    Get one page of the lots of a tender.
+
+    The tender detail only includes the first lots and lot_count; use this
+    endpoint to load the rest of a large tender (e.g. a framework agreement
+    with hundreds of lots).
+
+    - **limit**: Lots per page (default: 20, max: TENDER_PAGE_MAX_SIZE)
+    - **offset**: Lots to skip
+
+    Returns:
+        TenderLotsPage: The lots of the page and the total number of lots
+    """
+    try:
+        return await services.get_tender_lots_page(tender_id, limit=limit, offset=offset)
+    except ServiceUnavailableError:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tender not found: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving tender lots: {str(e)}"
+        )
+
+@router.get("/detail/{tender_id}/documents", response_model=schemas.TenderDocumentsPage)
+async def get_tender_documents_page(
+    tender_id: str = Depends(valid_tender_id),
+    limit: int = Query(20, ge=1, le=settings.TENDER_PAGE_MAX_SIZE, description="Number of documents to return"),
+    offset: int = Query(0, ge=0, description="Number of documents to skip")
+):
+    """
+    Get one page of the procurement documents of a tender (legal, technical, then additional).
+
+    The tender detail only includes the first documents and document_count;
+    use this endpoint to load the rest.
+
+    - **limit**: Documents per page (default: 20, max: TENDER_PAGE_MAX_SIZE)
+    - **offset**: Documents to skip
+
+    Returns:
+        TenderDocumentsPage: The documents of the page and the total number of documents
+    """
+    try:
+        return await services.get_tender_documents_page(tender_id, limit=limit, offset=offset)
+    except ServiceUnavailableError:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tender not found: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving tender documents: {str(e)}"
+        )
+
+@router.post("/details:batch", response_model=schemas.TenderBatchResponse)
+async def get_tender_details_batch(
+    batch_request: schemas.TenderBatchRequest
+):
+    """
+    Get detailed information about several tenders in one request.
+
+    The tenders are fetched from the RDF graph with multi-URI queries, so
+    exporting or comparing N tenders costs a few queries instead of 11 per tender.
+
+    - **tender_ids**: URIs or hash identifiers of the tenders (up to TENDER_BATCH_MAX_IDS)
+
+    Returns:
+        TenderBatchResponse: The found tenders in request order and the IDs that were not found
+    """
+    if len(batch_request.tender_ids) > settings.TENDER_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many tender IDs: at most {settings.TENDER_BATCH_MAX_IDS} per request"
+        )
+
+    try:
+        return await services.get_tender_details_batch(batch_request.tender_ids)
+    except ServiceUnavailableError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving tenders: {str(e)}"
+        )
+
 @router.post("/save", response_model=schemas.UserTender)
 async def save_tender(
     tender_data: schemas.SaveTenderRequest,
@@ -374,7 +718,9 @@ async def save_tender(
             situation=tender_data.situation
         )
 
-        user_tender = services.save_tender_for_user(
+        # Blocking SQL and the saved_by index sync run in the threadpool
+        user_tender = await run_in_threadpool(
+            services.save_tender_for_user,
             db=db,
             tender_data=user_tender_data
         )
@@ -394,7 +740,8 @@ async def unsave_tender(
     try:
         logger.debug(f"Attempting to unsave tender: {request_data.tender_uri} for user: {current_user.id}")
 
-        result = services.unsave_tender_for_user(
+        result = await run_in_threadpool(
+            services.unsave_tender_for_user,
             db=db,
             user_id=str(current_user.id),
             tender_uri=request_data.tender_uri
@@ -466,7 +813,7 @@ async def create_or_update_summary(
 
 @router.get("/preview/{tender_id}", response_model=schemas.TenderPreview)
 async def get_tender_preview(
-    tender_id: str = Path(..., description="The URI or hash identifier of the tender to retrieve")
+    tender_id: str = Depends(valid_tender_id)
 ):
     """
     Get a preview of a specific tender.
@@ -576,6 +923,9 @@ async def update_tender_status(
             
         # Commit changes
         db.commit()
+
+        # The status is part of the cached tender detail
+        invalidate_tender_detail(tender_hash)
             
         return {"message": f"Successfully updated status for tender {tender_hash}", "status": request_data.status}
     
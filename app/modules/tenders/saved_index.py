@@ -0,0 +1,63 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.utils.meili import get_meili_client
+from app.modules.tenders.models import UserTender as UserTenderModel
+
+logger = logging.getLogger(__name__)
+
+# Ids of the users who saved a tender, denormalized onto its search document so
+# "saved tenders only" searches filter on `saved_by = "<user id>"` instead of
+# an `id IN [...]` list that grows with the number of saved tenders
+SAVED_BY_FIELD = "saved_by"
+
+# Tender hashes per IN query (SQL Server accepts at most 2100 parameters)
+SAVED_BY_QUERY_CHUNK = 1000
+
+
+def get_saved_by(db: Session, tender_uris: List[str]) -> Dict[str, List[str]]:
+    """
+    Get the ids of the users who saved each tender.
+
+    Args:
+        db: SQLAlchemy Session
+        tender_uris: Tender hashes (search document ids)
+
+    Returns:
+        Dict[str, List[str]]: Sorted user ids per tender hash, for every requested tender
+    """
+    saved_by = defaultdict(list)
+    for start in range(0, len(tender_uris), SAVED_BY_QUERY_CHUNK):
+        chunk = tender_uris[start:start + SAVED_BY_QUERY_CHUNK]
+        stmt = (
+            select(UserTenderModel.tender_uri, UserTenderModel.user_id)
+            .where(UserTenderModel.tender_uri.in_(chunk))
+        )
+        for tender_uri, user_id in db.execute(stmt).fetchall():
+            saved_by[tender_uri].append(user_id)
+    return {tender_uri: sorted(saved_by.get(tender_uri, [])) for tender_uri in tender_uris}
+
+
+def sync_saved_by(db: Session, tender_uri: str) -> None:
+    """
+    Write the current saved_by list of a tender to its search document.
+
+    Called after a save or unsave has been committed. The list is read back from
+    the database, so concurrent saves of the same tender converge. Best effort:
+    a MeiliSearch failure is logged and left to backfill_saved_by.py, and tenders
+    that are not indexed yet are skipped. Ingestion preserves saved_by but does
+    not derive it: tenders saved before their first ingestion get it from
+    backfill_saved_by.py.
+    """
+    try:
+        tenders_search = get_meili_client('tenders')
+        if not tenders_search.document_exists(tender_uri):
+            logger.debug(f"Tender {tender_uri} is not indexed, saved_by not synced")
+            return
+        saved_by = get_saved_by(db, [tender_uri])[tender_uri]
+        tenders_search.update_documents([{'id': tender_uri, SAVED_BY_FIELD: saved_by}])
+    except Exception as e:
+        logger.warning(f"Could not sync saved_by of tender {tender_uri}: {str(e)}")
+
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, HttpUrl, AnyUrl
+from pydantic import BaseModel, Field, HttpUrl, AnyUrl, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+import re
 
 class ContractNatureType(str, Enum):
     SUPPLY = "supply"
@@ -156,6 +157,10 @@ class TenderDetail(BaseModel):
     # Lots
     lots: List[Lot] = []
 
+    # Totals when only the first lots and documents are inlined (see TENDER_DETAIL_INLINE_ITEMS)
+    lot_count: Optional[int] = None
+    document_count: Optional[int] = None
+
     def __str__(self):
         return f"""{self.uri}
                 {self.identifier}
@@ -180,6 +185,48 @@ class TenderResponse(BaseModel):
     """API response model for tender details"""
     data: TenderDetail
     meta: Dict[str, Any] = {}
+    # Fields whose section missed its deadline; request them again with fields=
+    partial: List[str] = []
+
+class TenderLotsPage(BaseModel):
+    """A page of the lots of a tender"""
+    items: List[Lot] = []
+    total: int
+    limit: int
+    offset: int
+
+class TenderDocumentsPage(BaseModel):
+    """A page of the procurement documents of a tender"""
+    items: List[ProcurementDocument] = []
+    total: int
+    limit: int
+    offset: int
+
+# Tender ids accepted by the endpoints that query the graph: they are embedded in
+# SPARQL as <IRI>, so IRIs must not contain characters that end or escape an IRIREF
+TENDER_HASH_PATTERN = re.compile(r"^[A-Za-z0-9._~-]+$")
+TENDER_IRI_PATTERN = re.compile(r'^https?://[^\s<>"{}|\\^`]+$')
+
+def is_valid_tender_id(tender_id: str) -> bool:
+    """Tell whether a tender id is a tender hash or an IRI that is safe to embed in a SPARQL query."""
+    return bool(TENDER_HASH_PATTERN.match(tender_id) or TENDER_IRI_PATTERN.match(tender_id))
+
+class TenderBatchRequest(BaseModel):
+    """Schema for the client request to fetch several tender details at once"""
+    tender_ids: List[str] = Field(..., min_length=1, description="URIs or hash identifiers of the tenders")
+
+    @field_validator('tender_ids')
+    @classmethod
+    def validate_tender_ids(cls, v: List[str]) -> List[str]:
+        invalid = [tender_id for tender_id in v if not is_valid_tender_id(tender_id)]
+        if invalid:
+            raise ValueError(f"Invalid tender IDs (expected a tender hash or an http(s) IRI): {invalid[:10]}")
+        return v
+
+class TenderBatchResponse(BaseModel):
+    """API response model for a batch of tender details"""
+    items: List[TenderDetail] = []
+    not_found: List[str] = []
 
 class UserTender(BaseModel):
     """Schema representing a user's saved tender relationship"""
@@ -234,11 +281,43 @@ class TenderPreview(BaseModel):
 class PaginatedTenderResponse(BaseModel):
     """Paginated response for tender listing"""
     items: List[TenderPreview] = []
-    total: int = 0
+    total: Optional[int] = 0  # None while the total is not known yet (tender count not computed)
     page: int = 1
     size: int = 10
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[str] = None  # Opaque keyset cursor of the next page (cursor-paginated listings)
+
+class FacetRange(BaseModel):
+    """Minimum and maximum of a numeric attribute over the matching tenders"""
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+class DateFacetRange(BaseModel):
+    """Earliest and latest date over the matching tenders"""
+    min: Optional[datetime] = None
+    max: Optional[datetime] = None
+
+class TenderFacetsResponse(BaseModel):
+    """Counts per facet value and ranges for the filter sidebar"""
+    total: int = 0
+    facets: Dict[str, Dict[str, int]] = {}  # category, location, contract_type, status -> value -> count
+    budget: FacetRange = FacetRange()
+    submission_date: DateFacetRange = DateFacetRange()
+
+class MultiSearchSpec(BaseModel):
+    """One named search of a multi-search request (same meaning as the GET /tenders parameters)"""
+    match: Optional[str] = None
+    offset: int = Field(0, ge=0)
+    limit: int = Field(10, ge=1, le=100)
+    sort_field: Optional[str] = None
+    sort_direction: Optional[str] = None
+    is_saved: bool = False
+    filters: Optional[List[Dict[str, Any]]] = None
+
+class MultiSearchRequest(BaseModel):
+    """Schema for the client request to run several named tender searches at once"""
+    searches: Dict[str, MultiSearchSpec] = Field(..., min_length=1, description="Search name -> search")
 
 class UserTenderCreate(BaseModel):
     """Schema for creating a user tender relationship"""
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, FrozenSet, List, Tuple
 from datetime import datetime
 from rdflib import Graph, Namespace, URIRef, BNode, Literal
 from app.core.database import get_neptune_client, get_async_db
@@ -12,8 +12,22 @@ from app.modules.tenders.models import UserTender as UserTenderModel, TenderDocu
 from sqlalchemy.orm import Session
 from app.core.database import engine
 from app.core.utils.azure_blob_client import AzureBlobStorageClient
-from app.modules.tenders.queries_tender_detail import query_core_template, query_identifier, query_contracting_entity, query_monetary_values, query_contractual_terms_and_location, query_cpvs, query_submission_terms, query_legal_documents, query_technical_documents, query_additional_documents, query_lots
-from app.modules.tenders.tender_helpers import parse_tender_detail
+from app.modules.tenders.queries_tender_detail import (
+    build_documents_page_queries,
+    build_lots_page_queries,
+    build_tender_detail_page_queries,
+    build_tender_detail_queries,
+    build_tender_subgraph_query,
+)
+from app.modules.tenders.tender_count import tender_count_cache
+from app.modules.tenders.saved_index import sync_saved_by
+from app.modules.tenders.pagination import build_keyset_filter, encode_listing_cursor
+from app.modules.tenders.tender_jsonld import index_jsonld, parse_tender_from_index, parse_tender_from_jsonld
+from app.modules.tenders.tender_helpers import nested_model, parse_inline_pages, parse_tender_detail, parse_tender_details, result_count
+from app.core.config import settings, parse_section_deadlines
+from app.modules.tenders.tender_cache import get_cached_tender_detail, cache_tender_detail, invalidate_tender_detail
+from app.modules.tenders.fieldsets import detail_query_names, missing_fields, needs_database
+from app.core.utils.concurrency import ServiceUnavailableError
 import aiohttp
 import asyncio
 
@@ -34,12 +48,17 @@ NS = {
     'xsd': Namespace('http://www.w3.org/2001/XMLSchema#')
 }
 
-async def get_tender_detail(tender_id: str) -> schemas.TenderDetail:
+async def get_tender_detail(tender_id: str, fields: Optional[FrozenSet[str]] = None) -> schemas.TenderDetail:
     """
     Fetch detailed information about a tender from the Neptune RDF graph.
 
+    Sections that miss their TENDER_DETAIL_SECTION_DEADLINES deadline are left
+    empty; use get_partial_tender_detail to know which ones.
+
     Args:
         tender_id: The URI or hash identifier of the tender to retrieve
+        fields: Only load these TenderDetail fields (see fieldsets.parse_detail_fields);
+            the other sections are left empty and their queries are not run
 
     Returns:
         TenderDetail: The full tender details from the RDF graph
@@ -47,11 +66,39 @@ async def get_tender_detail(tender_id: str) -> schemas.TenderDetail:
     Raises:
         ValueError: If the tender is not found
     """
-    # Get Neptune client
-    neptune_client = get_neptune_client()
+    tender_detail, _ = await get_partial_tender_detail(tender_id, fields)
+    return tender_detail
+
 
+async def get_partial_tender_detail(
+    tender_id: str, fields: Optional[FrozenSet[str]] = None
+) -> Tuple[schemas.TenderDetail, List[str]]:
+    """
+    Fetch a tender like get_tender_detail, also returning the sections that
+    could not be loaded in time.
+
+    Returns:
+        Tuple[TenderDetail, List[str]]: The tender and the TenderDetail fields missing
+        from it (empty for a complete detail), which can be requested again with fields=
+
+    Raises:
+        ValueError: If the tender is not found
+        ServiceUnavailableError: If the core section of the tender did not return
+    """
     logger.info(f"Starting get_tender_detail for ID: {tender_id}")
 
+    # Serve popular tenders from the cache (invalidated when TenderDocuments changes).
+    # A cached full detail also answers any sparse request.
+    cached_detail = get_cached_tender_detail(tender_id, fields)
+    if cached_detail is None and fields is not None:
+        cached_detail = get_cached_tender_detail(tender_id)
+    if cached_detail is not None:
+        logger.debug(f"Tender detail cache hit for {tender_id}")
+        return cached_detail, []
+
+    # Get Neptune client
+    neptune_client = get_neptune_client()
+
     # Determine if the provided ID is a complete URI or just a hash/identifier
     if tender_id.startswith('http'):
         tender_uri = tender_id
@@ -59,75 +106,311 @@ async def get_tender_detail(tender_id: str) -> schemas.TenderDetail:
         # Construct the URI from the hash (using the format from the example)
         tender_uri = f"http://gober.ai/spain/procedure/{tender_id}"
 
-    # Define multiple SPARQL queries
-    named_queries = [
-        ("core", query_core_template.format(tender_uri=tender_uri)),
-        ("identifier", query_identifier.format(tender_uri=tender_uri)),
-        ("contracting_entity", query_contracting_entity.format(tender_uri=tender_uri)),
-        ("monetary_values", query_monetary_values.format(tender_uri=tender_uri)),
-        ("contractual_terms_and_location", query_contractual_terms_and_location.format(tender_uri=tender_uri)),
-        ("cpvs", query_cpvs.format(tender_uri=tender_uri)),
-        ("submission_terms", query_submission_terms.format(tender_uri=tender_uri)),
-        ("legal_documents", query_legal_documents.format(tender_uri=tender_uri)),
-        ("technical_documents", query_technical_documents.format(tender_uri=tender_uri)),
-        ("additional_documents", query_additional_documents.format(tender_uri=tender_uri)),
-        ("lots", query_lots.format(tender_uri=tender_uri)),
-    ]
-
     try:
-        named_results = await neptune_client.execute_named_sparql_queries_parallel(named_queries)
-        tender_detail = parse_tender_detail(named_results)
-
-        try:
-            # Extract tender hash for database lookup
-            tender_hash = tender_id
-            if '/' in tender_id:
-                tender_hash = tender_id.split('/')[-1]
-
-            # Use synchronous DB session for simpler query
-            from sqlalchemy.orm import Session
-            from app.core.database import engine
+        tender_detail, missing = await _fetch_tender_detail(neptune_client, tender_uri, fields)
+        documents_loaded = False
 
-            # Use a synchronous session for simplicity
-            with Session(engine) as db:
-                # First try exact match on tender_uri
-                tender_doc = db.query(TenderDocumentsModel).filter(
-                    TenderDocumentsModel.tender_uri == tender_hash
-                ).first()
-                
-                # If not found, try other potential formats
-                if not tender_doc and '/' not in tender_id:
-                    # Try with full URI
+        if not needs_database(fields):
+            # None of the TenderDocuments fields were requested
+            documents_loaded = True
+        else:
+            try:
+                # Extract tender hash for database lookup
+                tender_hash = tender_id
+                if '/' in tender_id:
+                    tender_hash = tender_id.split('/')[-1]
+
+                # Use synchronous DB session for simpler query
+                from sqlalchemy.orm import Session
+                from app.core.database import engine
+
+                # Use a synchronous session for simplicity
+                with Session(engine) as db:
+                    # First try exact match on tender_uri
                     tender_doc = db.query(TenderDocumentsModel).filter(
-                        TenderDocumentsModel.tender_uri == tender_uri
+                        TenderDocumentsModel.tender_uri == tender_hash
                     ).first()
                 
-                # If a record exists, add its data to the tender details
-                if tender_doc:
-                    logger.info(f"Found TenderDocuments record for {tender_hash}")
-                    tender_detail.summary = tender_doc.summary
-                    tender_detail.url_document = tender_doc.url_document
-                    tender_detail.status = tender_doc.status
-                else:
-                    logger.info(f"No TenderDocuments record found for tender {tender_hash}")
-                    tender_detail.summary = None
-                    tender_detail.url_document = None
-                    # Leave status as None if not found - don't set a default here
+                    # If not found, try other potential formats
+                    if not tender_doc and '/' not in tender_id:
+                        # Try with full URI
+                        tender_doc = db.query(TenderDocumentsModel).filter(
+                            TenderDocumentsModel.tender_uri == tender_uri
+                        ).first()
+                
+                    # If a record exists, add its data to the tender details
+                    if tender_doc:
+                        logger.info(f"Found TenderDocuments record for {tender_hash}")
+                        tender_detail.summary = tender_doc.summary
+                        tender_detail.url_document = tender_doc.url_document
+                        tender_detail.status = tender_doc.status
+                    else:
+                        logger.info(f"No TenderDocuments record found for tender {tender_hash}")
+                        tender_detail.summary = None
+                        tender_detail.url_document = None
+                        # Leave status as None if not found - don't set a default here
+                    documents_loaded = True
                     
-        except Exception as e:
-            logger.error(f"Error retrieving TenderDocuments record: {str(e)}")
-            # Continue without the summary, url_document, or status
-            tender_detail.summary = None
-            tender_detail.url_document = None
-            # Don't set a default status here
+            except Exception as e:
+                logger.error(f"Error retrieving TenderDocuments record: {str(e)}")
+                # Continue without the summary, url_document, or status
+                tender_detail.summary = None
+                tender_detail.url_document = None
+                # Don't set a default status here
 
-        return tender_detail
+        # Only cache complete results (found in the graph, with every section and
+        # enriched from the database)
+        if tender_detail.uri and documents_loaded and not missing:
+            cache_tender_detail(tender_id, tender_detail, fields)
+
+        return tender_detail, missing
 
     except Exception as e:
         logger.error(f"Error retrieving tender {tender_id}: {str(e)}")
         raise
 
 
+async def _fetch_tender_detail(
+    neptune_client, tender_uri: str, fields: Optional[FrozenSet[str]] = None
+) -> Tuple[schemas.TenderDetail, List[str]]:
+    """
+    Fetch and parse one tender from the graph using the configured TENDER_DETAIL_MODE.
+
+    - fanout: 11 SELECT queries in parallel, parsed by tender_helpers.parse_tender_detail
+    - construct: one CONSTRUCT query, JSON-LD indexed in a single pass (tender_jsonld)
+    - graph: one CONSTRUCT query, loaded into an rdflib Graph (parse_tender_from_graph)
+
+    Sparse requests (fields is not None) always use the fan-out path with only
+    the subqueries the requested fields need.
+
+    With TENDER_DETAIL_INLINE_ITEMS, only the first lots and documents are
+    loaded (paged in SPARQL) together with their totals; the rest is served by
+    get_tender_lots_page and get_tender_documents_page.
+
+    Each named query has its TENDER_DETAIL_SECTION_DEADLINES deadline; the
+    fields of the queries that miss it (or fail) are returned as missing.
+
+    Returns:
+        Tuple[TenderDetail, List[str]]: The tender and its missing fields
+    """
+    mode = settings.TENDER_DETAIL_MODE
+    inline_items = settings.TENDER_DETAIL_INLINE_ITEMS
+    # Validated at startup and parsed once per value (the parsed dict is shared)
+    section_deadlines = parse_section_deadlines(settings.TENDER_DETAIL_SECTION_DEADLINES)
+    default_deadline = section_deadlines.get("*")
+    deadlines = {name: seconds for name, seconds in section_deadlines.items() if name != "*"}
+
+    if fields is None and mode in ("construct", "graph"):
+        page_queries = []
+        page_results = {}
+        if inline_items > 0:
+            page_queries = build_lots_page_queries(tender_uri, inline_items) + build_documents_page_queries(tender_uri, inline_items)
+            document, page_results = await asyncio.gather(
+                neptune_client.execute_sparql_query_async(
+                    build_tender_subgraph_query([tender_uri], exclude_paged=True), query_name="tender_subgraph"
+                ),
+                neptune_client.execute_named_sparql_queries_parallel(page_queries, deadlines, default_deadline)
+            )
+        else:
+            document = await neptune_client.execute_sparql_query_async(
+                build_tender_subgraph_query([tender_uri]), query_name="tender_subgraph"
+            )
+
+        if mode == "construct":
+            tender_detail = parse_tender_from_jsonld(document, tender_uri)
+        else:
+            g = Graph().parse(data=json.dumps(document), format="json-ld")
+            if (URIRef(tender_uri), None, None) not in g:
+                return schemas.TenderDetail(uri="", title=""), []
+            tender_detail = parse_tender_from_graph(g, URIRef(tender_uri))
+
+        if not page_queries or not tender_detail.uri:
+            return tender_detail, []
+        missing = missing_fields(name for name, _ in page_queries if name not in page_results)
+        return schemas.TenderDetail.model_validate({**dict(tender_detail), **parse_inline_pages(page_results)}), missing
+
+    if inline_items > 0:
+        queries = build_tender_detail_page_queries(tender_uri, inline_items, detail_query_names(fields))
+    else:
+        queries = build_tender_detail_queries([tender_uri], detail_query_names(fields))
+    named_results = await neptune_client.execute_named_sparql_queries_parallel(queries, deadlines, default_deadline)
+
+    missing_queries = [name for name, _ in queries if name not in named_results]
+    if "core" in missing_queries:
+        # Without the core section there is no tender to return
+        raise ServiceUnavailableError(f"Tender {tender_uri} could not be loaded in time", retry_after=1)
+    if missing_queries:
+        logger.warning(f"Partial tender detail for {tender_uri}: missing {', '.join(missing_queries)}")
+    return parse_tender_detail(named_results), missing_fields(missing_queries)
+
+
+async def _fetch_tender_page(tender_id: str, named_queries, count_name: str, count_variable: str):
+    """
+    Run the page and count queries of a lots/documents page.
+
+    Returns:
+        Tuple[Dict, int]: The named results and the total
+
+    Raises:
+        ValueError: If the tender is not found
+    """
+    neptune_client = get_neptune_client()
+    named_results = await neptune_client.execute_named_sparql_queries_parallel(named_queries)
+    if len(named_results) < len(named_queries):
+        raise RuntimeError(f"Could not load the page of tender {tender_id}")
+
+    total = result_count(named_results[count_name], count_variable)
+    if total is None:
+        raise ValueError(f"Tender {tender_id} not found")
+    return named_results, total
+
+
+async def get_tender_lots_page(tender_id: str, limit: int, offset: int = 0) -> schemas.TenderLotsPage:
+    """
+    Fetch one page of the lots of a tender, paged in SPARQL.
+
+    Args:
+        tender_id: The URI or hash identifier of the tender
+        limit: Lots per page
+        offset: Lots to skip
+
+    Returns:
+        TenderLotsPage: The lots of the page and the total number of lots
+
+    Raises:
+        ValueError: If the tender is not found
+    """
+    tender_uri = tender_id if tender_id.startswith('http') else f"http://gober.ai/spain/procedure/{tender_id}"
+    named_results, total = await _fetch_tender_page(
+        tender_id, build_lots_page_queries(tender_uri, limit, offset), "lot_count", "lotCount"
+    )
+    return schemas.TenderLotsPage(
+        items=parse_inline_pages(named_results)["lots"],
+        total=total,
+        limit=limit,
+        offset=offset
+    )
+
+
+async def get_tender_documents_page(tender_id: str, limit: int, offset: int = 0) -> schemas.TenderDocumentsPage:
+    """
+    Fetch one page of the procurement documents of a tender, paged in SPARQL.
+
+    Documents are ordered legal, technical, additional.
+
+    Args:
+        tender_id: The URI or hash identifier of the tender
+        limit: Documents per page
+        offset: Documents to skip
+
+    Returns:
+        TenderDocumentsPage: The documents of the page and the total number of documents
+
+    Raises:
+        ValueError: If the tender is not found
+    """
+    tender_uri = tender_id if tender_id.startswith('http') else f"http://gober.ai/spain/procedure/{tender_id}"
+    named_results, total = await _fetch_tender_page(
+        tender_id, build_documents_page_queries(tender_uri, limit, offset), "document_count", "documentCount"
+    )
+    return schemas.TenderDocumentsPage(
+        items=parse_inline_pages(named_results)["procurement_documents"],
+        total=total,
+        limit=limit,
+        offset=offset
+    )
+
+
+async def get_tender_details_batch(tender_ids: List[str]) -> schemas.TenderBatchResponse:
+    """
+    Fetch the details of several tenders with multi-URI SPARQL queries.
+
+    The tenders are queried in chunks of TENDER_BATCH_CHUNK_SIZE URIs, so N
+    tenders cost 11 queries per chunk instead of 11 per tender. Cached
+    details are reused and TenderDocuments rows are loaded in one query.
+
+    Args:
+        tender_ids: URIs or hash identifiers of the tenders to retrieve
+
+    Returns:
+        TenderBatchResponse: The found tenders (in request order) and the IDs that were not found
+    """
+    # Normalize to full URIs, dropping duplicates but keeping the request order
+    tender_uris: Dict[str, str] = {}
+    for tender_id in tender_ids:
+        tender_uri = tender_id if tender_id.startswith('http') else f"http://gober.ai/spain/procedure/{tender_id}"
+        tender_uris.setdefault(tender_id, tender_uri)
+
+    details: Dict[str, schemas.TenderDetail] = {}
+    missing_uris = []
+    for tender_uri in dict.fromkeys(tender_uris.values()):
+        cached_detail = get_cached_tender_detail(tender_uri)
+        if cached_detail is not None:
+            details[tender_uri] = cached_detail
+        else:
+            missing_uris.append(tender_uri)
+
+    logger.info(f"Batch tender detail: {len(tender_uris)} requested, {len(details)} cached, {len(missing_uris)} to fetch")
+
+    if missing_uris:
+        neptune_client = get_neptune_client()
+        chunk_size = max(1, settings.TENDER_BATCH_CHUNK_SIZE)
+        fetched: Dict[str, schemas.TenderDetail] = {}
+        for i in range(0, len(missing_uris), chunk_size):
+            chunk = missing_uris[i:i + chunk_size]
+            if settings.TENDER_DETAIL_MODE == "construct":
+                index = index_jsonld(await neptune_client.execute_sparql_query_async(
+                    build_tender_subgraph_query(chunk), query_name="tender_subgraph_batch"
+                ))
+                for tender_uri in chunk:
+                    tender_detail = parse_tender_from_index(index, tender_uri)
+                    if tender_detail.uri:
+                        fetched[tender_uri] = tender_detail
+            else:
+                named_results = await neptune_client.execute_named_sparql_queries_parallel(
+                    build_tender_detail_queries(chunk)
+                )
+                fetched.update(parse_tender_details(named_results))
+
+        documents_loaded = False
+        try:
+            # TenderDocuments rows are keyed by hash, older rows by full URI
+            lookup_keys = [uri.split('/')[-1] for uri in fetched] + list(fetched)
+            with Session(engine) as db:
+                tender_docs = db.query(TenderDocumentsModel).filter(
+                    TenderDocumentsModel.tender_uri.in_(lookup_keys)
+                ).all() if lookup_keys else []
+            docs_by_key = {doc.tender_uri: doc for doc in tender_docs}
+
+            for tender_uri, tender_detail in fetched.items():
+                tender_doc = docs_by_key.get(tender_uri.split('/')[-1]) or docs_by_key.get(tender_uri)
+                if tender_doc:
+                    tender_detail.summary = tender_doc.summary
+                    tender_detail.url_document = tender_doc.url_document
+                    tender_detail.status = tender_doc.status
+            documents_loaded = True
+        except Exception as e:
+            logger.error(f"Error retrieving TenderDocuments records for batch: {str(e)}")
+
+        for tender_uri, tender_detail in fetched.items():
+            if documents_loaded:
+                cache_tender_detail(tender_uri, tender_detail)
+            details[tender_uri] = tender_detail
+
+    items = []
+    not_found = []
+    seen = set()
+    for tender_id, tender_uri in tender_uris.items():
+        if tender_uri in details:
+            if tender_uri not in seen:
+                items.append(details[tender_uri])
+                seen.add(tender_uri)
+        else:
+            not_found.append(tender_id)
+
+    return schemas.TenderBatchResponse(items=items, not_found=not_found)
+
+
 def parse_tender_from_graph(g: Graph, tender_uri: URIRef) -> schemas.TenderDetail:
     """
     Parse the RDF graph into a TenderDetail Pydantic object
@@ -475,6 +758,8 @@ def save_tender_for_user(db: Session, tender_data: schemas.UserTenderCreate):
         db.add(user_tender)
         db.commit()
         db.refresh(user_tender)
+        # Keep the saved_by field of the search document in sync
+        sync_saved_by(db, tender_data.tender_uri)
 
         # Return the schema
         return schemas.UserTender(
@@ -546,6 +831,7 @@ def unsave_tender_for_user(db: Session, user_id: str, tender_uri: str) -> bool:
         # Delete the record
         db.delete(user_tender)
         db.commit()
+        sync_saved_by(db, tender_uri)
 
         logger.info(f"Successfully deleted tender {tender_id} for user {user_id}")
         return True
@@ -609,6 +895,31 @@ def get_user_saved_tenders_uris(db: Session, user_id: str) -> List[str]:
         # Return empty list in case of error to avoid breaking the search
         return []
 
+def get_tender_statuses(db: Session, tender_ids: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Get the document processing status of several tenders with one query.
+
+    Args:
+        db: SQLAlchemy Session
+        tender_ids: Tender hashes (search document ids)
+
+    Returns:
+        Dict[str, Optional[str]]: Status per tender hash, for the tenders that have documents
+    """
+    if not tender_ids:
+        return {}
+    try:
+        stmt = (
+            select(TenderDocumentsModel.tender_uri, TenderDocumentsModel.status)
+            .where(TenderDocumentsModel.tender_uri.in_(tender_ids))
+        )
+        statuses = {tender_uri: status for tender_uri, status in db.execute(stmt).fetchall()}
+        logger.debug(f"Found statuses for {len(statuses)} tenders")
+        return statuses
+    except Exception as e:
+        logger.error(f"Error retrieving tender statuses: {str(e)}")
+        return {}
+
 async def create_or_update_tender_summary(tender_uri: str, summary: str) -> schemas.TenderSummary:
     """
     Create or update a summary for a tender.
@@ -638,6 +949,7 @@ async def create_or_update_tender_summary(tender_uri: str, summary: str) -> sche
             existing_summary.updated_at = datetime.now()
             await session.commit()
             await session.refresh(existing_summary)
+            invalidate_tender_detail(tender_uri)
 
             return schemas.TenderSummary(
                 id=existing_summary.id,
@@ -657,6 +969,7 @@ async def create_or_update_tender_summary(tender_uri: str, summary: str) -> sche
             session.add(new_summary)
             await session.commit()
             await session.refresh(new_summary)
+            invalidate_tender_detail(tender_uri)
 
             return schemas.TenderSummary(
                 id=new_summary.id,
@@ -712,7 +1025,7 @@ def parse_sparql_binding_to_tender_preview(binding: Dict[str, Any]) -> schemas.T
         try:
             amount = float(binding['baseBudgetAmount']['value'])
             currency = binding['baseBudgetCurrency']['value']
-            budget = schemas.MonetaryValue(amount=amount, currency=currency)
+            budget = nested_model(schemas.MonetaryValue, amount=amount, currency=currency)
         except (ValueError, KeyError, TypeError):
             pass
 
@@ -762,26 +1075,33 @@ def parse_sparql_binding_to_tender_preview(binding: Dict[str, Any]) -> schemas.T
         status=status
     )
 
-async def get_tenders_paginated(page: int = 1, size: int = 10) -> schemas.PaginatedTenderResponse:
+async def get_tenders_paginated(size: int = 10, cursor: Optional[str] = None) -> schemas.PaginatedTenderResponse:
     """
-    Fetch a paginated list of tenders from the Neptune RDF database.
+    Fetch a page of tenders from the Neptune RDF database, newest submission date first.
+
+    Uses keyset pagination on (submissionDate, procedure): the cursor encodes
+    the last row of the previous page, so deep pages cost the same as the first one.
 
     Args:
-        page: The page number (1-based)
         size: The number of items per page
+        cursor: Opaque cursor returned as next_cursor by the previous page (None for the first page)
 
     Returns:
-        PaginatedTenderResponse: A paginated list of tender previews
+        PaginatedTenderResponse: A page of tender previews and the cursor of the next page.
+            total is None until the background tender count has been computed once
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
     """
-    logger.info(f"Fetching tenders page {page} with size {size}")
+    logger.info(f"Fetching tenders page with size {size} (cursor: {'yes' if cursor else 'no'})")
+
+    # Validates the cursor before touching Neptune
+    keyset_filter = build_keyset_filter(cursor)
 
     # Get Neptune client
     neptune_client = get_neptune_client()
 
-    # Calculate offset
-    offset = (page - 1) * size
-
-    # Define the SPARQL query to get tenders with pagination and sorting by submission deadline
+    # Define the SPARQL query to get tenders with keyset pagination and sorting by submission deadline
     # This query retrieves tender previews with all the fields we need for the listing
     query = f"""
     PREFIX dcterms: <http://purl.org/dc/terms/>
@@ -817,6 +1137,9 @@ async def get_tenders_paginated(page: int = 1, size: int = 10) -> schemas.Pagina
                         ns1:hasReceiptDeadline ?submissionDate .
     }}
 
+    # Posición tras el cursor (keyset)
+    {keyset_filter}
+
     # Número de lotes
     OPTIONAL {{
         ?procedure ns1:hasProcurementScopeDividedIntoLot ?lot .
@@ -853,40 +1176,36 @@ async def get_tenders_paginated(page: int = 1, size: int = 10) -> schemas.Pagina
     }}
     }}
     GROUP BY ?procedure ?id ?title ?description ?submissionDate ?orgName ?baseBudgetAmount ?baseBudgetCurrency ?locationName ?contractType
-    ORDER BY DESC(?submissionDate)
-    LIMIT {size}
-    OFFSET {offset}
-    """
-
-    # Query to get the total count
-    count_query = """
-    PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-    PREFIX epo: <http://data.europa.eu/a4g/ontology#>
-
-    SELECT (COUNT(DISTINCT ?procedure) AS ?total)
-    WHERE {
-      ?procedure rdf:type epo:ProcurementProject .
-    }
+    ORDER BY DESC(?submissionDate) DESC(?procedure)
+    LIMIT {size + 1}
     """
 
     try:
-        # Execute the main query
-        results = neptune_client.execute_sparql_query(query)
+        # Execute the page query on the async client
+        results = await neptune_client.execute_sparql_query_async(query, query_name="tender_listing")
+
+        # The total comes from the background-refreshed count, never from a COUNT per request
+        # (None, not 0, until its first refresh succeeds)
+        total_count = tender_count_cache.get()
 
         if not results or 'results' not in results or 'bindings' not in results['results']:
             logger.warning("No results found or unexpected response format")
             return schemas.PaginatedTenderResponse(
                 items=[],
-                total=0,
-                page=page,
+                total=total_count,
                 size=size,
                 has_next=False,
-                has_prev=(page > 1)
+                has_prev=cursor is not None
             )
 
+        # One extra row was requested to know whether there is a next page
+        bindings = results['results']['bindings']
+        has_next = len(bindings) > size
+        bindings = bindings[:size]
+
         # Parse the results into TenderPreview objects
         tenders = []
-        for binding in results['results']['bindings']:
+        for binding in bindings:
             try:
                 tender = parse_sparql_binding_to_tender_preview(binding)
                 tenders.append(tender)
@@ -895,27 +1214,13 @@ async def get_tenders_paginated(page: int = 1, size: int = 10) -> schemas.Pagina
                 # Continue with the next tender instead of failing the whole request
                 continue
 
-        # Execute the count query for pagination
-        count_result = neptune_client.execute_sparql_query(count_query)
-        total_count = 0
-
-        if count_result and 'results' in count_result and 'bindings' in count_result['results']:
-            try:
-                total_count = int(count_result['results']['bindings'][0]['total']['value'])
-            except (KeyError, ValueError, IndexError):
-                logger.warning("Could not parse total count from query result")
-
-        # Calculate pagination information
-        has_next = (page * size) < total_count
-        has_prev = page > 1
-
         return schemas.PaginatedTenderResponse(
             items=tenders,
             total=total_count,
-            page=page,
             size=size,
             has_next=has_next,
-            has_prev=has_prev
+            has_prev=cursor is not None,
+            next_cursor=encode_listing_cursor(bindings[-1]) if has_next else None
         )
 
     except Exception as e:
@@ -1027,7 +1332,7 @@ async def get_tender_preview(tender_id: str) -> schemas.TenderPreview:
 
     try:
         # Execute the query
-        results = neptune_client.execute_sparql_query(query)
+        results = neptune_client.execute_sparql_query(query, query_name="tender_preview")
 
         if not results or 'results' not in results or 'bindings' not in results['results'] or len(results['results']['bindings']) == 0:
             logger.warning(f"Tender not found: {tender_uri}")
@@ -1201,7 +1506,7 @@ async def get_tender_documents(tender_id: str) -> schemas.TenderDocuments:
 
     try:
         # Execute the query
-        results = neptune_client.execute_sparql_query(query)
+        results = neptune_client.execute_sparql_query(query, query_name="tender_documents")
 
         if not results or 'results' not in results or 'bindings' not in results['results'] or len(results['results']['bindings']) == 0:
             logger.warning(f"Tender not found: {tender_uri}")
@@ -1371,6 +1676,8 @@ async def get_ai_tender_documents(tender_id: str, db: Session) -> schemas.Tender
             combined_chunks=chunks_content
         )
 
+    except ServiceUnavailableError:
+        raise
     except Exception as e:
         logger.error(f"Error retrieving AI tender documents: {str(e)}")
         raise ValueError(f"Error retrieving AI tender documents: {str(e)}")
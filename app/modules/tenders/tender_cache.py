@@ -0,0 +1,93 @@
+import json
+import logging
+from typing import FrozenSet, Optional
+from app.core.config import settings
+from app.core.utils.cache import ResultCache, RedisCacheBackend
+from app.modules.tenders.schemas import TenderDetail
+
+logger = logging.getLogger(__name__)
+
+
+def _build_backend():
+    """Create the shared write-through backend if one is configured."""
+    if not settings.CACHE_REDIS_URL:
+        return None
+    try:
+        return RedisCacheBackend(settings.CACHE_REDIS_URL)
+    except Exception as e:
+        logger.error(f"Could not initialize shared cache backend, using in-process cache only: {str(e)}")
+        return None
+
+
+# Parsed TenderDetail objects (SPARQL data + TenderDocuments row)
+tender_detail_cache = ResultCache(
+    name="tender_detail",
+    maxsize=settings.TENDER_DETAIL_CACHE_SIZE,
+    ttl=settings.TENDER_DETAIL_CACHE_TTL,
+    backend=_build_backend(),
+    serializer=lambda detail: detail.model_dump_json().encode("utf-8"),
+    deserializer=TenderDetail.model_validate_json,
+    enabled=settings.TENDER_DETAIL_CACHE_ENABLED
+)
+
+
+# Field-set keys cached for each tender (see cache_tender_detail), so that
+# invalidation can drop every sparse variant of a tender, in every worker
+tender_detail_variants_cache = ResultCache(
+    name="tender_detail_variants",
+    maxsize=settings.TENDER_DETAIL_CACHE_SIZE,
+    ttl=settings.TENDER_DETAIL_CACHE_TTL,
+    backend=tender_detail_cache.backend,
+    serializer=lambda keys: json.dumps(sorted(keys)).encode("utf-8"),
+    deserializer=lambda raw: frozenset(json.loads(raw)),
+    enabled=settings.TENDER_DETAIL_CACHE_ENABLED
+)
+
+
+def tender_cache_key(tender_id: str, fields: Optional[FrozenSet[str]] = None) -> str:
+    """
+    Normalize a tender URI or hash to the key used by the tender caches.
+
+    Args:
+        tender_id: The URI or hash identifier of the tender
+        fields: Requested field set (see fieldsets.parse_detail_fields); None for the full detail
+
+    Returns:
+        str: The tender hash, followed by the sorted field set for sparse details
+    """
+    key = tender_id.rstrip("/").split("/")[-1]
+    if fields is not None:
+        key += "?fields=" + ",".join(sorted(fields))
+    return key
+
+
+def get_cached_tender_detail(tender_id: str, fields: Optional[FrozenSet[str]] = None) -> Optional[TenderDetail]:
+    """Return the cached TenderDetail for a tender (and field set), or None on a miss."""
+    return tender_detail_cache.get(tender_cache_key(tender_id, fields))
+
+
+def cache_tender_detail(tender_id: str, tender_detail: TenderDetail, fields: Optional[FrozenSet[str]] = None) -> None:
+    """Store a TenderDetail in the cache, registering sparse field sets for invalidation."""
+    key = tender_cache_key(tender_id, fields)
+    if fields is not None:
+        tender_key = tender_cache_key(tender_id)
+        variants = tender_detail_variants_cache.get(tender_key) or frozenset()
+        if key not in variants:
+            tender_detail_variants_cache.set(tender_key, variants | {key})
+    tender_detail_cache.set(key, tender_detail)
+
+
+def invalidate_tender_detail(tender_id: str) -> None:
+    """
+    Drop the cached detail of a tender, including every sparse field-set variant.
+
+    Must be called whenever the TenderDocuments row of the tender changes
+    (status, summary or AI document path), since those fields are part of
+    the cached TenderDetail.
+    """
+    logger.debug(f"Invalidating cached tender detail for {tender_id}")
+    tender_key = tender_cache_key(tender_id)
+    for key in tender_detail_variants_cache.get(tender_key) or ():
+        tender_detail_cache.invalidate(key)
+    tender_detail_variants_cache.invalidate(tender_key)
+    tender_detail_cache.invalidate(tender_key)
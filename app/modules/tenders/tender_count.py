@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.database import get_neptune_client
+
+logger = logging.getLogger(__name__)
+
+# Full-graph count: only ever run by the background refresher, never by a listing request
+count_query = """
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX epo: <http://data.europa.eu/a4g/ontology#>
+
+SELECT (COUNT(DISTINCT ?procedure) AS ?total)
+WHERE {
+  ?procedure rdf:type epo:ProcurementProject .
+}
+"""
+
+
+class TenderCountCache:
+    """
+    Materialized total number of tenders in the graph.
+
+    The value is refreshed by a background task every `refresh_interval`
+    seconds, or shortly after ingestion calls mark_stale(). Readers get the
+    last known value immediately and never wait for the COUNT query.
+    """
+
+    def __init__(self, refresh_interval: float = 600, debounce: float = 5):
+        """
+        Initialize the cache.
+
+        Args:
+            refresh_interval (float): Seconds between periodic refreshes
+            debounce (float): Seconds to wait after a change signal, so a burst
+                of ingestion calls triggers a single refresh
+        """
+        self.refresh_interval = refresh_interval
+        self.debounce = debounce
+        self._value: Optional[int] = None
+        self._updated_at: Optional[float] = None
+        self._refreshes = 0
+        self._errors = 0
+        self._changed: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self) -> Optional[int]:
+        """Return the last known total, or None if it has not been computed yet."""
+        return self._value
+
+    def mark_stale(self) -> None:
+        """
+        Signal that tenders were added or removed. Safe to call from any thread.
+        """
+        if self._loop is None or self._changed is None:
+            return
+        self._loop.call_soon_threadsafe(self._changed.set)
+
+    async def refresh(self) -> Optional[int]:
+        """Run the COUNT query and store the result."""
+        try:
+            result = await get_neptune_client().execute_sparql_query_async(count_query, query_name="tender_count")
+            self._value = int(result['results']['bindings'][0]['total']['value'])
+            self._updated_at = time.time()
+            self._refreshes += 1
+            logger.info(f"Tender count refreshed: {self._value}")
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Error refreshing tender count: {str(e)}")
+        return self._value
+
+    async def _refresher(self) -> None:
+        while True:
+            await self.refresh()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.refresh_interval)
+                # Let the ingestion burst settle before counting again
+                await asyncio.sleep(self.debounce)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+
+    async def start(self) -> None:
+        """Start the background refresher (the first count runs immediately in the background)."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._refresher())
+
+    async def close(self) -> None:
+        """Stop the background refresher."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current value and refresh counters."""
+        return {
+            "value": self._value,
+            "updated_at": self._updated_at,
+            "refreshes": self._refreshes,
+            "errors": self._errors,
+            "refresh_interval": self.refresh_interval
+        }
+
+
+tender_count_cache = TenderCountCache(
+    refresh_interval=settings.TENDER_COUNT_REFRESH_INTERVAL,
+    debounce=settings.TENDER_COUNT_DEBOUNCE
+)
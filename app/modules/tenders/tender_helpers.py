@@ -1,11 +1,32 @@
 
 import logging
-from typing import Dict, Any, Callable, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Type, TypeVar, Union
 from datetime import datetime
+from pydantic import BaseModel
+from app.core.config import settings
 from app.modules.tenders.schemas import MonetaryValue, Lot, TenderDetail, Identifier, Purpose, SubmissionTerm, ContractTerm, Location, ProcurementDocument, Organization, Address
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def nested_model(model_cls: Type[ModelT], **fields: Any) -> Union[ModelT, Dict[str, Any]]:
+    """
+    Build a nested schema object (lot, document, monetary value...) of a parsed tender.
+
+    With TENDER_TRUSTED_MODELS the fields are returned as a plain dict and the
+    whole tree is validated once, in pydantic-core, when the root model
+    (TenderDetail, TenderPreview) is created. This is much cheaper than one
+    Python-level constructor call per lot and document (model_construct is
+    slower still). In DEBUG mode, or when the setting is off (as in the test
+    suite), every object is validated where it is built so errors point at
+    the mapper that produced them.
+    """
+    if settings.TENDER_TRUSTED_MODELS and not settings.DEBUG:
+        return fields
+    return model_cls(**fields)
+
 
 def core_mapping():
     core_mapping = {
@@ -88,7 +109,7 @@ def map_monetary_value(row: Dict[str, Any], value_field: str, currency_field: st
     if value_str and currency:
         try:
             amount = float(value_str)
-            return MonetaryValue(amount=amount, currency=currency)
+            return nested_model(MonetaryValue, amount=amount, currency=currency)
         except ValueError:
             return None
     return None
@@ -108,7 +129,7 @@ def map_purpose(row: Dict[str, Any]) -> Optional[Purpose]:
             additional_classifications = []
     
     if len(main_classifications) > 0:
-        return Purpose(main_classifications=main_classifications, additional_classifications=additional_classifications)
+        return nested_model(Purpose, main_classifications=main_classifications, additional_classifications=additional_classifications)
     return None
 
 def map_contract_term(row: Dict[str, Any]) -> Optional[ContractTerm]:
@@ -128,13 +149,13 @@ def map_contract_term(row: Dict[str, Any]) -> Optional[ContractTerm]:
     thoroughfare = row.get("thoroughfare", {}).get("value")
     
         
-    return ContractTerm(
+    return nested_model(ContractTerm,
                         contract_nature_type=contract_nature_type.split("/")[-1], 
                         additional_contract_nature=additional_contract_nature.split("/")[-1] if additional_contract_nature else None, 
-                        place_of_performance=Location(
+                        place_of_performance=nested_model(Location,
                             country_code=country_code.split("/")[-1],
                             nuts_code=nuts_code.split("/")[-1],
-                            address=Address(
+                            address=nested_model(Address,
                                 country=country,
                                 nuts_code=nuts_code.split("/")[-1],
                                 admin_unit=province,
@@ -156,7 +177,7 @@ def map_submission_deadline(row: Dict[str, Any]) -> Optional[SubmissionTerm]:
     if receipt_deadline:
         try:
             receipt_deadline = datetime.strptime(receipt_deadline, "%Y-%m-%dT%H:%M:%S.%fZ")
-            return SubmissionTerm(receipt_deadline=receipt_deadline, language=language)
+            return nested_model(SubmissionTerm, receipt_deadline=receipt_deadline, language=language)
         except ValueError:
             logger.error(f"Failed to parse receipt deadline: {receipt_deadline}")
             return None
@@ -171,7 +192,7 @@ def map_lots(row: Dict[str, Any], separator: str = "||") -> List[Lot]:
         row (Dict[str, Any]): The binding row to map.
     """
     
-    if len(row) <= 1:
+    if not row:
         return []
     
     lots = []
@@ -180,17 +201,13 @@ def map_lots(row: Dict[str, Any], separator: str = "||") -> List[Lot]:
         lot_title = r.get("lotTitle", {}).get("value")
         lot_description = r.get("lotDesc", {}).get("value")
         lot_estimated = r.get("lotEstimated", {}).get("value")
-        lot_gross = r.get("lotGross", {}).get("value")
-        lot_net = r.get("lotNet", {}).get("value")
         
         if lot_id and lot_title:
-            lots.append(Lot(
+            lots.append(nested_model(Lot,
                 id=lot_id,
                 title=lot_title,
                 description=lot_description,
-                estimated_value=MonetaryValue(amount=lot_estimated, currency="EUR") if lot_estimated else None,
-                gross_value=MonetaryValue(amount=lot_gross, currency="EUR") if lot_gross else None,
-                net_value=MonetaryValue(amount=lot_net, currency="EUR") if lot_net else None
+                estimated_value=nested_model(MonetaryValue, amount=float(lot_estimated), currency="EUR") if lot_estimated else None
         ))
         
     return lots
@@ -211,7 +228,7 @@ def map_documents(row: Dict[str, Any], document_type: str) -> List[ProcurementDo
         
         if len(titles) == len(access_urls):
             for title, access_url in zip(titles, access_urls):
-                results.append(ProcurementDocument(
+                results.append(nested_model(ProcurementDocument,
                     title=title,
                     document_type=document_type,
                     access_url=access_url))
@@ -228,7 +245,7 @@ def map_documents(row: Dict[str, Any], document_type: str) -> List[ProcurementDo
         access_url = row.get(url_access, {}).get("value")
         
         if title and access_url:
-            return [ProcurementDocument(
+            return [nested_model(ProcurementDocument,
                 title=title,
                 document_type=document_type,
                 access_url=access_url
@@ -237,6 +254,54 @@ def map_documents(row: Dict[str, Any], document_type: str) -> List[ProcurementDo
             return []
 
 
+def map_document_rows(rows: List[Dict[str, Any]]) -> List[ProcurementDocument]:
+    """
+    Map the rows of a documents page query (one row per document) to ProcurementDocument objects.
+    """
+    return [
+        nested_model(ProcurementDocument,
+            title=r["title"]["value"],
+            document_type=r["documentType"]["value"],
+            access_url=r["accessUrl"]["value"]
+        )
+        for r in rows
+        if "title" in r and "accessUrl" in r and "documentType" in r
+    ]
+
+
+def result_count(result: Optional[Dict[str, Any]], variable: str) -> Optional[int]:
+    """
+    Read a COUNT from a count query result.
+
+    Returns:
+        Optional[int]: The count, or None when the result has no row (unknown procedure)
+    """
+    bindings = (result or {}).get("results", {}).get("bindings", [])
+    if not bindings or variable not in bindings[0]:
+        return None
+    return int(bindings[0][variable]["value"])
+
+
+def parse_inline_pages(named_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map the lots/documents page and count results of a query batch
+    (see queries_tender_detail.build_tender_detail_page_queries) to TenderDetail fields.
+    Only the fields whose query is present are returned.
+    """
+    fields: Dict[str, Any] = {}
+    if "lots" in named_results:
+        fields["lots"] = map_lots(named_results["lots"].get("results", {}).get("bindings", []))
+    if "documents" in named_results:
+        fields["procurement_documents"] = map_document_rows(
+            named_results["documents"].get("results", {}).get("bindings", [])
+        )
+    if "lot_count" in named_results:
+        fields["lot_count"] = result_count(named_results["lot_count"], "lotCount")
+    if "document_count" in named_results:
+        fields["document_count"] = result_count(named_results["document_count"], "documentCount")
+    return fields
+
+
 def map_binding_row(row: Dict[str, Any], mapping_config: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
     Map a binding row to a dictionary using the provided mapping configuration.
@@ -327,6 +392,9 @@ def parse_tender_detail(named_results: Dict[str, Any]) -> TenderDetail:
     
     # Map documents
     documents = []
+    if "documents" in named_results:
+        # First page only (build_tender_detail_page_queries)
+        documents = map_document_rows(named_results["documents"].get("results", {}).get("bindings", []))
     if legal_documents_data:
         documents.extend(map_documents(legal_documents_data[0], "legal"))
     if technical_documents_data:
@@ -337,7 +405,7 @@ def parse_tender_detail(named_results: Dict[str, Any]) -> TenderDetail:
 
     tender_detail = TenderDetail(
         uri=procedure_uri or "",
-        identifier=Identifier(notation=notation_id) if notation_id else None,
+        identifier=nested_model(Identifier, notation=notation_id) if notation_id else None,
         title=mapped_core.get("title") or "",
         description=mapped_core.get("description"),
         summary=None,
@@ -353,7 +421,39 @@ def parse_tender_detail(named_results: Dict[str, Any]) -> TenderDetail:
         additional_information=mapped_core.get("additional_information"),
         status=None,
         procurement_documents=documents,
-        lots=lots
+        lots=lots,
+        lot_count=result_count(named_results.get("lot_count"), "lotCount"),
+        document_count=result_count(named_results.get("document_count"), "documentCount")
     )
     
     return tender_detail
+
+
+def group_named_results_by_procedure(named_results: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split the named results of a multi-tender query batch into one
+    named_results dict per procedure URI, keyed by that URI.
+    """
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for name, result in named_results.items():
+        bindings = (result or {}).get("results", {}).get("bindings", [])
+        for row in bindings:
+            procedure_uri = row.get("procedure", {}).get("value")
+            if not procedure_uri:
+                continue
+            tender_results = grouped.setdefault(procedure_uri, {})
+            tender_results.setdefault(name, {"results": {"bindings": []}})["results"]["bindings"].append(row)
+    return grouped
+
+
+def parse_tender_details(named_results: Dict[str, Any]) -> Dict[str, TenderDetail]:
+    """
+    Parse the named results of a multi-tender query batch into TenderDetail
+    objects keyed by procedure URI. Tenders without a core row are skipped.
+    """
+    tender_details = {}
+    for procedure_uri, tender_results in group_named_results_by_procedure(named_results).items():
+        tender_detail = parse_tender_detail(tender_results)
+        if tender_detail.uri:
+            tender_details[procedure_uri] = tender_detail
+    return tender_details
@@ -0,0 +1,281 @@
+import logging
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+from app.modules.tenders.schemas import MonetaryValue, Lot, TenderDetail, Identifier, Purpose, SubmissionTerm, ContractTerm, Location, ProcurementDocument, Organization, Address
+from app.modules.tenders.tender_helpers import nested_model
+
+logger = logging.getLogger(__name__)
+
+# subject -> predicate -> object values (IRIs and literal lexical forms alike)
+Index = Dict[str, Dict[str, List[str]]]
+
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+EPO = "http://data.europa.eu/a4g/ontology#"
+DCT = "http://purl.org/dc/terms/"
+LOCN = "http://www.w3.org/ns/locn#"
+M8G = "http://data.europa.eu/m8g/"
+ADMS = "http://www.w3.org/ns/adms#"
+SKOS = "http://www.w3.org/2004/02/skos/core#"
+AUTHORITY = "http://publications.europa.eu/ontology/authority/"
+
+
+def index_jsonld(document: Any) -> Index:
+    """
+    Index a JSON-LD document (as returned by Neptune for CONSTRUCT/DESCRIBE)
+    into a subject -> predicate -> objects dict in a single pass.
+
+    Accepts expanded or flattened JSON-LD: a list of node objects, a dict
+    with an "@graph" list, or a single node object. Nested node objects are
+    indexed as well and referenced by their "@id".
+    """
+    index: Index = {}
+
+    if isinstance(document, dict):
+        nodes = document.get("@graph", [document])
+    else:
+        nodes = document or []
+
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict) or "@id" not in node:
+            continue
+
+        properties = index.setdefault(node["@id"], {})
+        for key, values in node.items():
+            if key == "@id":
+                continue
+            if key == "@type":
+                properties.setdefault(RDF_TYPE, []).extend(values if isinstance(values, list) else [values])
+                continue
+            if key.startswith("@"):
+                continue
+
+            objects = properties.setdefault(key, [])
+            for value in values if isinstance(values, list) else [values]:
+                if isinstance(value, dict):
+                    if "@value" in value:
+                        objects.append(str(value["@value"]))
+                    elif "@id" in value:
+                        objects.append(value["@id"])
+                        if len(value) > 1:
+                            stack.append(value)
+                else:
+                    objects.append(str(value))
+
+    return index
+
+
+def _all(index: Index, subject: Optional[str], predicate: str) -> List[str]:
+    """Return every object of (subject, predicate)."""
+    if not subject:
+        return []
+    return index.get(subject, {}).get(predicate, [])
+
+
+def _first(index: Index, subject: Optional[str], predicate: str) -> Optional[str]:
+    """Return the first object of (subject, predicate), or None."""
+    values = _all(index, subject, predicate)
+    return values[0] if values else None
+
+
+def _has_type(index: Index, subject: str, type_uri: str) -> bool:
+    return type_uri in _all(index, subject, RDF_TYPE)
+
+
+def _last_segment(value: Optional[str]) -> Optional[str]:
+    return value.split("/")[-1] if value else None
+
+
+def _monetary_value(index: Index, value_node: str, default_currency: Optional[str] = None) -> Optional[MonetaryValue]:
+    amount = _first(index, value_node, EPO + "hasAmountValue")
+    currency = _first(index, value_node, AUTHORITY + "currency") or default_currency
+    if amount and currency:
+        try:
+            return nested_model(MonetaryValue, amount=float(amount), currency=currency)
+        except ValueError:
+            return None
+    return None
+
+
+def _map_buyer(index: Index, procedure: str) -> Optional[Organization]:
+    for buyer in _all(index, procedure, EPO + "involvesBuyer"):
+        if not _has_type(index, buyer, M8G + "PublicOrganisation"):
+            continue
+
+        legal_name = _first(index, buyer, EPO + "hasLegalName")
+        if not legal_name:
+            continue
+
+        tax_id = _first(index, _first(index, buyer, EPO + "hasTaxIdentifier"), SKOS + "notation")
+        legal_id = _first(index, _first(index, buyer, EPO + "hasLegalIdentifier"), SKOS + "notation")
+        address = _first(index, buyer, LOCN + "address")
+
+        return nested_model(Organization,
+            id=buyer.split("-")[-1],
+            legal_name=legal_name,
+            buyer_profile=_first(index, buyer, EPO + "hasBuyerProfile"),
+            tax_identifier=nested_model(Identifier, notation=tax_id) if tax_id else None,
+            legal_identifier=nested_model(Identifier, notation=legal_id) if legal_id else None,
+            address=nested_model(Address,
+                country=_first(index, address, EPO + "hasCountryCode"),
+                nuts_code=_first(index, address, EPO + "hasNutsCode"),
+                address_area=_first(index, address, LOCN + "addressArea"),
+                admin_unit=_first(index, address, LOCN + "adminUnitL1"),
+                post_code=_first(index, address, LOCN + "postCode"),
+                post_name=_first(index, address, LOCN + "postName"),
+                thoroughfare=_first(index, address, LOCN + "thoroughfare")
+            )
+        )
+    return None
+
+
+def _map_contract_term(index: Index, subject: str) -> Optional[ContractTerm]:
+    for term in _all(index, subject, EPO + "foreseesContractSpecificTerm"):
+        contract_type = _first(index, term, EPO + "hasContractNatureType")
+        if not contract_type:
+            continue
+
+        location = _first(index, term, EPO + "definesSpecificPlaceOfPerformance")
+        address = _first(index, location, LOCN + "address")
+        nuts_code = _last_segment(_first(index, location, EPO + "hasNutsCode"))
+
+        return nested_model(ContractTerm,
+            contract_nature_type=_last_segment(contract_type),
+            additional_contract_nature=_last_segment(_first(index, term, EPO + "hasAdditionalContractNature")),
+            place_of_performance=nested_model(Location,
+                country_code=_last_segment(_first(index, location, EPO + "hasCountryCode")),
+                nuts_code=nuts_code,
+                geographic_name=_first(index, location, DCT + "geographicName"),
+                address=nested_model(Address,
+                    country=_first(index, address, LOCN + "addressArea"),
+                    nuts_code=nuts_code,
+                    admin_unit=_first(index, address, LOCN + "adminUnitL1"),
+                    post_code=_first(index, address, LOCN + "postCode"),
+                    post_name=_first(index, address, LOCN + "postName"),
+                    thoroughfare=_first(index, address, LOCN + "thoroughfare")
+                ) if address else None
+            ) if location else None
+        )
+    return None
+
+
+def _map_submission_term(index: Index, procedure: str) -> Optional[SubmissionTerm]:
+    for term in _all(index, procedure, EPO + "isSubjectToProcedureSpecificTerm"):
+        if not _has_type(index, term, EPO + "SubmissionTerm"):
+            continue
+
+        deadline = _first(index, term, EPO + "hasReceiptDeadline")
+        if not deadline:
+            continue
+        try:
+            receipt_deadline = datetime.strptime(deadline, "%Y-%m-%dT%H:%M:%S.%fZ")
+        except ValueError:
+            logger.error(f"Failed to parse receipt deadline: {deadline}")
+            return None
+        return nested_model(SubmissionTerm, receipt_deadline=receipt_deadline, language=_first(index, term, EPO + "hasLanguage"))
+    return None
+
+
+def _map_documents(index: Index, procedure: str) -> List[ProcurementDocument]:
+    documents = {"legal": [], "technical": [], "adds": []}
+    for term in _all(index, procedure, EPO + "isSubjectToProcedureSpecificTerm"):
+        if "access-term/legal-document" in term:
+            document_type = "legal"
+        elif "access-term/technical-document" in term:
+            document_type = "technical"
+        elif "access-term/additional-document" in term:
+            document_type = "adds"
+        else:
+            continue
+
+        for document in _all(index, term, EPO + "involvesProcurementDocument"):
+            title = _first(index, document, DCT + "title")
+            access_url = _first(index, document, EPO + "hasAccessURL")
+            if title and access_url:
+                documents[document_type].append(nested_model(ProcurementDocument,
+                    title=title,
+                    document_type=document_type,
+                    access_url=access_url
+                ))
+
+    # Same order as the fan-out parser: legal, technical, additional
+    return documents["legal"] + documents["technical"] + documents["adds"]
+
+
+def _map_lots(index: Index, procedure: str) -> List[Lot]:
+    lots = []
+    for lot in _all(index, procedure, EPO + "hasProcurementScopeDividedIntoLot"):
+        title = _first(index, lot, DCT + "title")
+        if not title:
+            continue
+
+        estimated_value = None
+        for value_node in _all(index, lot, EPO + "hasEstimatedValue"):
+            estimated_value = _monetary_value(index, value_node, default_currency="EUR")
+            if estimated_value:
+                break
+
+        lots.append(nested_model(Lot,
+            id=lot.split("/")[-1],
+            title=title,
+            description=_first(index, lot, DCT + "description"),
+            estimated_value=estimated_value
+        ))
+    return lots
+
+
+def parse_tender_from_index(index: Index, procedure_uri: str) -> TenderDetail:
+    """
+    Build a TenderDetail for one procedure from an index produced by index_jsonld.
+
+    The result matches the fan-out parser (tender_helpers.parse_tender_detail),
+    and an unknown procedure yields a TenderDetail with an empty uri, except
+    for two known differences:
+        - every legal and technical document is returned, where fan-out keeps
+          only the first one of each;
+        - the place of performance has its geographic_name, which fan-out
+          leaves unset.
+    With the local backend (NEPTUNE_BACKEND=local) construct mode therefore
+    returns more than fan-out for tenders with several such documents.
+    """
+    if procedure_uri not in index:
+        return TenderDetail(uri="", title="")
+
+    estimated_value = net_value = gross_value = None
+    for value_node in _all(index, procedure_uri, EPO + "hasEstimatedValue"):
+        if value_node.endswith("estimated-overall-contract-amount"):
+            estimated_value = _monetary_value(index, value_node)
+        elif value_node.endswith("gross-value"):
+            gross_value = _monetary_value(index, value_node)
+        elif value_node.endswith("net-value"):
+            net_value = _monetary_value(index, value_node)
+
+    cpvs = [_last_segment(cpv)
+            for purpose in _all(index, procedure_uri, EPO + "hasPurpose")
+            for cpv in _all(index, purpose, EPO + "hasMainClassification")]
+    notation = _first(index, _first(index, procedure_uri, ADMS + "identifier"), SKOS + "notation")
+
+    return TenderDetail(
+        uri=procedure_uri.split("/")[-1],
+        identifier=nested_model(Identifier, notation=notation) if notation else None,
+        title=_first(index, procedure_uri, DCT + "title") or "",
+        description=_first(index, procedure_uri, DCT + "description"),
+        summary=None,
+        estimated_value=estimated_value,
+        net_value=net_value,
+        gross_value=gross_value,
+        submission_term=_map_submission_term(index, procedure_uri),
+        buyer=_map_buyer(index, procedure_uri),
+        purpose=nested_model(Purpose, main_classifications=cpvs) if cpvs else None,
+        contract_term=_map_contract_term(index, procedure_uri),
+        additional_information=_first(index, procedure_uri, EPO + "hasAdditionalInformation"),
+        status=None,
+        procurement_documents=_map_documents(index, procedure_uri),
+        lots=_map_lots(index, procedure_uri)
+    )
+
+
+def parse_tender_from_jsonld(document: Any, procedure_uri: str) -> TenderDetail:
+    """Index a CONSTRUCT JSON-LD response and build the TenderDetail of one procedure."""
+    return parse_tender_from_index(index_jsonld(document), procedure_uri)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Backfill the saved_by attribute of the tender search documents from the
+user_tenders table, so "saved tenders only" searches can filter on it
+(SEARCH_SAVED_BY_FILTER=True).
+
+The script makes saved_by filterable, writes the list of users of every saved
+tender that is indexed, and empties the saved_by lists of documents no longer
+saved by anyone. It is idempotent: run it again to repair documents whose sync
+failed while MeiliSearch was unavailable, and tenders saved before their first
+ingestion (ingestion preserves saved_by but does not derive it).
+
+Usage:
+    python scripts/backfill_saved_by.py [--batch-size 500] [--dry-run]
+"""
+
+import os
+import sys
+import argparse
+import logging
+from sqlalchemy import select
+
+# Add the project root directory to Python's path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.core.utils.meili import MeiliClient
+from app.modules.search.filters import Condition
+from app.modules.tenders.models import UserTender
+from app.modules.tenders.saved_index import SAVED_BY_FIELD, get_saved_by
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def ensure_filterable(client: MeiliClient, dry_run: bool) -> bool:
+    """Add saved_by to the filterable attributes of the index if it is missing; return whether it is filterable."""
+    filterable = list(client.get_filters() or [])
+    if SAVED_BY_FIELD in filterable:
+        logger.info(f"'{SAVED_BY_FIELD}' is already filterable")
+        return True
+    logger.info(f"Adding '{SAVED_BY_FIELD}' to the filterable attributes {filterable}")
+    if dry_run:
+        return False
+    task = client.index.update_filterable_attributes(filterable + [SAVED_BY_FIELD])
+    client.get_client().wait_for_task(task.task_uid, timeout_in_ms=600000)
+    return True
+
+
+def indexed_ids(client: MeiliClient, tender_uris):
+    """Return the subset of tender_uris that are indexed."""
+    documents = client.index.get_documents({
+        'filter': Condition('id', 'IN', tuple(tender_uris)).compile(),
+        'fields': ['id'],
+        'limit': len(tender_uris)
+    })
+    return {document.id for document in documents.results}
+
+
+def backfill(batch_size: int, dry_run: bool):
+    client = MeiliClient('tenders')
+    filterable = ensure_filterable(client, dry_run)
+
+    with SessionLocal() as db:
+        tender_uris = [row[0] for row in db.execute(select(UserTender.tender_uri).distinct()).fetchall()]
+        logger.info(f"{len(tender_uris)} tenders are saved by at least one user")
+
+        updated = 0
+        for start in range(0, len(tender_uris), batch_size):
+            batch = tender_uris[start:start + batch_size]
+            saved_by = get_saved_by(db, batch)
+            # Partial updates create missing documents: only touch indexed tenders
+            present = indexed_ids(client, batch)
+            documents = [{'id': uri, SAVED_BY_FIELD: saved_by[uri]} for uri in batch if uri in present]
+            if documents and not dry_run:
+                client.update_documents(documents)
+            updated += len(documents)
+        logger.info(f"saved_by written on {updated} documents ({len(tender_uris) - updated} saved tenders are not indexed)")
+
+    # Documents still listing users although nobody saves them any more
+    saved = set(tender_uris)
+    stale = []
+    offset = 0
+    while filterable:
+        page = client.index.get_documents({
+            'filter': f"{SAVED_BY_FIELD} EXISTS AND NOT {SAVED_BY_FIELD} IS EMPTY",
+            'fields': ['id'],
+            'offset': offset,
+            'limit': batch_size
+        })
+        stale.extend(document.id for document in page.results if document.id not in saved)
+        offset += batch_size
+        if offset >= page.total:
+            break
+    if stale:
+        logger.info(f"Emptying saved_by on {len(stale)} documents no longer saved")
+        if not dry_run:
+            for start in range(0, len(stale), batch_size):
+                client.update_documents([{'id': uri, SAVED_BY_FIELD: []} for uri in stale[start:start + batch_size]])
+
+    logger.info("Backfill finished" + (" (dry run, nothing written)" if dry_run else ""))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill saved_by on the tender search documents")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents per MeiliSearch update")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be written")
+    args = parser.parse_args()
+    backfill(args.batch_size, args.dry_run)
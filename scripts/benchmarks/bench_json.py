@@ -0,0 +1,120 @@
+"""
+Compare stdlib json and orjson on the JSON work done per request.
+
+- neptune decode:   the 11 fan-out SELECT responses and the CONSTRUCT JSON-LD
+                    response for a synthetic tender
+- meili decode:     a search response with --hits tender documents
+- response encode:  rendering the TenderDetail response body (JSONResponse
+                    vs ORJSONResponse, after FastAPI's response_model serialization)
+
+Usage:
+    python scripts/benchmarks/bench_json.py --lots 300 --documents 20 --iterations 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import orjson
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, build_tender_subgraph_query
+from app.modules.tenders.tender_helpers import parse_tender_detail
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+
+def _median_us(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(durations)
+
+
+def _compare(name, size, stdlib_func, orjson_func, iterations):
+    stdlib_us = _median_us(stdlib_func, iterations)
+    orjson_us = _median_us(orjson_func, iterations)
+    print(
+        f"{name:<18} {size / 1024:>9.1f} KiB   json {stdlib_us:>9.1f} us   orjson {orjson_us:>9.1f} us   "
+        f"saving {stdlib_us - orjson_us:>9.1f} us ({stdlib_us / max(orjson_us, 0.001):.1f}x)"
+    )
+    return stdlib_us - orjson_us
+
+
+def _meili_hit(i):
+    return {
+        "id": f"synthetic-{i:06d}",
+        "title": f"Synthetic tender {i}",
+        "description": f"Description of synthetic tender {i}. " * 5,
+        "cpv": ["45000000", "45233000"],
+        "budget_amount": 125000.5 + i,
+        "currency": "EUR",
+        "submission_date": 1736899200 + i,
+        "location": "Madrid",
+        "contracting_body": "Ayuntamiento de Madrid",
+        "status": "open"
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark json vs orjson on tender payloads")
+    parser.add_argument("--lots", type=int, default=200, help="Lots in the synthetic tender")
+    parser.add_argument("--documents", type=int, default=10, help="Documents of each kind in the synthetic tender")
+    parser.add_argument("--hits", type=int, default=100, help="Hits in the synthetic search response")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed iterations per case")
+    args = parser.parse_args()
+
+    g = build_graph(tenders=1, lots=args.lots, documents=args.documents)
+    uri = tender_uri(0)
+    fanout_payloads = [g.query(query).serialize(format="json") for _, query in build_tender_detail_queries([uri])]
+    construct_payload = g.query(build_tender_subgraph_query([uri])).graph.serialize(format="json-ld", encoding="utf-8")
+    meili_payload = orjson.dumps({
+        "hits": [_meili_hit(i) for i in range(args.hits)],
+        "query": "",
+        "offset": 0,
+        "limit": args.hits,
+        "estimatedTotalHits": 10000
+    })
+
+    named_results = {name: orjson.loads(payload) for (name, _), payload in zip(build_tender_detail_queries([uri]), fanout_payloads)}
+    # What FastAPI hands to the response class after response_model serialization
+    response_content = parse_tender_detail(named_results).model_dump(mode="json")
+    response_size = len(ORJSONResponse(response_content).body)
+
+    print(f"Synthetic tender: {args.lots} lots, {args.documents} documents per kind; search page: {args.hits} hits\n")
+    saving = 0.0
+    saving += _compare(
+        "neptune fanout", sum(len(p) for p in fanout_payloads),
+        lambda: [json.loads(p) for p in fanout_payloads],
+        lambda: [orjson.loads(p) for p in fanout_payloads],
+        args.iterations
+    )
+    _compare(
+        "neptune construct", len(construct_payload),
+        lambda: json.loads(construct_payload),
+        lambda: orjson.loads(construct_payload),
+        args.iterations
+    )
+    _compare(
+        "meili search", len(meili_payload),
+        lambda: json.loads(meili_payload),
+        lambda: orjson.loads(meili_payload),
+        args.iterations
+    )
+    saving += _compare(
+        "detail response", response_size,
+        lambda: JSONResponse(response_content),
+        lambda: ORJSONResponse(response_content),
+        args.iterations
+    )
+    print(f"\nPer detail request (fan-out decode + response encode): {saving / 1000:.2f} ms saved")
+
+
+if __name__ == "__main__":
+    main()
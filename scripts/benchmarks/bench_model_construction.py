@@ -0,0 +1,111 @@
+"""
+Compare per-object and trusted construction of the tender models.
+
+Times the fan-out parser (parse_tender_detail), the CONSTRUCT parser
+(parse_tender_from_index) and the listing preview parser on already
+decoded responses, with TENDER_TRUSTED_MODELS off (every lot, document and
+value validated where it is built) and on (nested objects built as dicts
+and validated once with the root model). A model_construct baseline is
+printed as well, since it is the obvious alternative and is slower than
+both with pydantic 2.
+
+Usage:
+    python scripts/benchmarks/bench_model_construction.py --lots 500 --documents 20 --iterations 100
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import orjson
+
+from app.core.config import settings
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, build_tender_subgraph_query
+from app.modules.tenders import tender_helpers
+from app.modules.tenders.tender_helpers import parse_tender_detail
+from app.modules.tenders.tender_jsonld import index_jsonld, parse_tender_from_index
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+
+def _median_ms(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def _compare(name, func, iterations):
+    settings.TENDER_TRUSTED_MODELS = False
+    validated_ms = _median_ms(func, iterations)
+    settings.TENDER_TRUSTED_MODELS = True
+    trusted_ms = _median_ms(func, iterations)
+    print(
+        f"{name:<22} per-object {validated_ms:8.3f} ms   trusted {trusted_ms:8.3f} ms   "
+        f"saving {validated_ms - trusted_ms:8.3f} ms ({validated_ms / max(trusted_ms, 0.001):.1f}x)"
+    )
+
+
+def _model_construct_baseline(named_results, iterations):
+    """Time the fan-out parser with every nested object built by model_construct."""
+    original = tender_helpers.nested_model
+    tender_helpers.nested_model = lambda model_cls, **fields: model_cls.model_construct(**fields)
+    try:
+        construct_ms = _median_ms(lambda: tender_helpers.parse_tender_detail(named_results), iterations)
+    finally:
+        tender_helpers.nested_model = original
+    print(f"{'fanout model_construct':<22} {construct_ms:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validated vs trusted tender model construction")
+    parser.add_argument("--lots", type=int, default=500, help="Lots in the synthetic tender")
+    parser.add_argument("--documents", type=int, default=20, help="Documents of each kind in the synthetic tender")
+    parser.add_argument("--previews", type=int, default=100, help="Rows in the synthetic listing page")
+    parser.add_argument("--iterations", type=int, default=100, help="Timed iterations per case")
+    args = parser.parse_args()
+
+    settings.DEBUG = False
+    g = build_graph(tenders=1, lots=args.lots, documents=args.documents)
+    uri = tender_uri(0)
+    named_results = {
+        name: orjson.loads(g.query(query).serialize(format="json"))
+        for name, query in build_tender_detail_queries([uri])
+    }
+    index = index_jsonld(orjson.loads(
+        g.query(build_tender_subgraph_query([uri])).graph.serialize(format="json-ld", encoding="utf-8")
+    ))
+    print(f"Synthetic tender: {args.lots} lots, {args.documents} documents per kind\n")
+
+    _compare("fanout detail", lambda: parse_tender_detail(named_results), args.iterations)
+    _compare("construct detail", lambda: parse_tender_from_index(index, uri), args.iterations)
+    _model_construct_baseline(named_results, args.iterations)
+
+    try:
+        from app.modules.tenders.services import parse_sparql_binding_to_tender_preview
+    except Exception as e:
+        print(f"preview parser skipped (could not import services: {e})")
+        return
+
+    bindings = [{
+        "procedure": {"type": "uri", "value": tender_uri(i)},
+        "id": {"type": "literal", "value": f"EXP-{i:06d}"},
+        "title": {"type": "literal", "value": f"Synthetic tender {i}"},
+        "description": {"type": "literal", "value": f"Description of synthetic tender {i}"},
+        "submissionDate": {"type": "literal", "value": "2025-03-15T14:00:00.000Z"},
+        "lotCount": {"type": "literal", "value": "12"},
+        "orgName": {"type": "literal", "value": "Ayuntamiento de Madrid"},
+        "baseBudgetAmount": {"type": "literal", "value": "125000.50"},
+        "baseBudgetCurrency": {"type": "literal", "value": "EUR"},
+        "classifications": {"type": "literal", "value": "http://data.europa.eu/cpv/cpv/45000000, http://data.europa.eu/cpv/cpv/72000000"}
+    } for i in range(args.previews)]
+    _compare(f"listing ({args.previews} rows)", lambda: [parse_sparql_binding_to_tender_preview(b) for b in bindings], args.iterations)
+
+
+if __name__ == "__main__":
+    main()
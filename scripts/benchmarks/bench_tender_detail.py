@@ -0,0 +1,130 @@
+"""
+Benchmark the three tender detail strategies (TENDER_DETAIL_MODE).
+
+- fanout:    11 SELECT queries, parsed by tender_helpers.parse_tender_detail
+- construct: 1 CONSTRUCT query, JSON-LD indexed by tender_jsonld
+- graph:     1 CONSTRUCT query, loaded into rdflib and parsed by parse_tender_from_graph
+
+Offline mode (default) evaluates the real queries once against a synthetic
+graph with rdflib and then times only the decoding + parsing of the
+responses, which is the part that runs on the API workers.
+
+Live mode (--live TENDER_ID) times the full path (Neptune round trips
+included) for each strategy against the configured Neptune endpoint.
+
+Usage:
+    python scripts/benchmarks/bench_tender_detail.py --lots 50 --documents 5 --iterations 200
+    python scripts/benchmarks/bench_tender_detail.py --live <tender hash> --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from rdflib import Graph, URIRef
+
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, build_tender_subgraph_query
+from app.modules.tenders.tender_helpers import parse_tender_detail
+from app.modules.tenders.tender_jsonld import parse_tender_from_jsonld
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+
+def _timed(func, iterations):
+    """Run func `iterations` times and return the per-call durations in milliseconds."""
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def _report(name, durations, extra=""):
+    durations = sorted(durations)
+    p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+    print(f"{name:<10} median {statistics.median(durations):8.3f} ms   p95 {p95:8.3f} ms   {extra}")
+
+
+def run_offline(args):
+    # The services module needs the database engine; import lazily so the
+    # fan-out and construct paths can be benchmarked without it.
+    try:
+        from app.modules.tenders.services import parse_tender_from_graph
+    except Exception as e:
+        parse_tender_from_graph = None
+        print(f"graph mode skipped (could not import services: {e})")
+
+    g = build_graph(tenders=1, lots=args.lots, documents=args.documents)
+    uri = tender_uri(0)
+    print(f"Synthetic tender: {len(g)} triples, {args.lots} lots, {args.documents} documents per kind")
+
+    # Pre-compute the raw JSON responses Neptune would send back
+    fanout_payloads = {
+        name: g.query(query).serialize(format="json").decode("utf-8")
+        for name, query in build_tender_detail_queries([uri])
+    }
+    construct_graph = g.query(build_tender_subgraph_query([uri])).graph
+    construct_payload = construct_graph.serialize(format="json-ld")
+
+    fanout_bytes = sum(len(p) for p in fanout_payloads.values())
+    print(f"Payload: fanout {fanout_bytes} bytes in 11 responses, construct {len(construct_payload)} bytes in 1 response\n")
+
+    def fanout():
+        parse_tender_detail({name: json.loads(payload) for name, payload in fanout_payloads.items()})
+
+    def construct():
+        parse_tender_from_jsonld(json.loads(construct_payload), uri)
+
+    def graph():
+        parsed = Graph().parse(data=construct_payload, format="json-ld")
+        parse_tender_from_graph(parsed, URIRef(uri))
+
+    _report("fanout", _timed(fanout, args.iterations), "(11 round trips)")
+    _report("construct", _timed(construct, args.iterations), "(1 round trip)")
+    if parse_tender_from_graph is not None:
+        _report("graph", _timed(graph, max(1, args.iterations // 10)), "(1 round trip)")
+
+
+async def run_live(args):
+    from app.core.config import settings
+    from app.core.database import get_neptune_client
+    from app.modules.tenders.services import _fetch_tender_detail
+
+    uri = args.live if args.live.startswith("http") else f"http://gober.ai/spain/procedure/{args.live}"
+    client = get_neptune_client()
+    await client.start()
+    try:
+        for mode in ("fanout", "construct", "graph"):
+            settings.TENDER_DETAIL_MODE = mode
+            durations = []
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                await _fetch_tender_detail(client, uri)
+                durations.append((time.perf_counter() - start) * 1000)
+            _report(mode, durations)
+    finally:
+        await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tender detail strategies")
+    parser.add_argument("--lots", type=int, default=20, help="Lots in the synthetic tender")
+    parser.add_argument("--documents", type=int, default=3, help="Documents of each kind in the synthetic tender")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed iterations per strategy")
+    parser.add_argument("--live", metavar="TENDER_ID", help="Benchmark against Neptune with this tender instead")
+    args = parser.parse_args()
+
+    if args.live:
+        asyncio.run(run_live(args))
+    else:
+        run_offline(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Load-test the tender read path (detail, preview, documents) without Neptune.
+
+The services behind GET /tenders/detail/{id}, /tenders/preview/{id} and
+/tenders/documents/{id} are called through the real NeptuneClient, backed
+by the local rdflib store (NEPTUNE_BACKEND=local) loaded with a synthetic
+fixture. For each endpoint and concurrency level the script reports
+throughput and p50/p95/p99 latency.
+
+The TenderDocuments lookups go to an in-memory SQLite database by default
+(--database configured uses the real one), and the tender detail cache is
+disabled unless --cache is passed, so every call exercises the queries and
+the parsing.
+
+CI usage: write the results with --output and compare a later run against
+them with --baseline; the script exits with status 1 when a p95 regresses
+by more than --tolerance.
+
+Usage:
+    python scripts/benchmarks/bench_tender_endpoints.py --tenders 200 --lots 20 --concurrency 1,8,32
+    python scripts/benchmarks/bench_tender_endpoints.py --fixture fixtures/tenders.nt --requests 500 --latency-ms 5
+    python scripts/benchmarks/bench_tender_endpoints.py --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+ENDPOINTS = ("detail", "preview", "documents")
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _configure_environment(args, fixture_path):
+    # Settings are read at import time, so the backend is selected before importing the app
+    os.environ["NEPTUNE_BACKEND"] = "local"
+    os.environ["NEPTUNE_LOCAL_FIXTURE"] = fixture_path
+    os.environ["NEPTUNE_LOCAL_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["NEPTUNE_SLOW_QUERY_THRESHOLD"] = "0"
+    if args.mode:
+        os.environ["TENDER_DETAIL_MODE"] = args.mode
+    if not args.cache:
+        os.environ["TENDER_DETAIL_CACHE_ENABLED"] = "false"
+
+
+def _use_sqlite_documents(tender_ids):
+    """Point the TenderDocuments lookups at an in-memory SQLite database with a row for every other tender."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+    import app.core.database as database
+    import app.modules.tenders.services as services
+    from app.modules.tenders.models import TenderDocuments
+
+    sqlite_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    TenderDocuments.__table__.create(sqlite_engine)
+    with Session(sqlite_engine) as db:
+        for tender_id in tender_ids[::2]:
+            db.add(TenderDocuments(id=tender_id, tender_uri=tender_id, summary="Synthetic summary", status="active"))
+        db.commit()
+
+    database.engine = sqlite_engine
+    services.engine = sqlite_engine
+
+
+async def _run_level(call, tender_ids, requests, concurrency):
+    """Issue `requests` calls with `concurrency` workers; return (latencies in ms, wall time, errors)."""
+    latencies = []
+    errors = 0
+    next_request = 0
+
+    async def worker():
+        nonlocal next_request, errors
+        while next_request < requests:
+            tender_id = tender_ids[next_request % len(tender_ids)]
+            next_request += 1
+            start = time.perf_counter()
+            try:
+                await call(tender_id)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started, errors
+
+
+async def run(args, tender_ids):
+    from app.core.database import get_neptune_client
+    from app.modules.tenders import services
+
+    calls = {
+        "detail": services.get_tender_detail,
+        "preview": services.get_tender_preview,
+        "documents": services.get_tender_documents
+    }
+
+    client = get_neptune_client()
+    await client.start()
+    results = {}
+    try:
+        # Warm up rdflib's query parser and the code paths once per endpoint
+        for endpoint in args.endpoints:
+            await calls[endpoint](tender_ids[0])
+
+        print(f"{'endpoint':<10} {'conc':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        for endpoint in args.endpoints:
+            for concurrency in args.concurrency:
+                latencies, wall, errors = await _run_level(calls[endpoint], tender_ids, args.requests, concurrency)
+                latencies.sort()
+                row = {
+                    "throughput": round(len(latencies) / wall, 2),
+                    "p50_ms": round(_percentile(latencies, 0.50), 3),
+                    "p95_ms": round(_percentile(latencies, 0.95), 3),
+                    "p99_ms": round(_percentile(latencies, 0.99), 3),
+                    "errors": errors
+                }
+                results[f"{endpoint}@{concurrency}"] = row
+                print(
+                    f"{endpoint:<10} {concurrency:>5} {row['throughput']:>9.1f} {row['p50_ms']:>9.2f} "
+                    f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {errors:>7}"
+                )
+    finally:
+        await client.close()
+    return results
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """Print p95 regressions against a previous --output file; return True if any exceeds the tolerance."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    regressed = False
+    for key, row in results.items():
+        previous = baseline.get(key)
+        if not previous or not previous.get("p95_ms"):
+            continue
+        change = row["p95_ms"] / previous["p95_ms"] - 1
+        if change > tolerance:
+            regressed = True
+            print(f"REGRESSION {key}: p95 {previous['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms ({change:+.0%})")
+    if not regressed:
+        print(f"No p95 regression above {tolerance:.0%} against {baseline_path}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tender read endpoints against the local SPARQL backend")
+    parser.add_argument("--fixture", help="Existing fixture to load (generated on the fly by default)")
+    parser.add_argument("--tenders", type=int, default=100, help="Synthetic tenders when generating the fixture")
+    parser.add_argument("--lots", type=int, default=10, help="Lots per synthetic tender")
+    parser.add_argument("--documents", type=int, default=3, help="Documents of each kind per synthetic tender")
+    parser.add_argument("--endpoints", type=lambda v: v.split(","), default=list(ENDPOINTS),
+                        help=f"Comma-separated endpoints ({','.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[1, 8, 32],
+                        help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Simulated Neptune round trip per query")
+    parser.add_argument("--mode", choices=["fanout", "construct", "graph"], help="TENDER_DETAIL_MODE to benchmark")
+    parser.add_argument("--cache", action="store_true", help="Keep the tender detail cache enabled")
+    parser.add_argument("--database", choices=["sqlite", "configured"], default="sqlite",
+                        help="Database for the TenderDocuments lookups")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Compare p95 latencies with a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 increase over the baseline")
+    args = parser.parse_args()
+
+    unknown = set(args.endpoints) - set(ENDPOINTS)
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_path = args.fixture
+        if not fixture_path:
+            from scripts.benchmarks.generate_fixture import write_fixture
+            fixture_path = os.path.join(tmp, "tenders.nt")
+            triples = write_fixture(fixture_path, args.tenders, args.lots, args.documents)
+            print(f"Generated fixture: {args.tenders} tenders, {triples} triples")
+
+        _configure_environment(args, fixture_path)
+
+        from rdflib import Graph, RDF
+        from scripts.benchmarks.synthetic_tenders import EPO
+        fixture_graph = Graph().parse(fixture_path)
+        tender_ids = sorted(str(s).split("/")[-1] for s in fixture_graph.subjects(RDF.type, EPO.Procedure))
+        del fixture_graph
+        if not tender_ids:
+            parser.error(f"No epo:Procedure found in {fixture_path}")
+
+        if args.database == "sqlite":
+            _use_sqlite_documents(tender_ids)
+
+        results = asyncio.run(run(args, tender_ids))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline and compare_with_baseline(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Write a synthetic tender graph to a fixture file for the local SPARQL backend.
+
+The format is taken from the file extension (.ttl for Turtle, .nt for
+N-Triples; N-Triples loads faster for large fixtures).
+
+Usage:
+    python scripts/benchmarks/generate_fixture.py --tenders 500 --lots 10 --documents 3 --output fixtures/tenders.nt
+
+Then run the API against it:
+    NEPTUNE_BACKEND=local NEPTUNE_LOCAL_FIXTURE=fixtures/tenders.nt uvicorn app.main:app
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.local_sparql import FIXTURE_FORMATS
+from scripts.benchmarks.synthetic_tenders import build_graph
+
+
+def write_fixture(path: str, tenders: int, lots: int, documents: int) -> int:
+    """
+    Build the synthetic graph and serialize it to `path`.
+
+    Returns:
+        int: Number of triples written
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FIXTURE_FORMATS:
+        raise ValueError(f"Unsupported fixture extension '{extension}' (use one of {', '.join(FIXTURE_FORMATS)})")
+
+    g = build_graph(tenders=tenders, lots=lots, documents=documents)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    g.serialize(destination=path, format=FIXTURE_FORMATS[extension], encoding="utf-8")
+    return len(g)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic tender fixture for NEPTUNE_BACKEND=local")
+    parser.add_argument("--tenders", type=int, default=100, help="Number of tenders")
+    parser.add_argument("--lots", type=int, default=5, help="Lots per tender")
+    parser.add_argument("--documents", type=int, default=3, help="Documents of each kind per tender")
+    parser.add_argument("--output", required=True, help="Fixture path (.ttl or .nt)")
+    args = parser.parse_args()
+
+    triples = write_fixture(args.output, args.tenders, args.lots, args.documents)
+    print(f"Wrote {triples} triples for {args.tenders} tenders to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Synthetic tender graphs for benchmarks and local testing.
+
+Builds rdflib graphs shaped like the eProcurement (ePO) data stored in
+Neptune: a procedure with buyer, address, estimated values, CPVs, submission
+and contract terms, procurement documents and lots. The shapes follow the
+detail queries in app/modules/tenders/queries_tender_detail.py.
+"""
+
+import random
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, XSD
+
+EPO = Namespace("http://data.europa.eu/a4g/ontology#")
+DCT = Namespace("http://purl.org/dc/terms/")
+LOCN = Namespace("http://www.w3.org/ns/locn#")
+M8G = Namespace("http://data.europa.eu/m8g/")
+ADMS = Namespace("http://www.w3.org/ns/adms#")
+SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+AUTHORITY = Namespace("http://publications.europa.eu/ontology/authority/")
+
+BASE = "http://gober.ai/spain"
+CPV_CODES = ["45000000", "45233000", "72000000", "79000000", "90000000", "33000000", "50000000", "71000000"]
+CONTRACT_TYPES = ["works", "services", "supplies"]
+PROVINCES = ["Madrid", "Barcelona", "Valencia", "Sevilla", "Bizkaia", "Zaragoza"]
+
+
+def tender_uri(index: int) -> str:
+    """URI of the synthetic tender number `index`."""
+    return f"{BASE}/procedure/synthetic-{index:06d}"
+
+
+def _add_address(g: Graph, node: URIRef, rng: random.Random) -> None:
+    g.add((node, EPO.hasCountryCode, URIRef("http://publications.europa.eu/resource/authority/country/ESP")))
+    g.add((node, EPO.hasNutsCode, URIRef(f"http://data.europa.eu/nuts/code/ES{rng.randint(10, 70)}")))
+    g.add((node, LOCN.addressArea, Literal("España")))
+    g.add((node, LOCN.adminUnitL1, Literal(rng.choice(PROVINCES))))
+    g.add((node, LOCN.postCode, Literal(f"{rng.randint(1000, 52999):05d}")))
+    g.add((node, LOCN.postName, Literal(rng.choice(PROVINCES))))
+    g.add((node, LOCN.thoroughfare, Literal(f"Calle Mayor {rng.randint(1, 200)}")))
+
+
+def _add_monetary_value(g: Graph, node: URIRef, amount: float) -> None:
+    g.add((node, RDF.type, EPO.MonetaryValue))
+    g.add((node, EPO.hasAmountValue, Literal(f"{amount:.2f}", datatype=XSD.decimal)))
+    g.add((node, AUTHORITY.currency, Literal("EUR")))
+
+
+def _add_documents(g: Graph, procedure: URIRef, kind: str, count: int) -> None:
+    term = URIRef(f"{procedure}/access-term/{kind}-document")
+    g.add((procedure, EPO.isSubjectToProcedureSpecificTerm, term))
+    g.add((term, RDF.type, EPO.AccessTerm))
+    for d in range(count):
+        document = URIRef(f"{procedure}/document/{kind}-{d}")
+        g.add((term, EPO.involvesProcurementDocument, document))
+        g.add((document, DCT.title, Literal(f"{kind.capitalize()} document {d}")))
+        g.add((document, DCT.description, Literal(f"Synthetic {kind} document {d}")))
+        g.add((document, EPO.hasPublicationDate, Literal("2025-01-15", datatype=XSD.date)))
+        g.add((document, EPO.hasAccessURL, Literal(f"https://contrataciondelestado.es/doc/{kind}-{d}.pdf")))
+
+
+def add_tender(g: Graph, index: int, lots: int = 5, documents: int = 3, seed: int = None) -> str:
+    """
+    Add one synthetic tender to a graph.
+
+    Args:
+        g: Graph to add the triples to
+        index: Tender number, used to build the procedure URI
+        lots: Number of lots
+        documents: Number of documents of each kind (legal, technical, additional)
+        seed: Random seed (defaults to index, so the data is reproducible)
+
+    Returns:
+        str: The procedure URI
+    """
+    rng = random.Random(index if seed is None else seed)
+    procedure = URIRef(tender_uri(index))
+
+    g.add((procedure, RDF.type, EPO.Procedure))
+    g.add((procedure, DCT.title, Literal(f"Synthetic tender {index}")))
+    g.add((procedure, DCT.description, Literal(f"Description of synthetic tender {index}. " * 5)))
+    g.add((procedure, EPO.hasAdditionalInformation, Literal("Additional information")))
+
+    identifier = URIRef(f"{procedure}/identifier")
+    g.add((procedure, ADMS.identifier, identifier))
+    g.add((identifier, SKOS.notation, Literal(f"EXP-{index:06d}")))
+
+    # Buyer
+    buyer = URIRef(f"{BASE}/organisation/org-{rng.randint(1, 500)}")
+    g.add((procedure, EPO.involvesBuyer, buyer))
+    g.add((buyer, RDF.type, M8G.PublicOrganisation))
+    g.add((buyer, EPO.hasLegalName, Literal(f"Ayuntamiento {rng.choice(PROVINCES)}")))
+    g.add((buyer, EPO.hasBuyerProfile, Literal("https://contrataciondelestado.es/perfil")))
+    for predicate, suffix in ((EPO.hasTaxIdentifier, "tax"), (EPO.hasLegalIdentifier, "legal")):
+        node = URIRef(f"{buyer}/{suffix}-id")
+        g.add((buyer, predicate, node))
+        g.add((node, SKOS.notation, Literal(f"P{rng.randint(1000000, 9999999)}")))
+    buyer_address = URIRef(f"{buyer}/address")
+    g.add((buyer, LOCN.address, buyer_address))
+    _add_address(g, buyer_address, rng)
+
+    # Values
+    budget = rng.uniform(10000, 5000000)
+    for suffix, factor in (("estimated-overall-contract-amount", 1.0), ("gross-value", 1.21), ("net-value", 1.0)):
+        node = URIRef(f"{procedure}/value/{suffix}")
+        g.add((procedure, EPO.hasEstimatedValue, node))
+        _add_monetary_value(g, node, budget * factor)
+
+    # Classification
+    purpose = URIRef(f"{procedure}/purpose")
+    g.add((procedure, EPO.hasPurpose, purpose))
+    g.add((purpose, RDF.type, EPO.Purpose))
+    g.add((purpose, EPO.hasMainClassification, URIRef(f"http://data.europa.eu/cpv/cpv/{rng.choice(CPV_CODES)}")))
+
+    # Submission term
+    submission = URIRef(f"{procedure}/submission-term")
+    g.add((procedure, EPO.isSubjectToProcedureSpecificTerm, submission))
+    g.add((submission, RDF.type, EPO.SubmissionTerm))
+    g.add((submission, EPO.hasReceiptDeadline, Literal(f"2025-0{rng.randint(1, 9)}-15T14:00:00.000Z")))
+    g.add((submission, EPO.hasLanguage, URIRef("http://publications.europa.eu/resource/authority/language/SPA")))
+
+    # Contract term and place of performance
+    contract_term = URIRef(f"{procedure}/contract-term")
+    location = URIRef(f"{procedure}/location")
+    location_address = URIRef(f"{procedure}/location/address")
+    g.add((procedure, EPO.foreseesContractSpecificTerm, contract_term))
+    g.add((contract_term, RDF.type, EPO.ContractTerm))
+    g.add((contract_term, EPO.hasContractNatureType, URIRef(f"{BASE}/contract-nature/{rng.choice(CONTRACT_TYPES)}")))
+    g.add((contract_term, EPO.definesSpecificPlaceOfPerformance, location))
+    location_name = Literal(rng.choice(PROVINCES))
+    g.add((location, RDF.type, DCT.Location))
+    # The detail queries read dct:geographicName, the listing/preview queries locn:geographicName
+    g.add((location, DCT.geographicName, location_name))
+    g.add((location, LOCN.geographicName, location_name))
+    g.add((location, EPO.hasNutsCode, URIRef(f"http://data.europa.eu/nuts/code/ES{rng.randint(10, 70)}")))
+    g.add((location, EPO.hasCountryCode, URIRef("http://publications.europa.eu/resource/authority/country/ESP")))
+    g.add((location, LOCN.address, location_address))
+    _add_address(g, location_address, rng)
+
+    # Documents
+    for kind in ("legal", "technical", "additional"):
+        _add_documents(g, procedure, kind, documents)
+
+    # Lots
+    for l in range(lots):
+        lot = URIRef(f"{procedure}/lot/{l}")
+        g.add((procedure, EPO.hasProcurementScopeDividedIntoLot, lot))
+        g.add((lot, RDF.type, EPO.Lot))
+        g.add((lot, DCT.title, Literal(f"Lot {l} of tender {index}")))
+        g.add((lot, DCT.description, Literal(f"Description of lot {l}")))
+        lot_value = URIRef(f"{lot}/value")
+        g.add((lot, EPO.hasEstimatedValue, lot_value))
+        _add_monetary_value(g, lot_value, budget / max(lots, 1))
+        lot_term = URIRef(f"{lot}/contract-term")
+        g.add((lot, EPO.foreseesContractSpecificTerm, lot_term))
+        g.add((lot_term, RDF.type, EPO.ContractTerm))
+        g.add((lot_term, EPO.hasContractNatureType, URIRef(f"{BASE}/contract-nature/{rng.choice(CONTRACT_TYPES)}")))
+
+    return str(procedure)
+
+
+def build_graph(tenders: int = 1, lots: int = 5, documents: int = 3) -> Graph:
+    """Build a graph with `tenders` synthetic tenders (see add_tender)."""
+    g = Graph()
+    for i in range(tenders):
+        add_tender(g, i, lots=lots, documents=documents)
+    return g
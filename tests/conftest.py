@@ -32,6 +32,28 @@ def load_test_env():
 # Load test environment variables
 load_test_env()
 
+# Validate every nested tender model where it is built, so mapper errors point at their mapper
+# (in production nested_model returns plain dicts, validated once with the root model)
+os.environ.setdefault("TENDER_TRUSTED_MODELS", "false")
+
+class FakeClock:
+    """Manually advanced clock, usable as a `timer` callable or in place of the time module (monotonic)"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fake clock starting at 1000 s; advance it with clock.now += seconds"""
+    return FakeClock()
+
 def pytest_addoption(parser):
     """Add custom command-line options to pytest"""
     parser.addoption(
@@ -0,0 +1,95 @@
+# tests/test_async_search.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import orjson
+from meilisearch.errors import MeilisearchApiError
+
+from app.core.utils.meili import MeiliClient
+from app.modules.search import services as search_services
+
+
+class FakeResponse:
+    def __init__(self, status, content):
+        self.status = status
+        self.content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def read(self):
+        return self.content
+
+
+class FakeSession:
+    """aiohttp session stand-in recording the posted requests"""
+
+    def __init__(self, status=200, content=b"{}"):
+        self.response = FakeResponse(status, content)
+        self.posts = []
+
+    def post(self, url, data=None, headers=None):
+        self.posts.append({"url": url, "data": data, "headers": headers})
+        return self.response
+
+
+@pytest.fixture
+def meili_client():
+    with patch("app.core.utils.meili.meilisearch.Client") as client_class:
+        client = client_class.return_value
+        client.config.url = "http://meili:7700"
+        client.config.timeout = 5
+        client.http.headers = {"Authorization": "Bearer key"}
+        yield MeiliClient("tenders", host="http://meili:7700", api_key="key")
+
+
+@pytest.mark.asyncio
+async def test_search_async_posts_to_the_search_endpoint(meili_client):
+    session = FakeSession(content=orjson.dumps({"hits": [{"id": "abc"}], "estimatedTotalHits": 1}))
+    meili_client._get_http_session = AsyncMock(return_value=session)
+
+    result = await meili_client.search_async("obras", offset=0, limit=5, sort=["submission_date:desc"])
+
+    assert result == {"hits": [{"id": "abc"}], "estimatedTotalHits": 1}
+    post = session.posts[0]
+    assert post["url"] == "http://meili:7700/indexes/tenders/search"
+    assert orjson.loads(post["data"]) == {"q": "obras", "offset": 0, "limit": 5, "sort": ["submission_date:desc"]}
+    assert post["headers"]["Authorization"] == "Bearer key"
+
+
+@pytest.mark.asyncio
+async def test_search_async_raises_sdk_error(meili_client):
+    error_body = b'{"message": "Attribute `x` is not filterable", "code": "invalid_search_filter"}'
+    meili_client._get_http_session = AsyncMock(return_value=FakeSession(400, error_body))
+
+    with pytest.raises(MeilisearchApiError) as exc_info:
+        await meili_client.search_async("", filter="x = 1")
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.code == "invalid_search_filter"
+
+
+@pytest.mark.asyncio
+async def test_do_search_awaits_the_async_client():
+    client = MagicMock()
+    client.search_async = AsyncMock(return_value={"hits": [{"id": "abc"}], "estimatedTotalHits": 11})
+
+    with patch.object(search_services, "get_meili_client", return_value=client):
+        result = await search_services.do_search(
+            "tenders", {"match": "obras", "offset": 0, "limit": 10}, saved_tender_uris=["abc"]
+        )
+
+    client.search.assert_not_called()
+    assert client.search_async.await_args.kwargs["filter"] == 'id IN ["abc"]'
+    assert result["items"] == [{"id": "abc"}]
+    assert result["total"] == 11
+    assert result["has_next"]
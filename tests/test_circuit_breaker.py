@@ -0,0 +1,193 @@
+# tests/test_circuit_breaker.py
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+import requests
+from meilisearch.errors import MeilisearchApiError, MeilisearchCommunicationError, MeilisearchTimeoutError
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.neptune import NeptuneClient, is_neptune_overload
+from app.core.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from app.core.utils.concurrency import LimiterQueueFullError, ServiceUnavailableError
+from app.core.utils.meili import MeiliClient, is_meili_failure, meili_http_error
+
+
+def fail(breaker, error=None):
+    with pytest.raises(type(error or RuntimeError())):
+        with breaker.protect():
+            raise error or RuntimeError("upstream down")
+
+
+def succeed(breaker):
+    with breaker.protect():
+        pass
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast(clock):
+    breaker = CircuitBreaker("svc", failure_threshold=3, recovery_timeout=30, timer=clock)
+    fail(breaker)
+    fail(breaker)
+    succeed(breaker)  # resets the consecutive count
+    for _ in range(3):
+        fail(breaker)
+
+    assert breaker.state == OPEN
+    calls = []
+    with pytest.raises(CircuitOpenError) as exc_info:
+        with breaker.protect():
+            calls.append(1)
+    assert calls == []
+    assert isinstance(exc_info.value, ServiceUnavailableError)
+    assert exc_info.value.retry_after == 30
+
+    stats = breaker.stats()
+    assert stats["opened"] == 1
+    assert stats["rejected"] == 1
+    assert stats["failures"] == 5
+
+
+def test_half_open_probe_closes_or_reopens_the_circuit(clock):
+    breaker = CircuitBreaker("svc", failure_threshold=1, recovery_timeout=10, timer=clock)
+    fail(breaker)
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+
+    # A failed probe re-opens the circuit for a full recovery timeout
+    fail(breaker)
+    assert breaker.state == OPEN
+    clock.now += 9
+    assert breaker.state == OPEN
+
+    clock.now += 1
+    succeed(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_admits_a_limited_number_of_probes(clock):
+    breaker = CircuitBreaker("svc", failure_threshold=1, recovery_timeout=10, half_open_max_calls=1, timer=clock)
+    fail(breaker)
+    clock.now += 10
+
+    probe = breaker.before_call()
+    assert probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    # A cancelled probe frees its slot without deciding the state
+    breaker.after_call(probe, asyncio.CancelledError())
+    assert breaker.state == HALF_OPEN
+    breaker.after_call(breaker.before_call())
+    assert breaker.state == CLOSED
+
+
+def test_errors_that_are_not_failures_do_not_open_the_circuit():
+    breaker = CircuitBreaker("svc", failure_threshold=1, is_failure=lambda e: isinstance(e, TimeoutError))
+    fail(breaker, ValueError("bad request"))
+    fail(breaker, LimiterQueueFullError("queue full"))
+    assert breaker.state == CLOSED
+
+    fail(breaker, TimeoutError())
+    assert breaker.state == OPEN
+
+
+def test_disabled_breaker_lets_every_call_through():
+    breaker = CircuitBreaker("svc", failure_threshold=1, enabled=False)
+    fail(breaker)
+    fail(breaker)
+    succeed(breaker)
+    assert breaker.stats()["calls"] == 0
+
+
+def test_meili_failures_exclude_client_errors():
+    response = MagicMock(status_code=400, text='{"message": "bad filter"}')
+    response.json.return_value = {"message": "bad filter"}
+    assert not is_meili_failure(MeilisearchApiError("bad filter", response))
+    response.status_code = 503
+    assert is_meili_failure(MeilisearchApiError("unavailable", response))
+    assert is_meili_failure(MeilisearchTimeoutError("timed out"))
+
+
+@pytest.fixture
+def neptune_client():
+    """Neptune client without AWS credentials guarded by a breaker that opens after two failures"""
+    session = MagicMock()
+    session.get_credentials.return_value = None
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        client = NeptuneClient(
+            endpoint="neptune.local", port=8182, region="eu-west-3", coalesce_queries=False,
+            circuit_breaker=CircuitBreaker("neptune", failure_threshold=2, is_failure=is_neptune_overload)
+        )
+    client.upstream_calls = 0
+
+    async def post(query, query_name):
+        client.upstream_calls += 1
+        raise requests.ConnectionError("connection refused")
+
+    client._post_sparql_query = post
+    return client
+
+
+@pytest.mark.asyncio
+async def test_open_neptune_circuit_fails_fast_without_calling_upstream(neptune_client):
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            await neptune_client.execute_sparql_query_async("SELECT * WHERE { ?s ?p ?o }")
+
+    with pytest.raises(CircuitOpenError):
+        await neptune_client.execute_sparql_query_async("SELECT * WHERE { ?s ?p ?o }")
+
+    assert neptune_client.upstream_calls == 2
+    assert neptune_client.stats()["circuit"]["state"] == OPEN
+
+
+@pytest.mark.asyncio
+async def test_open_neptune_circuit_is_raised_from_parallel_named_queries(neptune_client):
+    neptune_client.circuit_breaker.failure_threshold = 1
+    with pytest.raises(requests.ConnectionError):
+        await neptune_client.execute_sparql_query_async("SELECT 1")
+
+    with pytest.raises(CircuitOpenError):
+        await neptune_client.execute_named_sparql_queries_parallel([("core", "SELECT 2"), ("lots", "SELECT 3")])
+
+
+def html_response(status):
+    response = requests.Response()
+    response.status_code = status
+    response._content = b"<html><body><h1>502 Bad Gateway</h1></body></html>"
+    return response
+
+
+def test_non_json_gateway_errors_open_the_meili_circuit():
+    with patch("app.core.utils.meili.meilisearch.Client") as client_class:
+        client_class.return_value.config.url = "http://meili:7700"
+        client_class.return_value.config.timeout = 5
+        client_class.return_value.http.headers = {}
+        meili_client = MeiliClient("tenders", host="http://meili:7700", api_key="key")
+    meili_client.circuit_breaker = CircuitBreaker("meili-test", failure_threshold=2, is_failure=is_meili_failure)
+    meili_client.session = MagicMock()
+    meili_client.session.post.return_value = html_response(502)
+
+    for _ in range(2):
+        with pytest.raises(MeilisearchCommunicationError):
+            meili_client.search("obras")
+
+    assert meili_client.circuit_breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        meili_client.search("obras")
+    assert meili_client.session.post.call_count == 2
+
+
+def test_meili_http_errors_do_not_depend_on_a_json_body():
+    assert isinstance(meili_http_error(504, b"<html>Gateway Timeout</html>"), MeilisearchCommunicationError)
+    bad_request = meili_http_error(400, b"Bad Request")
+    assert isinstance(bad_request, MeilisearchApiError) and bad_request.status_code == 400
+    assert not is_meili_failure(bad_request)
+    api_error = meili_http_error(503, b'{"message": "busy", "code": "too_many_search_requests"}')
+    assert api_error.code == "too_many_search_requests"
+    assert is_meili_failure(api_error)
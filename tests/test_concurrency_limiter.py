@@ -0,0 +1,82 @@
+# tests/test_concurrency_limiter.py
+
+import os
+import sys
+import asyncio
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.utils.concurrency import AdaptiveConcurrencyLimiter, LimiterQueueFullError, ServiceUnavailableError
+
+
+async def hold(limiter, seconds, peak):
+    async with limiter.slot():
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(seconds)
+        peak["now"] -= 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_never_exceeds_limit():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=3, max_limit=3, max_queue=100, latency_target=10)
+    peak = {"now": 0, "max": 0}
+
+    await asyncio.gather(*[hold(limiter, 0.01, peak) for _ in range(20)])
+
+    assert peak["max"] == 3
+    assert limiter.stats()["accepted"] == 20
+    assert limiter.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_fails_fast():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1, max_limit=1, max_queue=1, latency_target=10)
+    peak = {"now": 0, "max": 0}
+
+    running = asyncio.create_task(hold(limiter, 0.1, peak))
+    queued = asyncio.create_task(hold(limiter, 0, peak))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(LimiterQueueFullError) as exc_info:
+        await limiter.acquire()
+    assert isinstance(exc_info.value, ServiceUnavailableError)
+    assert exc_info.value.retry_after >= 1
+
+    await asyncio.gather(running, queued)
+    assert limiter.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1, max_limit=1, queue_timeout=0.02, latency_target=10)
+    await limiter.acquire()
+
+    with pytest.raises(LimiterQueueFullError):
+        await limiter.acquire()
+    assert limiter.stats()["timeouts"] == 1
+    assert limiter.stats()["queued"] == 0
+
+
+def test_aimd_limit_adjustment():
+    limiter = AdaptiveConcurrencyLimiter("test", initial_limit=10, min_limit=2, max_limit=20, latency_target=1, backoff=0.5)
+
+    # Overload halves the limit
+    limiter._inflight = 1
+    limiter.release(latency=0.1, error=TimeoutError())
+    assert limiter.limit == 5
+
+    # Fast successes grow it additively
+    for _ in range(10):
+        limiter._inflight = 1
+        limiter.release(latency=0.1)
+    assert limiter.limit == 6
+
+    # Errors that do not signal overload leave the limit alone
+    limiter.is_overload = lambda e: not isinstance(e, ValueError)
+    limiter._last_decrease = 0
+    limiter._inflight = 1
+    limiter.release(latency=0.1, error=ValueError("bad query"))
+    assert limiter.limit == 6
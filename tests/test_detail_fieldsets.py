@@ -0,0 +1,128 @@
+# tests/test_detail_fieldsets.py
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.tenders import services
+from app.modules.tenders.fieldsets import (
+    InvalidFieldsError,
+    detail_query_names,
+    needs_database,
+    parse_detail_fields,
+)
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, TENDER_DETAIL_QUERIES
+from app.modules.tenders.schemas import TenderDetail
+from app.modules.tenders.tender_cache import (
+    cache_tender_detail,
+    get_cached_tender_detail,
+    invalidate_tender_detail,
+    tender_cache_key,
+    tender_detail_cache,
+    tender_detail_variants_cache,
+)
+
+URI = "http://gober.ai/spain/procedure/abc123"
+MOBILE_FIELDS = "title,buyer,estimated_value,submission_term"
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    monkeypatch.setattr(tender_detail_cache, "enabled", True)
+    monkeypatch.setattr(tender_detail_variants_cache, "enabled", True)
+    tender_detail_cache.clear()
+    tender_detail_variants_cache.clear()
+    yield
+    tender_detail_cache.clear()
+    tender_detail_variants_cache.clear()
+
+
+def test_parse_detail_fields_adds_uri_and_ignores_blanks():
+    assert parse_detail_fields(None) is None
+    assert parse_detail_fields(" ") is None
+    assert parse_detail_fields("title, buyer,,") == frozenset({"uri", "title", "buyer"})
+
+
+def test_parse_detail_fields_rejects_unknown_fields():
+    with pytest.raises(InvalidFieldsError, match="colour"):
+        parse_detail_fields("title,colour")
+
+
+def test_mobile_fieldset_runs_a_subset_of_the_detail_queries():
+    names = detail_query_names(parse_detail_fields(MOBILE_FIELDS))
+    queries = build_tender_detail_queries([URI], names)
+
+    assert [name for name, _ in queries] == ["core", "contracting_entity", "monetary_values", "submission_terms"]
+    assert len(queries) < len(TENDER_DETAIL_QUERIES)
+    assert detail_query_names(None) is None
+    assert len(build_tender_detail_queries([URI], None)) == len(TENDER_DETAIL_QUERIES)
+
+
+def test_needs_database_only_for_tender_documents_fields():
+    assert needs_database(None)
+    assert needs_database(parse_detail_fields("title,status"))
+    assert not needs_database(parse_detail_fields(MOBILE_FIELDS))
+
+
+def test_cache_key_is_canonical_for_a_field_set():
+    assert tender_cache_key(URI, parse_detail_fields("buyer,title")) == tender_cache_key(
+        "abc123", parse_detail_fields("title, buyer")
+    )
+    assert tender_cache_key(URI) == "abc123"
+
+
+def test_invalidation_drops_every_field_set_variant():
+    detail = TenderDetail(uri=URI, title="Tender")
+    mobile = parse_detail_fields(MOBILE_FIELDS)
+    cache_tender_detail(URI, detail)
+    cache_tender_detail(URI, detail, mobile)
+    cache_tender_detail(URI, detail, parse_detail_fields("lots"))
+
+    assert get_cached_tender_detail(URI, mobile) is not None
+
+    invalidate_tender_detail("abc123")
+
+    assert get_cached_tender_detail(URI) is None
+    assert get_cached_tender_detail(URI, mobile) is None
+    assert get_cached_tender_detail(URI, parse_detail_fields("lots")) is None
+    assert tender_detail_variants_cache.get(tender_cache_key(URI)) is None
+
+
+def test_sparse_detail_only_runs_needed_queries_and_skips_database():
+    core = {"results": {"bindings": [{
+        "procedure": {"type": "uri", "value": URI},
+        "title": {"type": "literal", "value": "Tender"}
+    }]}}
+    client = MagicMock()
+    client.execute_named_sparql_queries_parallel = AsyncMock(side_effect=lambda queries, *args: {
+        name: core if name == "core" else {"results": {"bindings": []}} for name, _ in queries
+    })
+    fields = parse_detail_fields(MOBILE_FIELDS)
+
+    with patch.object(services, "get_neptune_client", return_value=client), \
+            patch.object(services, "Session") as session:
+        detail = asyncio.run(services.get_tender_detail("abc123", fields))
+        # Second call is served from the field-set cache
+        asyncio.run(services.get_tender_detail("abc123", fields))
+
+    assert detail.title == "Tender"
+    session.assert_not_called()
+    client.execute_named_sparql_queries_parallel.assert_awaited_once()
+    queries = client.execute_named_sparql_queries_parallel.call_args.args[0]
+    assert {name for name, _ in queries} == {"core", "contracting_entity", "monetary_values", "submission_terms"}
+
+
+def test_sparse_detail_is_served_from_a_cached_full_detail():
+    cache_tender_detail(URI, TenderDetail(uri=URI, title="Full tender"))
+
+    with patch.object(services, "get_neptune_client") as get_client:
+        detail = asyncio.run(services.get_tender_detail("abc123", parse_detail_fields("title")))
+
+    assert detail.title == "Full tender"
+    get_client.assert_not_called()
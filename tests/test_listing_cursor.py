@@ -0,0 +1,52 @@
+# tests/test_listing_cursor.py
+
+import os
+import sys
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.tenders.pagination import (
+    encode_listing_cursor, decode_listing_cursor, build_keyset_filter, InvalidCursorError
+)
+
+PROCEDURE = "http://gober.ai/spain/procedure/abc123"
+XSD_DATETIME = "http://www.w3.org/2001/XMLSchema#dateTime"
+
+
+def test_cursor_round_trip():
+    binding = {
+        "procedure": {"type": "uri", "value": PROCEDURE},
+        "submissionDate": {"type": "literal", "value": "2025-03-01T10:00:00Z", "datatype": XSD_DATETIME}
+    }
+
+    keyset = decode_listing_cursor(encode_listing_cursor(binding))
+
+    assert keyset == {"submission_date": "2025-03-01T10:00:00Z", "datatype": XSD_DATETIME, "procedure": PROCEDURE}
+
+
+def test_keyset_filter_compares_typed_date_then_procedure():
+    cursor = encode_listing_cursor({
+        "procedure": {"value": PROCEDURE},
+        "submissionDate": {"value": "2025-03-01T10:00:00Z", "datatype": XSD_DATETIME}
+    })
+
+    keyset_filter = build_keyset_filter(cursor)
+
+    assert f'?submissionDate < "2025-03-01T10:00:00Z"^^<{XSD_DATETIME}>' in keyset_filter
+    assert f'STR(?procedure) < "{PROCEDURE}"' in keyset_filter
+    assert "!BOUND(?submissionDate)" in keyset_filter
+
+
+def test_keyset_filter_for_rows_without_date():
+    cursor = encode_listing_cursor({"procedure": {"value": PROCEDURE}})
+
+    assert build_keyset_filter(cursor) == f'FILTER(!BOUND(?submissionDate) && STR(?procedure) < "{PROCEDURE}")'
+    assert build_keyset_filter(None) == ""
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_listing_cursor({"procedure": {"value": 'x" } DROP'}})])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        build_keyset_filter(cursor)
@@ -0,0 +1,64 @@
+# tests/test_local_sparql.py
+
+import asyncio
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import pytest
+
+from app.core.local_sparql import LocalSparqlBackend
+from app.core.neptune import NeptuneClient
+from app.modules.tenders.queries_tender_detail import build_tender_subgraph_query
+from app.modules.tenders.tender_jsonld import parse_tender_from_jsonld
+from scripts.benchmarks.generate_fixture import write_fixture
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+SELECT_TITLE = """
+PREFIX dct: <http://purl.org/dc/terms/>
+SELECT ?title WHERE {{ <{uri}> dct:title ?title }}
+"""
+
+
+@pytest.fixture(scope="module")
+def backend():
+    return LocalSparqlBackend(build_graph(tenders=2, lots=2, documents=1))
+
+
+def test_select_returns_sparql_results_json(backend):
+    result = backend.query(SELECT_TITLE.format(uri=tender_uri(1)))
+
+    assert result["head"]["vars"] == ["title"]
+    assert result["results"]["bindings"][0]["title"]["value"] == "Synthetic tender 1"
+
+
+def test_construct_returns_json_ld(backend):
+    document = backend.query(build_tender_subgraph_query([tender_uri(0)]))
+
+    detail = parse_tender_from_jsonld(document, tender_uri(0))
+    assert detail.title == "Synthetic tender 0"
+    assert len(detail.lots) == 2
+
+
+def test_from_file_guesses_format(tmp_path):
+    path = str(tmp_path / "tenders.ttl")
+    triples = write_fixture(path, tenders=1, lots=1, documents=1)
+
+    assert LocalSparqlBackend.from_file(path).stats()["triples"] == triples
+    with pytest.raises(ValueError):
+        LocalSparqlBackend.from_file(str(tmp_path / "tenders.unknown"))
+
+
+def test_neptune_client_uses_backend_and_records_metrics(backend):
+    client = NeptuneClient(endpoint="localhost", port=8182, region="eu-west-1", backend=backend)
+    query = SELECT_TITLE.format(uri=tender_uri(0))
+
+    sync_result = client.execute_sparql_query(query, query_name="title")
+    async_result = asyncio.run(client.execute_sparql_query_async(query, query_name="title"))
+
+    assert sync_result == async_result
+    stats = client.stats()
+    assert stats["queries"]["title"]["count"] == 2
+    assert stats["backend"]["triples"] == len(backend.graph)
@@ -0,0 +1,54 @@
+# tests/test_metrics_endpoints.py
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+from fastapi.testclient import TestClient
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app import main
+from app.modules.auth.models import User, UserRole
+from app.modules.auth.services import get_current_user
+
+
+@pytest.fixture
+def client(monkeypatch):
+    neptune = MagicMock()
+    neptune.stats.return_value = {"queries": 0}
+    neptune.query_metrics.slow_queries.return_value = []
+    monkeypatch.setattr(main, "get_neptune_client", lambda: neptune)
+    yield TestClient(main.app)
+    main.app.dependency_overrides.pop(get_current_user, None)
+
+
+def login_as(role):
+    main.app.dependency_overrides[get_current_user] = lambda: User(email="user@example.com", role=role)
+
+
+@pytest.mark.parametrize("path", ["/metrics", "/metrics/slow-queries"])
+def test_metrics_require_authentication(client, path):
+    assert client.get(path).status_code == 401
+
+
+@pytest.mark.parametrize("path", ["/metrics", "/metrics/slow-queries"])
+def test_metrics_are_forbidden_to_non_admins(client, path):
+    login_as(UserRole.CLIENT)
+
+    assert client.get(path).status_code == 403
+
+
+def test_metrics_are_served_to_admins(client):
+    login_as(UserRole.ACCOUNT_MANAGER)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["neptune"] == {"queries": 0}
+    assert client.get("/metrics/slow-queries").json() == []
+
+
+def test_metrics_are_not_in_the_public_schema(client):
+    assert not any(path.startswith("/metrics") for path in client.get("/openapi.json").json()["paths"])
@@ -0,0 +1,121 @@
+# tests/test_multi_search.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from fastapi import HTTPException
+
+from app.core.utils.meili import MeiliClient
+from app.modules.search import services as search_services
+from app.modules.search.search_cache import search_result_cache
+from app.modules.tenders import routes as tender_routes
+from app.modules.tenders import schemas
+
+
+def hit(tender_id):
+    return {
+        "id": tender_id, "exp": f"EXP-{tender_id}", "title": "t", "description": "d",
+        "submission_date": 1704067200, "updated": None, "lotes": 1, "contracting_body": "org",
+        "budget_amount": 1000.0, "location": "Madrid", "contract_type": "works", "cps": ["45"],
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(search_result_cache, "enabled", True)
+    search_result_cache.clear()
+    yield
+    search_result_cache.clear()
+
+
+@pytest.fixture
+def meili():
+    client = MagicMock()
+    client.multi_search_async = AsyncMock(return_value=[
+        {"hits": [hit("a"), hit("b")], "estimatedTotalHits": 2},
+        {"hits": [hit("b"), hit("c")], "estimatedTotalHits": 7},
+    ])
+    with patch.object(search_services, "get_meili_client", return_value=client):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_multi_search_body():
+    with patch("app.core.utils.meili.meilisearch.Client"):
+        client = MeiliClient("tenders", host="http://meili:7700", api_key="key")
+    client._post_json_async = AsyncMock(return_value={"results": [{"hits": []}, {"hits": []}]})
+
+    results = await client.multi_search_async([
+        {"query": "obras", "offset": 0, "limit": 5},
+        {"query": "", "offset": 0, "limit": 5, "filter": 'status = "open"', "sort": ["submission_date:asc"]},
+    ])
+
+    path, body = client._post_json_async.await_args.args
+    assert path == "multi-search"
+    assert body["queries"][0] == {"indexUid": "tenders", "q": "obras", "offset": 0, "limit": 5}
+    assert body["queries"][1]["filter"] == 'status = "open"'
+    assert results == [{"hits": []}, {"hits": []}]
+
+
+@pytest.mark.asyncio
+async def test_searches_share_one_request_and_the_cache(meili):
+    searches = {
+        "closing_soon": {"params": {"offset": 0, "limit": 2, "sort_field": "submission_date", "sort_direction": "asc"}},
+        "my_cpvs": {"params": {"offset": 0, "limit": 2}, "body_filters": [{"name": "cpv", "value": ["45000000"]}]},
+    }
+
+    results = await search_services.do_multi_search("tenders", searches)
+
+    meili.multi_search_async.assert_awaited_once()
+    sent = meili.multi_search_async.await_args.args[0]
+    assert sent[0]["sort"] == ["submission_date:asc"]
+    assert sent[1]["filter"] == 'cpv IN ["45000000"]'
+    assert list(results) == ["closing_soon", "my_cpvs"]
+    assert results["my_cpvs"]["total"] == 7
+    assert results["my_cpvs"]["has_next"]
+
+    # Both are cached now: nothing is sent, an empty saved search never is
+    searches["saved"] = {"params": {}, "saved_tender_uris": []}
+    again = await search_services.do_multi_search("tenders", searches)
+    meili.multi_search_async.assert_awaited_once()
+    assert again["closing_soon"] == results["closing_soon"]
+    assert again["saved"]["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_route_reads_statuses_with_one_query(meili):
+    request = schemas.MultiSearchRequest(searches={
+        "closing_soon": {"limit": 2},
+        "saved": {"limit": 2, "is_saved": True},
+    })
+    with patch.object(tender_routes.services, "get_user_saved_tenders_uris", return_value=["b", "c"]) as saved, \
+            patch.object(tender_routes.services, "get_tender_statuses", return_value={"b": "processed"}) as statuses:
+        response = await tender_routes.multi_search_tenders(request, db=MagicMock(), current_user=MagicMock(id="u1"))
+
+    saved.assert_called_once()
+    statuses.assert_called_once()
+    assert statuses.call_args.args[1] == ["a", "b", "c"]
+    assert meili.multi_search_async.await_args.args[0][1]["filter"] == 'id IN ["b", "c"]'
+    items = response["results"]["saved"]["items"]
+    assert [item["tender_hash"] for item in items] == ["b", "c"]
+    assert items[0]["status"] == "processed"
+    assert items[1]["status"] is None
+
+
+@pytest.mark.asyncio
+async def test_route_rejects_invalid_filters_and_too_many_searches(meili):
+    request = schemas.MultiSearchRequest(searches={"bad": {"filters": [{"name": "budget_min", "value": "x"}]}})
+    with pytest.raises(HTTPException) as exc_info:
+        await tender_routes.multi_search_tenders(request, db=MagicMock(), current_user=MagicMock())
+    assert exc_info.value.status_code == 400
+
+    request = schemas.MultiSearchRequest(searches={str(i): {} for i in range(tender_routes.settings.MULTI_SEARCH_MAX_QUERIES + 1)})
+    with pytest.raises(HTTPException) as exc_info:
+        await tender_routes.multi_search_tenders(request, db=MagicMock(), current_user=MagicMock())
+    assert exc_info.value.status_code == 400
+    meili.multi_search_async.assert_not_awaited()
@@ -0,0 +1,162 @@
+# tests/test_neptune_client.py
+
+import os
+import sys
+import time
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch, MagicMock
+from botocore.credentials import Credentials
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core import database
+from app.core.neptune import NeptuneClient
+
+
+@pytest.fixture
+def client():
+    """Neptune client signing with static credentials"""
+    session = MagicMock()
+    session.get_credentials.return_value = Credentials("AKIDEXAMPLE", "secret")
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        return NeptuneClient(endpoint="writer", port=8182, region="eu-west-3", signature_ttl=60)
+
+
+@pytest.fixture
+def signing_clock(clock):
+    """The fake clock, as seen by the signed-header cache"""
+    with patch("app.core.neptune.time", clock):
+        yield clock
+
+
+def test_session_is_opened_once_and_reused(client):
+    async def scenario():
+        await client.start()
+        session = client._http_session
+        await client.start()
+        assert client._http_session is session
+        assert await client._get_http_session() is session
+        assert not session.closed
+        await client.close()
+        return session
+
+    session = asyncio.run(scenario())
+
+    assert session.closed
+    assert client._http_session is None
+
+
+def test_closed_session_is_reopened_on_next_use(client):
+    async def scenario():
+        await client.start()
+        first = client._http_session
+        await client.close()
+        second = await client._get_http_session()
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+def test_close_without_start_is_a_no_op(client):
+    asyncio.run(client.close())
+
+    assert client._http_session is None
+
+
+def test_signed_headers_are_reused_within_the_signature_ttl(client, signing_clock):
+    with patch.object(client, "_create_signed_request", wraps=client._create_signed_request) as sign:
+        first = client._get_signed_headers("POST", "sparql")
+        signing_clock.now += 59
+        second = client._get_signed_headers("POST", "sparql")
+
+    assert second is first
+    assert sign.call_count == 1
+    assert "Authorization" in first
+    assert not any(name.lower() == "content-length" for name in first)
+
+
+def test_signed_headers_are_signed_again_after_the_signature_ttl(client, signing_clock):
+    with patch.object(client, "_create_signed_request", wraps=client._create_signed_request) as sign:
+        first = client._get_signed_headers("POST", "sparql")
+        signing_clock.now += 61
+        second = client._get_signed_headers("POST", "sparql")
+
+    assert second is not first
+    assert sign.call_count == 2
+
+
+def test_signed_headers_are_cached_per_path_and_replica(client, signing_clock):
+    with patch.object(client, "_create_signed_request", wraps=client._create_signed_request) as sign:
+        client._get_signed_headers("POST", "sparql")
+        client._get_signed_headers("POST", "sparql", base_url="https://reader:8182")
+        client._get_signed_headers("GET", "status")
+
+    assert sign.call_count == 3
+
+
+def test_rotated_credentials_clear_the_signed_headers(client, signing_clock):
+    first = client._get_signed_headers("POST", "sparql")
+    signer = client._signer
+
+    client.credentials = Credentials("AKIDROTATED", "new-secret")
+    client._refresh_credentials()
+
+    assert client._signer is not signer
+    assert client._signed_headers_cache == {}
+    second = client._get_signed_headers("POST", "sparql")
+    assert "AKIDROTATED" in second["Authorization"]
+    assert "AKIDEXAMPLE" in first["Authorization"]
+
+
+def test_unchanged_credentials_keep_the_signed_headers(client, signing_clock):
+    client._get_signed_headers("POST", "sparql")
+    signer = client._signer
+
+    client._refresh_credentials()
+
+    assert client._signer is signer
+    assert len(client._signed_headers_cache) == 1
+
+
+def test_get_neptune_client_builds_one_client_under_concurrency(monkeypatch):
+    monkeypatch.setattr(database, "_neptune_client", None)
+    monkeypatch.setattr(database.settings, "NEPTUNE_BACKEND", "neptune")
+
+    def slow_client(**kwargs):
+        # Widen the window in which a racing thread could build a second client
+        time.sleep(0.05)
+        return MagicMock()
+
+    clients = []
+    with patch.object(database, "NeptuneClient", side_effect=slow_client) as constructor:
+        threads = [threading.Thread(target=lambda: clients.append(database.get_neptune_client())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert constructor.call_count == 1
+    assert len(clients) == 8
+    assert all(client is clients[0] for client in clients)
+
+
+def test_close_neptune_client_resets_the_singleton(monkeypatch):
+    closed = []
+
+    class FakeClient:
+        async def close(self):
+            closed.append(True)
+
+    monkeypatch.setattr(database, "_neptune_client", FakeClient())
+
+    asyncio.run(database.close_neptune_client())
+
+    assert closed == [True]
+    assert database._neptune_client is None
@@ -0,0 +1,136 @@
+# tests/test_neptune_replicas.py
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.config import Settings
+from app.core.neptune import NeptuneClient
+from app.core.utils.replicas import HedgeBudget, ReplicaPool
+
+SLOW = "https://reader-slow:8182"
+FAST = "https://reader-fast:8182"
+
+
+def test_pool_prefers_the_replica_with_lower_latency():
+    pool = ReplicaPool([SLOW, FAST])
+    slow, fast = pool.replicas
+    pool.release(pool.acquire(exclude=fast), 2.0)
+    pool.release(pool.acquire(exclude=slow), 0.01)
+
+    picks = []
+    for _ in range(20):
+        replica = pool.acquire()
+        picks.append(replica.url)
+        pool.release(replica, 0.01 if replica is fast else 2.0)
+
+    assert set(picks) == {FAST}
+
+
+def test_failing_replica_is_skipped_until_cooldown_ends(clock):
+    pool = ReplicaPool([SLOW, FAST], failure_threshold=2, cooldown=30, timer=clock)
+    slow = pool.replicas[0]
+    for _ in range(2):
+        pool.release(pool.acquire(exclude=pool.replicas[1]), failed=True)
+
+    assert not pool.stats()[SLOW]["healthy"]
+    assert all(pool.acquire().url == FAST for _ in range(10))
+
+    clock.now += 31
+    assert pool.stats()[SLOW]["healthy"]
+    assert pool.acquire(exclude=pool.replicas[1]) is slow
+
+
+def test_hedge_budget_caps_the_hedge_rate():
+    budget = HedgeBudget(max_rate=0.1)
+    hedges = 0
+    for _ in range(100):
+        budget.record_request()
+        hedges += budget.try_spend()
+
+    assert hedges == 10
+    assert budget.stats()["rate"] == 0.1
+
+
+@pytest.fixture
+def replicated_client():
+    """Neptune client with two readers whose requests take the delay given per replica URL"""
+    session = MagicMock()
+    session.get_credentials.return_value = None
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        client = NeptuneClient(
+            endpoint="writer", port=8182, region="eu-west-3",
+            reader_endpoints=["reader-slow", "reader-fast:8182"],
+            hedge_max_rate=1.0, hedge_min_delay=0.01, hedge_min_samples=5
+        )
+    client.delays = {SLOW: 1.0, FAST: 0.01}
+    client.calls = []
+
+    async def post_to_replica(replica, query):
+        client.calls.append(replica.url)
+        try:
+            await asyncio.sleep(client.delays[replica.url])
+        finally:
+            client.replicas.release(replica, client.delays[replica.url])
+        return f'{{"replica": "{replica.url}"}}'.encode(), {}
+
+    client._post_to_replica = post_to_replica
+    # Warm the latency histogram so the query is hedged after ~25 ms
+    for _ in range(10):
+        client.query_metrics.observe("detail", 0.02, "SELECT")
+    return client
+
+
+@pytest.mark.asyncio
+async def test_straggler_is_hedged_to_another_replica(replicated_client):
+    # Force the first pick onto the slow replica
+    replicated_client.replicas.replicas[1].ewma_latency = 1.0
+    replicated_client.replicas.replicas[1].inflight = 100
+
+    started = asyncio.get_running_loop().time()
+    result = await replicated_client._post_sparql_query("SELECT", "detail")
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert result == {"replica": FAST}
+    assert replicated_client.calls == [SLOW, FAST]
+    assert elapsed < 0.5
+    assert replicated_client.hedge_budget.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queries_without_enough_samples_are_not_hedged(replicated_client):
+    replicated_client.replicas.replicas[1].ewma_latency = 1.0
+    replicated_client.replicas.replicas[1].inflight = 100
+    replicated_client.delays[SLOW] = 0.05
+
+    result = await replicated_client._post_sparql_query("SELECT", "unknown_query")
+
+    assert result == {"replica": SLOW}
+    assert replicated_client.calls == [SLOW]
+
+
+def test_signed_headers_are_cached_per_replica():
+    session = MagicMock()
+    session.get_credentials.return_value = None
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        client = NeptuneClient(endpoint="writer", port=8182, region="eu-west-3", reader_endpoints=["a", "b"])
+
+    with patch.object(client, "_create_signed_request") as sign:
+        sign.return_value.headers = {"Authorization": "sig"}
+        client._get_signed_headers("POST", "sparql", "https://a:8182")
+        client._get_signed_headers("POST", "sparql", "https://b:8182")
+        client._get_signed_headers("POST", "sparql", "https://a:8182")
+
+    assert [c.kwargs["base_url"] for c in sign.call_args_list] == ["https://a:8182", "https://b:8182"]
+    assert [r["requests"] for r in client.stats()["replicas"].values()] == [0, 0]
+
+
+def test_reader_endpoints_setting_is_a_comma_separated_list(monkeypatch):
+    monkeypatch.setenv("NEPTUNE_READER_ENDPOINTS", "reader-1:8182, reader-2,")
+
+    assert Settings().NEPTUNE_READER_ENDPOINTS == ["reader-1:8182", "reader-2"]
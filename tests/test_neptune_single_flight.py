@@ -0,0 +1,94 @@
+# tests/test_neptune_single_flight.py
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.neptune import NeptuneClient
+
+
+@pytest.fixture
+def neptune_client():
+    """Neptune client without AWS credentials (no request is ever signed)"""
+    session = MagicMock()
+    session.get_credentials.return_value = None
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        client = NeptuneClient(endpoint="neptune.local", port=8182, region="eu-west-3")
+    return client
+
+
+def fake_upstream(calls, delay=0.05, error=None):
+    async def upstream(query, query_name):
+        calls.append(query)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return {"results": {"bindings": [{"q": {"value": query}}]}}
+    return upstream
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_share_one_request(neptune_client):
+    calls = []
+    neptune_client._execute_sparql_query_upstream = fake_upstream(calls)
+
+    results = await asyncio.gather(*[
+        neptune_client.execute_sparql_query_async("SELECT * WHERE { ?s ?p ?o }") for _ in range(10)
+    ])
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = neptune_client.stats()
+    assert (stats["upstream"], stats["coalesced"], stats["inflight"]) == (1, 9, 0)
+
+
+@pytest.mark.asyncio
+async def test_whitespace_differences_are_coalesced_but_literals_are_not(neptune_client):
+    calls = []
+    neptune_client._execute_sparql_query_upstream = fake_upstream(calls)
+
+    await asyncio.gather(
+        neptune_client.execute_sparql_query_async("SELECT * WHERE { ?s ?p ?o }"),
+        neptune_client.execute_sparql_query_async("SELECT *\n  WHERE {\n    ?s ?p ?o\n  }"),
+        neptune_client.execute_sparql_query_async('SELECT * WHERE { ?s ?p "a  b" }'),
+        neptune_client.execute_sparql_query_async('SELECT * WHERE { ?s ?p "a b" }'),
+    )
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached(neptune_client):
+    calls = []
+    neptune_client._execute_sparql_query_upstream = fake_upstream(calls, error=RuntimeError("boom"))
+
+    results = await asyncio.gather(
+        neptune_client.execute_sparql_query_async("ASK { ?s ?p ?o }"),
+        neptune_client.execute_sparql_query_async("ASK { ?s ?p ?o }"),
+        return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    # Once finished, the next call goes upstream again
+    with pytest.raises(RuntimeError):
+        await neptune_client.execute_sparql_query_async("ASK { ?s ?p ?o }")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request(neptune_client):
+    calls = []
+    neptune_client._execute_sparql_query_upstream = fake_upstream(calls, delay=0.1)
+
+    first = asyncio.create_task(neptune_client.execute_sparql_query_async("SELECT ?x WHERE {}"))
+    second = asyncio.create_task(neptune_client.execute_sparql_query_async("SELECT ?x WHERE {}"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert (await second)["results"]["bindings"]
+    assert len(calls) == 1
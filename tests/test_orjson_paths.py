@@ -0,0 +1,81 @@
+# tests/test_orjson_paths.py
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import orjson
+import pytest
+from meilisearch.errors import MeilisearchApiError
+
+from app.core.neptune import NeptuneClient
+from app.core.utils import meili
+from app.core.utils.meili import MeiliClient, get_meili_client
+
+
+def _response(status_code=200, content=b""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode("utf-8")
+    response.headers = {"Content-Type": "application/json"}
+    if status_code >= 400:
+        import requests
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status_code} Error")
+    return response
+
+
+@pytest.fixture
+def meili_client():
+    with patch("app.core.utils.meili.meilisearch.Client") as client_class:
+        client = client_class.return_value
+        client.config.url = "http://meili:7700"
+        client.config.timeout = None
+        client.http.headers = {"Authorization": "Bearer key"}
+        yield MeiliClient("tenders", host="http://meili:7700", api_key="key")
+
+
+def test_meili_search_posts_orjson_body(meili_client):
+    body = orjson.dumps({"hits": [{"id": "abc"}], "estimatedTotalHits": 1})
+    with patch.object(meili_client.session, "post", return_value=_response(content=body)) as post:
+        result = meili_client.search("obras", offset=10, limit=5, filter="status = 'open'")
+
+    assert result == {"hits": [{"id": "abc"}], "estimatedTotalHits": 1}
+    url = post.call_args.args[0]
+    assert url == "http://meili:7700/indexes/tenders/search"
+    assert orjson.loads(post.call_args.kwargs["data"]) == {"q": "obras", "offset": 10, "limit": 5, "filter": "status = 'open'"}
+    assert post.call_args.kwargs["headers"]["Authorization"] == "Bearer key"
+
+
+def test_meili_search_raises_sdk_error(meili_client):
+    error_body = b'{"message": "Attribute `x` is not filterable", "code": "invalid_search_filter"}'
+    with patch.object(meili_client.session, "post", return_value=_response(400, error_body)):
+        with pytest.raises(MeilisearchApiError):
+            meili_client.search("", filter="x = 1")
+
+
+def test_meili_clients_are_shared_per_index_without_index_lookups():
+    with patch("app.core.utils.meili.meilisearch.Client") as client_class, \
+            patch.dict(meili._meili_clients, clear=True):
+        first = get_meili_client("tenders")
+        assert get_meili_client("tenders") is first
+        assert get_meili_client("cpvs") is not first
+
+    assert client_class.call_count == 2
+    client_class.return_value.get_index.assert_not_called()
+    client_class.return_value.create_index.assert_not_called()
+
+
+def test_neptune_sync_query_decodes_with_orjson():
+    client = NeptuneClient(endpoint="neptune", port=8182, region="eu-west-1")
+    bindings = {"head": {"vars": ["t"]}, "results": {"bindings": [{"t": {"type": "literal", "value": "Obras"}}]}}
+    with patch.object(client, "_get_signed_headers", return_value={}), \
+         patch("app.core.neptune.requests.post", return_value=_response(content=orjson.dumps(bindings))):
+        assert client.execute_sparql_query("SELECT ?t WHERE { ?s ?p ?t }") == bindings
+
+    with patch.object(client, "_get_signed_headers", return_value={}), \
+         patch("app.core.neptune.requests.post", return_value=_response(content=b"not json")):
+        assert client.execute_sparql_query("SELECT ?t WHERE { ?s ?p ?t }")["raw_text"] == "not json"
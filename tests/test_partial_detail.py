@@ -0,0 +1,117 @@
+# tests/test_partial_detail.py
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.config import settings
+from app.core.neptune import NeptuneClient
+from app.core.utils.concurrency import ServiceUnavailableError
+from app.modules.tenders import services
+from app.core.config import InvalidSettingError, Settings, parse_section_deadlines
+from app.modules.tenders.fieldsets import missing_fields
+from app.modules.tenders.tender_cache import get_cached_tender_detail, tender_detail_cache
+
+URI = "http://gober.ai/spain/procedure/partial-tender"
+
+CORE = {"results": {"bindings": [{
+    "procedure": {"type": "uri", "value": URI},
+    "title": {"type": "literal", "value": "Partial tender"}
+}]}}
+
+
+@pytest.fixture
+def neptune_client():
+    """Neptune client without AWS credentials whose queries take the delay given per query name"""
+    session = MagicMock()
+    session.get_credentials.return_value = None
+    with patch("app.core.neptune.boto3.Session", return_value=session):
+        client = NeptuneClient(endpoint="neptune.local", port=8182, region="eu-west-3")
+    client.delays = {}
+
+    async def upstream(query, query_name):
+        await asyncio.sleep(client.delays.get(query_name, 0))
+        return CORE if query_name == "core" else {"results": {"bindings": []}}
+
+    client._execute_sparql_query_upstream = upstream
+    return client
+
+
+@pytest.fixture
+def fanout(monkeypatch, neptune_client):
+    monkeypatch.setattr(settings, "TENDER_DETAIL_MODE", "fanout")
+    monkeypatch.setattr(settings, "TENDER_DETAIL_INLINE_ITEMS", 10)
+    monkeypatch.setattr(settings, "TENDER_DETAIL_SECTION_DEADLINES", "core=0.5,*=0.05")
+    monkeypatch.setattr(tender_detail_cache, "enabled", True)
+    tender_detail_cache.clear()
+    with patch.object(services, "get_neptune_client", return_value=neptune_client), \
+            patch.object(services, "needs_database", return_value=False):
+        yield neptune_client
+    tender_detail_cache.clear()
+
+
+def test_parse_section_deadlines():
+    assert parse_section_deadlines("core=0.3, documents=1,*=2") == {"core": 0.3, "documents": 1.0, "*": 2.0}
+    assert parse_section_deadlines("") == {}
+    for spec in ("core", "core=fast", "*=0"):
+        with pytest.raises(InvalidSettingError):
+            parse_section_deadlines(spec)
+
+
+def test_malformed_section_deadlines_fail_at_startup(monkeypatch):
+    monkeypatch.setenv("TENDER_DETAIL_SECTION_DEADLINES", "core")
+    with pytest.raises(InvalidSettingError):
+        Settings()
+
+
+def test_missing_fields_maps_queries_to_detail_fields():
+    assert missing_fields(["monetary_values"]) == ["estimated_value", "gross_value", "net_value"]
+    assert missing_fields(["documents", "lot_count"]) == ["lot_count", "procurement_documents"]
+    assert missing_fields([]) == []
+
+
+@pytest.mark.asyncio
+async def test_named_queries_missing_their_deadline_are_left_out(neptune_client):
+    neptune_client.delays = {"slow": 1.0}
+
+    results = await neptune_client.execute_named_sparql_queries_parallel(
+        [("fast", "SELECT 1"), ("slow", "SELECT 2")], deadlines={"fast": 0.5}, default_deadline=0.05
+    )
+
+    assert set(results) == {"fast"}
+    assert neptune_client.stats()["deadline_missed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_section_is_reported_as_partial_and_not_cached(fanout):
+    fanout.delays = {"lots": 1.0}
+
+    started = asyncio.get_running_loop().time()
+    detail, missing = await services.get_partial_tender_detail(URI)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert detail.title == "Partial tender"
+    assert missing == ["lots"]
+    assert elapsed < 0.5
+    assert get_cached_tender_detail(URI) is None
+
+
+@pytest.mark.asyncio
+async def test_complete_detail_is_cached(fanout):
+    detail, missing = await services.get_partial_tender_detail(URI)
+
+    assert missing == []
+    assert get_cached_tender_detail(URI) is not None
+
+
+@pytest.mark.asyncio
+async def test_core_missing_its_deadline_is_service_unavailable(fanout):
+    fanout.delays = {"core": 1.0}
+
+    with pytest.raises(ServiceUnavailableError):
+        await services.get_partial_tender_detail(URI)
@@ -0,0 +1,61 @@
+# tests/test_query_metrics.py
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.utils.query_metrics import LatencyHistogram, QueryMetrics
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    histogram = LatencyHistogram(buckets_ms=(10, 100, 1000))
+    for duration in [5] * 90 + [50] * 9 + [5000]:
+        histogram.observe(duration)
+
+    assert histogram.percentile(0.50) == 10.0
+    assert histogram.percentile(0.95) == 100.0
+    # Above the last bucket the recorded maximum is reported
+    assert histogram.percentile(1.0) == 5000.0
+    assert histogram.snapshot()["buckets"] == {"le_10": 90, "le_100": 9, "le_1000": 0, "inf": 1}
+
+
+def test_only_queries_above_threshold_are_logged_as_slow():
+    metrics = QueryMetrics(slow_query_threshold=1.0)
+
+    assert metrics.observe("tender_listing", 0.2, "SELECT fast", response_size=10) is False
+    assert metrics.observe("tender_listing", 1.5, "SELECT slow", response_size=2048) is True
+
+    slow = metrics.slow_queries()
+    assert len(slow) == 1
+    assert slow[0]["query"] == "SELECT slow"
+    assert slow[0]["response_bytes"] == 2048
+    assert metrics.stats()["tender_listing"]["count"] == 2
+
+
+def test_zero_threshold_disables_slow_log():
+    metrics = QueryMetrics(slow_query_threshold=0)
+
+    assert metrics.observe("tender_count", 30.0, "SELECT COUNT") is False
+    assert metrics.slow_queries() == []
+
+
+def test_attach_explain_updates_latest_matching_entry():
+    metrics = QueryMetrics(slow_query_threshold=0.5)
+    metrics.observe("tender_documents", 0.6, "SELECT a")
+    metrics.observe("tender_documents", 0.7, "SELECT a")
+
+    metrics.attach_explain("tender_documents", "SELECT a", "#### Optimized plan")
+
+    newest, oldest = metrics.slow_queries()
+    assert newest["explain"] == "#### Optimized plan"
+    assert oldest["explain"] is None
+
+
+def test_stats_sorted_by_p95():
+    metrics = QueryMetrics(slow_query_threshold=0)
+    metrics.observe("fast", 0.001, "q")
+    metrics.observe("slow", 0.8, "q")
+
+    assert list(metrics.stats()) == ["slow", "fast"]
@@ -0,0 +1,102 @@
+# tests/test_result_cache.py
+
+import os
+import sys
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.core.utils.cache import ResultCache, CacheBackend, get_cache_stats
+
+
+class DictBackend(CacheBackend):
+    """In-memory stand-in for a shared backend"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl):
+        self.store[key] = value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+def test_hit_and_miss_counters(clock):
+    cache = ResultCache(name="test_counters", maxsize=10, ttl=60, timer=clock)
+
+    assert cache.get("a") is None
+    cache.set("a", {"value": 1})
+    assert cache.get("a") == {"value": 1}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert "test_counters" in get_cache_stats()
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResultCache(name="test_ttl", maxsize=10, ttl=60, timer=clock)
+    cache.set("a", "value")
+
+    clock.now += 59
+    assert cache.get("a") == "value"
+
+    clock.now += 2
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResultCache(name="test_lru", maxsize=2, ttl=60, timer=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_removes_local_and_backend_entries(clock):
+    backend = DictBackend()
+    cache = ResultCache(
+        name="test_invalidate", maxsize=10, ttl=60, backend=backend,
+        serializer=lambda v: v.encode("utf-8"), deserializer=lambda b: b.decode("utf-8"),
+        timer=clock
+    )
+    cache.set("a", "value")
+    assert backend.store == {"test_invalidate:a": b"value"}
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert backend.store == {}
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_local_miss_falls_back_to_backend(clock):
+    backend = DictBackend()
+    backend.store["test_backend:a"] = b"shared"
+    cache = ResultCache(
+        name="test_backend", maxsize=10, ttl=60, backend=backend,
+        serializer=lambda v: v.encode("utf-8"), deserializer=lambda b: b.decode("utf-8"),
+        timer=clock
+    )
+
+    assert cache.get("a") == "shared"
+    assert cache.stats()["backend_hits"] == 1
+    # Second lookup is served from memory
+    backend.store.clear()
+    assert cache.get("a") == "shared"
+
+
+def test_disabled_cache_never_stores(clock):
+    cache = ResultCache(name="test_disabled", maxsize=10, ttl=60, enabled=False, timer=clock)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
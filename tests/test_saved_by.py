@@ -0,0 +1,86 @@
+# tests/test_saved_by.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.search import routes as search_routes
+from app.modules.search import services as search_services
+from app.modules.search.search_cache import search_result_cache
+from app.modules.tenders import saved_index
+
+
+def test_get_saved_by_groups_users_per_tender():
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = [("t1", "u2"), ("t1", "u1"), ("t2", "u1")]
+
+    assert saved_index.get_saved_by(db, ["t1", "t2", "t3"]) == {"t1": ["u1", "u2"], "t2": ["u1"], "t3": []}
+
+
+def test_get_saved_by_chunks_the_in_query(monkeypatch):
+    monkeypatch.setattr(saved_index, "SAVED_BY_QUERY_CHUNK", 2)
+    db = MagicMock()
+    db.execute.return_value.fetchall.return_value = []
+
+    saved_index.get_saved_by(db, ["t1", "t2", "t3"])
+
+    assert db.execute.call_count == 2
+
+
+def test_sync_writes_the_users_read_back_from_the_database():
+    client = MagicMock()
+    client.document_exists.return_value = True
+    with patch.object(saved_index, "get_meili_client", return_value=client), \
+            patch.object(saved_index, "get_saved_by", return_value={"t1": ["u1", "u2"]}):
+        saved_index.sync_saved_by(MagicMock(), "t1")
+
+    client.update_documents.assert_called_once_with([{"id": "t1", "saved_by": ["u1", "u2"]}])
+
+
+def test_sync_skips_tenders_that_are_not_indexed():
+    client = MagicMock()
+    client.document_exists.return_value = False
+    with patch.object(saved_index, "get_meili_client", return_value=client):
+        saved_index.sync_saved_by(MagicMock(), "t1")
+
+    client.update_documents.assert_not_called()
+
+
+def test_sync_failure_does_not_fail_the_save():
+    client = MagicMock()
+    client.document_exists.side_effect = RuntimeError("meili down")
+    with patch.object(saved_index, "get_meili_client", return_value=client):
+        saved_index.sync_saved_by(MagicMock(), "t1")
+
+
+def test_ingestion_preserves_saved_by_without_the_database():
+    client = MagicMock()
+    documents = [{"id": "t1", "title": "a", "saved_by": ["forged"]}, {"id": "t2", "title": "b"}]
+    with patch.object(search_routes, "get_meili_client", return_value=client), \
+            patch.object(search_routes, "invalidate_search_results"), \
+            patch.object(search_routes.tender_count_cache, "mark_stale"), \
+            patch.object(saved_index, "get_saved_by", side_effect=AssertionError("no SQL during ingestion")):
+        search_routes.tenders_create({"documents": documents})
+
+    # Partial updates keep the saved_by already indexed; the field is never sent by ingestion
+    client.add_documents.assert_not_called()
+    client.update_documents.assert_called_once_with([{"id": "t1", "title": "a"}, {"id": "t2", "title": "b"}])
+
+
+@pytest.mark.asyncio
+async def test_saved_search_filters_on_the_user_id():
+    search_result_cache.clear()
+    client = MagicMock()
+    client.search_async = AsyncMock(return_value={"hits": [], "estimatedTotalHits": 0})
+
+    with patch.object(search_services, "get_meili_client", return_value=client):
+        await search_services.do_search(
+            "tenders", {"offset": 0, "limit": 10}, [{"name": "status", "value": "open"}], saved_by="u1"
+        )
+
+    assert client.search_async.await_args.kwargs["filter"] == 'status = "open" AND saved_by = "u1"'
+    assert search_result_cache.stats()["size"] == 0
@@ -0,0 +1,89 @@
+# tests/test_search_cache.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.search import routes as search_routes
+from app.modules.search import services as search_services
+from app.modules.search.search_cache import search_cache_key, search_result_cache
+
+LANDING = {"offset": 0, "limit": 10, "sort_field": "submission_date", "sort_direction": "desc"}
+FILTERS = [
+    {"name": "status", "value": "open"},
+    {"name": "cpv", "value": ["45000000", "09000000"], "operator": "IN"},
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(search_result_cache, "enabled", True)
+    search_result_cache.clear()
+    yield
+    search_result_cache.clear()
+
+
+@pytest.fixture
+def meili():
+    client = MagicMock()
+    client.search_async = AsyncMock(return_value={"hits": [{"id": "abc"}], "estimatedTotalHits": 1})
+    with patch.object(search_services, "get_meili_client", return_value=client), \
+            patch.object(search_routes, "get_meili_client", return_value=client):
+        yield client
+
+
+def test_cache_key_is_canonical():
+    filter_string = 'status = "open"'
+    assert search_cache_key("tenders", {**LANDING, "match": "  Obras   Públicas "}, filter_string) == search_cache_key(
+        "tenders", {**LANDING, "match": "obras públicas", "limit": "10"}, filter_string
+    )
+    assert search_cache_key("tenders", LANDING) != search_cache_key("tenders", {**LANDING, "offset": 10})
+    assert search_cache_key("tenders", LANDING) != search_cache_key("tenders", LANDING, filter_string)
+    assert search_cache_key("tenders", LANDING) != search_cache_key("cpvs", LANDING)
+    with pytest.raises(ValueError):
+        search_cache_key("tenders", {"offset": "first"})
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_memory(meili):
+    first = await search_services.do_search("tenders", dict(LANDING), FILTERS)
+    second = await search_services.do_search("tenders", dict(LANDING), list(reversed(FILTERS)))
+
+    assert second == first
+    meili.search_async.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_saved_tender_searches_are_not_cached(meili):
+    await search_services.do_search("tenders", dict(LANDING), saved_tender_uris=["abc"])
+    await search_services.do_search("tenders", dict(LANDING), saved_tender_uris=["abc"])
+
+    assert meili.search_async.await_count == 2
+    assert search_result_cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(meili):
+    meili.search_async.side_effect = RuntimeError("boom")
+    result = await search_services.do_search("tenders", dict(LANDING))
+
+    assert result["error"]
+    assert search_result_cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingestion_and_deletion_invalidate_the_cache(meili):
+    await search_services.do_search("tenders", dict(LANDING))
+    assert search_result_cache.stats()["size"] == 1
+
+    search_routes.tenders_create({"documents": [{"id": "def"}]})
+    assert search_result_cache.stats()["size"] == 0
+
+    await search_services.do_search("tenders", dict(LANDING))
+    search_routes.tenders_delete({"ids": ["abc"]})
+    assert search_result_cache.stats()["size"] == 0
+    assert meili.search_async.await_count == 2
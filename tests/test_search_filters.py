@@ -0,0 +1,93 @@
+# tests/test_search_filters.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.search import services as search_services
+from app.modules.search.filters import (
+    InvalidFilterError, compile_filter, compile_filter_list, parse_search_filters
+)
+
+
+def test_status_filters_are_grouped_with_or():
+    search_filter = parse_search_filters([
+        {"name": "status", "value": "open"},
+        {"name": "budget_min", "value": "1000"},
+        {"name": "status", "value": "closed"},
+    ])
+
+    assert compile_filter(search_filter) == 'budget_amount >= 1000.0 AND (status = "closed" OR status = "open")'
+
+
+def test_cpv_codes_are_quoted_once():
+    search_filter = parse_search_filters([{"name": "cpv", "value": ["45000000", "09000000"]}])
+
+    assert compile_filter(search_filter) == 'cpv IN ["09000000", "45000000"]'
+
+
+def test_ranges_saved_ids_and_escaping():
+    search_filter = parse_search_filters([
+        {"name": "submission_date_from", "value": "2024-01-01T00:00:00Z"},
+        {"name": "submission_date_to", "value": "2024-01-31T00:00:00Z"},
+        {"name": "location", "value": 'Sant "Cugat"'},
+        {"name": "category", "value": "45"},
+    ], saved_ids=["b", "a"])
+
+    assert compile_filter(search_filter) == (
+        'submission_date >= 1704067200 AND submission_date <= 1706659200 AND '
+        'cps IN ["45"] AND location = "Sant \\"Cugat\\"" AND id IN ["a", "b"]'
+    )
+
+
+def test_equivalent_filters_compile_once():
+    filters = [{"name": "status", "value": "open"}, {"name": "cpv", "value": ["2", "1"]}]
+    reordered = [{"name": "cpv", "value": ["1", "2", "1"]}, {"name": "status", "value": "open"}]
+    compile_filter.cache_clear()
+
+    assert parse_search_filters(filters) == parse_search_filters(reordered)
+    compile_filter(parse_search_filters(filters))
+    compile_filter(parse_search_filters(reordered))
+    assert compile_filter.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("filters", [
+    {"name": "status", "value": "open"},
+    [{"name": "status"}],
+    [{"name": "budget_min", "value": "cheap"}],
+    [{"name": "submission_date_from", "value": "yesterday"}],
+    [{"name": "budget_min", "value": 10}, {"name": "budget_max", "value": 5}],
+    [{"name": "status = 1 OR id", "value": "x"}],
+    [{"name": "location", "value": "x", "operator": "LIKE"}],
+    [{"name": "location", "value": "x", "operator": "IN"}],
+    [{"name": "location", "value": {"nested": True}}],
+])
+def test_invalid_filters_are_rejected(filters):
+    with pytest.raises(InvalidFilterError):
+        parse_search_filters(filters)
+
+
+def test_filter_list_keeps_expressions():
+    assert compile_filter_list([
+        {"name": "location", "value": "Madrid"},
+        {"name": "budget_amount", "value": [10, 20], "operator": "TO", "expression": "or"},
+        {"name": "contract_type", "operator": "EXISTS"},
+    ]) == 'location = "Madrid" OR budget_amount 10 TO 20 AND contract_type EXISTS'
+    with pytest.raises(InvalidFilterError):
+        compile_filter_list([{"name": "a", "value": 1}, {"name": "b", "value": 2, "expression": "XOR"}])
+
+
+@pytest.mark.asyncio
+async def test_do_search_rejects_invalid_filters_before_meilisearch():
+    client = MagicMock()
+    client.search_async = AsyncMock()
+
+    with patch.object(search_services, "get_meili_client", return_value=client):
+        with pytest.raises(InvalidFilterError):
+            await search_services.do_search("tenders", {"offset": 0}, [{"name": "budget_max", "value": "a lot"}])
+
+    client.search_async.assert_not_awaited()
@@ -0,0 +1,101 @@
+# tests/test_tender_batch.py
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.modules.tenders import routes as tender_routes
+from app.modules.tenders.schemas import TenderBatchRequest
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, TENDER_DETAIL_QUERIES
+from app.modules.tenders.tender_helpers import parse_tender_details
+
+URI_A = "http://gober.ai/spain/procedure/aaa"
+URI_B = "http://gober.ai/spain/procedure/bbb"
+
+
+def uri(value):
+    return {"type": "uri", "value": value}
+
+
+def literal(value):
+    return {"type": "literal", "value": value}
+
+
+def results(*rows):
+    return {"results": {"bindings": list(rows)}}
+
+
+def test_build_queries_uses_one_values_block_for_all_uris():
+    queries = build_tender_detail_queries([URI_A, URI_B])
+
+    assert [name for name, _ in queries] == [name for name, _ in TENDER_DETAIL_QUERIES]
+    for _, query in queries:
+        assert f"VALUES ?procedure {{ <{URI_A}> <{URI_B}> }}" in query
+
+
+def test_parse_tender_details_groups_bindings_by_procedure():
+    named_results = {
+        "core": results(
+            {"procedure": uri(URI_A), "title": literal("Tender A")},
+            {"procedure": uri(URI_B), "title": literal("Tender B")},
+        ),
+        "cpvs": results(
+            {"procedure": uri(URI_A), "cpv": literal("45000000")},
+            {"procedure": uri(URI_A), "cpv": literal("72000000")},
+            {"procedure": uri(URI_B), "cpv": literal("90000000")},
+        ),
+    }
+
+    details = parse_tender_details(named_results)
+
+    assert set(details) == {URI_A, URI_B}
+    assert details[URI_A].title == "Tender A"
+    assert details[URI_B].title == "Tender B"
+    assert len(details[URI_A].purpose.main_classifications) == 2
+    assert len(details[URI_B].purpose.main_classifications) == 1
+
+
+def test_parse_tender_details_skips_tenders_without_core_row():
+    named_results = {
+        "core": results({"procedure": uri(URI_A), "title": literal("Tender A")}),
+        "cpvs": results({"procedure": uri(URI_B), "cpv": literal("90000000")}),
+    }
+
+    assert set(parse_tender_details(named_results)) == {URI_A}
+
+
+def test_batch_request_accepts_hashes_and_iris():
+    request = TenderBatchRequest(tender_ids=["abc123", URI_A])
+
+    assert request.tender_ids == ["abc123", URI_A]
+
+
+@pytest.mark.parametrize("tender_id", [
+    "aaa> } ?s ?p ?o {",
+    "http://gober.ai/spain/procedure/aaa>",
+    "has space",
+    "ftp://gober.ai/spain/procedure/aaa",
+    "",
+])
+def test_batch_request_rejects_ids_that_would_break_the_values_block(tender_id):
+    with pytest.raises(ValidationError):
+        TenderBatchRequest(tender_ids=["abc123", tender_id])
+
+
+def test_batch_endpoint_answers_422_on_invalid_ids(monkeypatch):
+    called = []
+    monkeypatch.setattr(tender_routes.services, "get_tender_details_batch", lambda ids: called.append(ids))
+    app = FastAPI()
+    app.include_router(tender_routes.router)
+
+    response = TestClient(app).post("/details:batch", json={"tender_ids": [URI_A, "bbb> } ?s ?p ?o {"]})
+
+    assert response.status_code == 422
+    assert called == []
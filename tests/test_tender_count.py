@@ -0,0 +1,80 @@
+# tests/test_tender_count.py
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.tenders.tender_count import TenderCountCache
+
+
+def count_result(total):
+    return {"results": {"bindings": [{"total": {"value": str(total)}}]}}
+
+
+@pytest.fixture
+def neptune_client():
+    client = MagicMock()
+    client.execute_sparql_query_async = AsyncMock(side_effect=[count_result(10), count_result(12)])
+    with patch("app.modules.tenders.tender_count.get_neptune_client", return_value=client):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_value_is_computed_in_background(neptune_client):
+    cache = TenderCountCache(refresh_interval=60, debounce=0)
+    assert cache.get() is None
+
+    await cache.start()
+    await asyncio.sleep(0.01)
+    assert cache.get() == 10
+
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_burst_of_change_signals_triggers_one_refresh(neptune_client):
+    cache = TenderCountCache(refresh_interval=60, debounce=0.05)
+    await cache.start()
+    await asyncio.sleep(0.01)
+
+    for _ in range(5):
+        cache.mark_stale()
+    await asyncio.sleep(0.2)
+
+    assert cache.get() == 12
+    assert neptune_client.execute_sparql_query_async.await_count == 2
+    await cache.close()
+
+
+def listing_row(n):
+    return {
+        "procedure": {"type": "uri", "value": f"http://gober.ai/spain/procedure/p{n}"},
+        "title": {"type": "literal", "value": f"Tender {n}"},
+        "submissionDate": {"type": "literal", "value": f"2024-01-0{n}"},
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("known_total, expected_total", [(None, None), (42, 42)])
+async def test_listing_total_is_unknown_until_the_count_is_computed(known_total, expected_total):
+    from app.modules.tenders import services
+
+    listing_client = MagicMock()
+    # size + 1 rows: there is a next page
+    listing_client.execute_sparql_query_async = AsyncMock(return_value={"results": {"bindings": [listing_row(2), listing_row(1)]}})
+    cache = TenderCountCache()
+    cache._value = known_total
+
+    with patch.object(services, "get_neptune_client", return_value=listing_client), \
+            patch.object(services, "tender_count_cache", cache):
+        page = await services.get_tenders_paginated(size=1)
+
+    # A cold count is reported as unknown, never as 0 next to has_next
+    assert page.total == expected_total
+    assert page.has_next
+    assert len(page.items) == 1
@@ -0,0 +1,116 @@
+# tests/test_tender_facets.py
+
+import os
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from fastapi import HTTPException
+
+from app.modules.search import services as search_services
+from app.modules.search.search_cache import facet_cache, invalidate_search_results
+from app.modules.tenders import routes as tender_routes
+
+MEILI_RESULT = {
+    "hits": [],
+    "estimatedTotalHits": 42,
+    "facetDistribution": {
+        "cps": {"45000000": 30, "09000000": 12},
+        "location": {"Madrid": 40, "Sevilla": 2},
+        "contract_type": {"works": 42},
+        "status": {"open": 42},
+        "budget_amount": {"1000": 1},
+    },
+    "facetStats": {
+        "budget_amount": {"min": 1000.0, "max": 250000.0},
+        "submission_date": {"min": 1704067200, "max": 1706659200},
+    },
+}
+
+
+class FakeRequest:
+    def __init__(self, body=None):
+        self.body = body
+
+    async def json(self):
+        if self.body is None:
+            raise ValueError("no body")
+        return self.body
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(facet_cache, "enabled", True)
+    facet_cache.clear()
+    yield
+    facet_cache.clear()
+
+
+@pytest.fixture
+def meili():
+    client = MagicMock()
+    client.search_async = AsyncMock(return_value=MEILI_RESULT)
+    with patch.object(search_services, "get_meili_client", return_value=client):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_facets_are_counted_in_one_request(meili):
+    result = await search_services.get_facets("tenders", {"match": "obras"}, [{"name": "status", "value": "open"}])
+
+    kwargs = meili.search_async.await_args.kwargs
+    assert kwargs["limit"] == 0
+    assert kwargs["filter"] == 'status = "open"'
+    assert set(kwargs["facets"]) == {"cps", "location", "contract_type", "status", "budget_amount", "submission_date"}
+    assert result["total"] == 42
+    assert result["facets"]["category"] == {"45000000": 30, "09000000": 12}
+    assert "budget_amount" not in result["facets"]
+    assert result["budget"] == {"min": 1000.0, "max": 250000.0}
+
+
+@pytest.mark.asyncio
+async def test_facets_are_cached_per_normalized_query(meili):
+    await search_services.get_facets("tenders", {"match": "Obras  Públicas"})
+    await search_services.get_facets("tenders", {"match": "obras públicas"})
+    meili.search_async.assert_awaited_once()
+
+    invalidate_search_results()
+    await search_services.get_facets("tenders", {"match": "obras públicas"})
+    assert meili.search_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_saved_facets_are_not_cached(meili):
+    await search_services.get_facets("tenders", {}, saved_by="u1")
+    await search_services.get_facets("tenders", {}, saved_by="u1")
+
+    assert meili.search_async.await_count == 2
+    assert meili.search_async.await_args.kwargs["filter"] == 'saved_by = "u1"'
+
+
+@pytest.mark.asyncio
+async def test_route_formats_the_date_range(meili):
+    response = await tender_routes.get_tender_facets(
+        request=FakeRequest({"filters": [{"name": "location", "value": "Madrid"}]}),
+        is_saved=False, match=None, db=MagicMock(), current_user=MagicMock()
+    )
+
+    assert response.total == 42
+    assert response.facets["location"] == {"Madrid": 40, "Sevilla": 2}
+    assert response.submission_date.min.isoformat() == "2024-01-01T00:00:00+00:00"
+    assert response.budget.max == 250000.0
+
+
+@pytest.mark.asyncio
+async def test_route_rejects_invalid_filters(meili):
+    with pytest.raises(HTTPException) as exc_info:
+        await tender_routes.get_tender_facets(
+            request=FakeRequest({"filters": [{"name": "budget_min", "value": "cheap"}]}),
+            is_saved=False, match=None, db=MagicMock(), current_user=MagicMock()
+        )
+
+    assert exc_info.value.status_code == 400
+    meili.search_async.assert_not_awaited()
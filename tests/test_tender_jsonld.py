@@ -0,0 +1,59 @@
+# tests/test_tender_jsonld.py
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from app.modules.tenders.tender_jsonld import index_jsonld, parse_tender_from_jsonld
+
+EPO = "http://data.europa.eu/a4g/ontology#"
+DCT = "http://purl.org/dc/terms/"
+PROCEDURE = "http://gober.ai/spain/procedure/abc123"
+
+DOCUMENT = [
+    {
+        "@id": PROCEDURE,
+        "@type": [EPO + "Procedure"],
+        DCT + "title": [{"@value": "Obras de urbanización"}],
+        EPO + "hasEstimatedValue": [{"@id": PROCEDURE + "/value/estimated-overall-contract-amount"}],
+        EPO + "hasProcurementScopeDividedIntoLot": [{"@id": PROCEDURE + "/lot/1"}],
+        EPO + "hasPurpose": [{
+            "@id": PROCEDURE + "/purpose",
+            EPO + "hasMainClassification": [{"@id": "http://data.europa.eu/cpv/cpv/45000000"}]
+        }]
+    },
+    {
+        "@id": PROCEDURE + "/value/estimated-overall-contract-amount",
+        EPO + "hasAmountValue": [{"@value": "1500.50", "@type": "http://www.w3.org/2001/XMLSchema#decimal"}],
+        "http://publications.europa.eu/ontology/authority/currency": [{"@value": "EUR"}]
+    },
+    {
+        "@id": PROCEDURE + "/lot/1",
+        DCT + "title": [{"@value": "Lote 1"}]
+    }
+]
+
+
+def test_index_jsonld_handles_graph_wrapper_and_nested_nodes():
+    index = index_jsonld({"@graph": DOCUMENT})
+
+    assert index[PROCEDURE][DCT + "title"] == ["Obras de urbanización"]
+    assert index[PROCEDURE]["http://www.w3.org/1999/02/22-rdf-syntax-ns#type"] == [EPO + "Procedure"]
+    # Nested node objects are indexed under their own @id
+    assert index[PROCEDURE + "/purpose"][EPO + "hasMainClassification"] == ["http://data.europa.eu/cpv/cpv/45000000"]
+
+
+def test_parse_tender_from_jsonld_builds_tender_detail():
+    detail = parse_tender_from_jsonld(DOCUMENT, PROCEDURE)
+
+    assert detail.uri == "abc123"
+    assert detail.title == "Obras de urbanización"
+    assert detail.estimated_value.amount == 1500.5
+    assert detail.purpose.main_classifications == ["45000000"]
+    assert [lot.title for lot in detail.lots] == ["Lote 1"]
+
+
+def test_parse_tender_from_jsonld_unknown_procedure():
+    assert parse_tender_from_jsonld(DOCUMENT, "http://gober.ai/spain/procedure/missing").uri == ""
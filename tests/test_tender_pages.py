@@ -0,0 +1,124 @@
+# tests/test_tender_pages.py
+
+import asyncio
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.local_sparql import LocalSparqlBackend
+from app.core.neptune import NeptuneClient
+from app.modules.tenders import routes, services
+from app.modules.tenders.queries_tender_detail import build_tender_detail_page_queries, build_tender_detail_queries
+from app.modules.tenders.tender_helpers import map_lots
+from app.modules.tenders.tender_cache import tender_detail_cache
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+LOTS = 25
+DOCUMENTS = 4  # of each kind: 12 in total
+
+
+@pytest.fixture(scope="module")
+def client():
+    backend = LocalSparqlBackend(build_graph(tenders=2, lots=LOTS, documents=DOCUMENTS))
+    return NeptuneClient(endpoint="localhost", port=8182, region="eu-west-1", backend=backend)
+
+
+@pytest.fixture
+def neptune(client, monkeypatch):
+    monkeypatch.setattr(tender_detail_cache, "enabled", False)
+    with patch.object(services, "get_neptune_client", return_value=client):
+        yield client
+
+
+def test_lots_are_paged_in_sparql(neptune):
+    first = asyncio.run(services.get_tender_lots_page(tender_uri(0), limit=10, offset=0))
+    last = asyncio.run(services.get_tender_lots_page(tender_uri(0), limit=10, offset=20))
+
+    assert first.total == LOTS
+    assert len(first.items) == 10
+    assert len(last.items) == LOTS - 20
+    assert not {lot.id for lot in first.items} & {lot.id for lot in last.items}
+
+
+def test_documents_are_paged_in_detail_order(neptune):
+    page = asyncio.run(services.get_tender_documents_page(tender_uri(0), limit=6, offset=2))
+
+    assert page.total == 3 * DOCUMENTS
+    assert [d.document_type for d in page.items] == ["legal", "legal", "technical", "technical", "technical", "technical"]
+
+
+def test_single_item_page_is_not_dropped(neptune):
+    page = asyncio.run(services.get_tender_lots_page(tender_uri(0), limit=10, offset=LOTS - 1))
+
+    assert len(page.items) == 1
+
+
+def test_unknown_tender_page_raises_value_error(neptune):
+    with pytest.raises(ValueError):
+        asyncio.run(services.get_tender_lots_page("does-not-exist", limit=10))
+
+
+@pytest.mark.parametrize("mode", ["fanout", "construct"])
+def test_detail_inlines_first_page_and_counts(neptune, monkeypatch, mode):
+    monkeypatch.setattr(settings, "TENDER_DETAIL_MODE", mode)
+    monkeypatch.setattr(settings, "TENDER_DETAIL_INLINE_ITEMS", 5)
+
+    detail, missing = asyncio.run(services._fetch_tender_detail(neptune, tender_uri(1)))
+
+    assert missing == []
+    assert detail.title == "Synthetic tender 1"
+    assert len(detail.lots) == 5
+    assert len(detail.procurement_documents) == 5
+    assert detail.lot_count == LOTS
+    assert detail.document_count == 3 * DOCUMENTS
+
+
+def test_detail_without_inline_limit_returns_every_lot(neptune, monkeypatch):
+    monkeypatch.setattr(settings, "TENDER_DETAIL_MODE", "fanout")
+    monkeypatch.setattr(settings, "TENDER_DETAIL_INLINE_ITEMS", 0)
+
+    detail, _ = asyncio.run(services._fetch_tender_detail(neptune, tender_uri(1)))
+
+    assert len(detail.lots) == LOTS
+    assert detail.lot_count is None
+
+
+def test_page_queries_replace_full_lots_and_documents():
+    names = [name for name, _ in build_tender_detail_page_queries(tender_uri(0), 10)]
+    full_names = [name for name, _ in build_tender_detail_queries([tender_uri(0)])]
+
+    assert "legal_documents" not in names and "documents" in names
+    assert names[:7] == full_names[:7]
+    assert set(names[7:]) == {"lots", "lot_count", "documents", "document_count"}
+
+
+def test_map_lots_keeps_a_single_lot():
+    row = {"lot": {"type": "uri", "value": "http://gober.ai/lot/1"}, "lotTitle": {"type": "literal", "value": "Only lot"}}
+
+    assert [lot.id for lot in map_lots([row])] == ["1"]
+
+
+@pytest.mark.parametrize("path", [
+    "/detail/{}",
+    "/detail/{}/lots",
+    "/detail/{}/documents",
+])
+def test_tender_ids_that_would_break_the_sparql_iri_are_rejected(path):
+    neptune = MagicMock()
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    with patch.object(services, "get_neptune_client", return_value=neptune):
+        # %3E%20%7D is "> }": it would close <...> and the VALUES block
+        response = TestClient(app).get(path.format("abc%3E%20%7D%20%3Fs%20%3Fp%20%3Fo"), params={"fields": "title"})
+
+    assert response.status_code == 400
+    assert neptune.mock_calls == []
@@ -0,0 +1,75 @@
+# tests/test_trusted_models.py
+
+import json
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+import pytest
+
+from app.core.config import settings
+from app.modules.tenders.queries_tender_detail import build_tender_detail_queries, build_tender_subgraph_query
+from app.modules.tenders.schemas import Lot, MonetaryValue, TenderDetail
+from app.modules.tenders.tender_helpers import nested_model, parse_tender_detail
+from app.modules.tenders.tender_jsonld import parse_tender_from_jsonld
+from scripts.benchmarks.synthetic_tenders import build_graph, tender_uri
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    g = build_graph(tenders=1, lots=25, documents=2)
+    uri = tender_uri(0)
+    named_results = {name: g.query(query).serialize(format="json") for name, query in build_tender_detail_queries([uri])}
+    construct = g.query(build_tender_subgraph_query([uri])).graph.serialize(format="json-ld")
+    return uri, named_results, construct
+
+
+@pytest.fixture
+def trusted_mode(monkeypatch):
+    def set_mode(trusted, debug=False):
+        monkeypatch.setattr(settings, "TENDER_TRUSTED_MODELS", trusted)
+        monkeypatch.setattr(settings, "DEBUG", debug)
+    return set_mode
+
+
+def _parse_both(trusted_mode, parse):
+    trusted_mode(False)
+    validated = parse()
+    trusted_mode(True)
+    trusted = parse()
+    return validated, trusted
+
+
+def test_nested_model_defers_validation_only_in_trusted_mode(trusted_mode):
+    trusted_mode(True)
+    assert nested_model(MonetaryValue, amount=1.5, currency="EUR") == {"amount": 1.5, "currency": "EUR"}
+
+    trusted_mode(True, debug=True)
+    with pytest.raises(ValueError):
+        nested_model(MonetaryValue, amount="not a number", currency="EUR")
+
+
+def test_trusted_tree_is_validated_with_its_root(trusted_mode):
+    trusted_mode(True)
+    lot = nested_model(Lot, id="1", title="Lote 1", estimated_value=nested_model(MonetaryValue, amount="abc", currency="EUR"))
+    with pytest.raises(ValueError):
+        TenderDetail(uri="abc", title="Obras", lots=[lot])
+
+
+def test_trusted_fanout_parse_matches_validated(trusted_mode, payloads):
+    _, named_results, _ = payloads
+    validated, trusted = _parse_both(trusted_mode, lambda: parse_tender_detail({k: json.loads(v) for k, v in named_results.items()}))
+
+    assert trusted == validated
+    assert len(trusted.lots) == 25
+    assert isinstance(trusted.lots[0].estimated_value, MonetaryValue)
+
+
+def test_trusted_jsonld_parse_matches_validated(trusted_mode, payloads):
+    uri, _, construct = payloads
+    validated, trusted = _parse_both(trusted_mode, lambda: parse_tender_from_jsonld(json.loads(construct), uri))
+
+    assert trusted == validated
+    assert trusted.procurement_documents[0].document_type == "legal"
@@ -35,6 +35,7 @@ desired_filterable = sorted(list(set([
     'updated',
     'submission_date', # Used for date range filters
     'contract_type',   # If you filter by this
+    'saved_by',        # "Saved tenders only" searches (SEARCH_SAVED_BY_FILTER)
     # Add any other fields used in body_filters or direct filters
 ])))
 